@@ -6,44 +6,277 @@ import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
-import openpyxl
 import os
-from io import BytesIO
+import threading
+
+from cash_report import (
+    GRAINS,
+    INFLOW_ROWS,
+    MAX_CHART_POINTS,
+    OUTFLOW_ROWS,
+    PAGE_SIZE,
+    SUPPORTED_EXTS,
+    TRANSFER_ROWS,
+    AppendOnlyCache,
+    BalanceIndex,
+    BudgetCache,
+    DailyCube,
+    DetailPages,
+    LedgerTimeline,
+    MonthlyLedger,
+    account_summary,
+    auto_grain,
+    StatementMatrix,
+    activity_flows,
+    average_fixed_cost,
+    burn_schedule,
+    consolidate,
+    cost_breakdown,
+    depletion_month,
+    discover_workbooks,
+    entity_name,
+    extreme_indices,
+    load_workbooks,
+    lttb,
+    month_label,
+    month_labels,
+    month_range,
+    monte_carlo_bands,
+    period_transactions,
+    project_cash,
+    reconcile,
+    runway_forecast,
+    runway_months,
+    statement_row,
+    workbook_key,
+)
 
 # 페이지 설정
 st.set_page_config(page_title="자금일보", layout="wide")
 
 # 상수 설정
 DATA_FOLDER = "data"
-SUPPORTED_EXTS = [".xlsx", ".xlsm", ".xls"]
 
-# 📂 폴더 안에 있는 엑셀파일 자동 탐색
-excel_files = [
-    f for f in os.listdir(DATA_FOLDER)
-    if os.path.splitext(f)[1].lower() in SUPPORTED_EXTS
-]
+# 금액 표시 형식 (값은 숫자로 두고 표에서 천 단위 쉼표만 입힘)
+AMOUNT_FORMAT = "%,d"
+
+# 현금흐름표 Level 별 행 배경색과 표 높이 상한 (이보다 행이 많으면 표 안에서 스크롤)
+LEVEL_SHADES = {1: "background-color: #E5E5E5", 2: "background-color: rgb(235, 244, 245)"}
+STATEMENT_MAX_ROWS = 60
+STATEMENT_CSS = """
+<style>
+.statement-table { overflow: auto; border: 1px solid #ddd; }
+.statement-table table { border-collapse: collapse; width: 100%; font-size: 14px; }
+.statement-table th { position: sticky; top: 0; background-color: #f0f2f6; text-align: center; }
+.statement-table th, .statement-table td { border: 1px solid #ddd; padding: 4px 10px; white-space: nowrap; }
+</style>
+"""
+
+# 그래프 캐시 크기 추정: 배열 속성, 점 하나당 바이트, 그래프 하나의 기본 바이트 (레이아웃 등)
+FIGURE_ARRAYS = ("x", "y", "labels", "values", "text")
+FIGURE_POINT_BYTES = 32
+FIGURE_BASE_BYTES = 8 * 1024
+
+# 점마다 금액 라벨을 붙이는 최대 점 수 (넘으면 라벨 없이 마우스오버로만 표시)
+TEXT_LABEL_LIMIT = 36
+
+
+def amount_column(label, width="medium"):
+    return st.column_config.NumberColumn(label, format=AMOUNT_FORMAT, width=width)
+
+# 📂 폴더 안에 있는 엑셀파일 자동 탐색 (법인·연도별로 여러 개 가능)
+excel_paths = discover_workbooks(DATA_FOLDER, SUPPORTED_EXTS)
+excel_files = [os.path.basename(path) for path in excel_paths]
 
 # 🛑 조건 체크
 if len(excel_files) == 0:
     st.error("❌ data 폴더에 엑셀 파일이 없습니다.")
     st.stop()
-elif len(excel_files) > 1:
-    st.error("❌ data 폴더에 엑셀 파일이 2개 이상 있습니다. 1개만 넣어주세요.")
-    st.stop()
+
+
+# ✅ 워크북 캐시 (파일 경로·수정시각·내용 해시가 같으면 모든 세션이 공유)
+# 콜드 스타트 시에는 data/.cache 의 Parquet 캐시를 먼저 확인하고,
+# 다시 읽어야 하는 파일이 여러 개면 프로세스 풀에서 나눠 읽음
+# 캐시 함수 안에서 화면 요소를 그리면 캐시 적중 때 다시 그려지므로, 캐시에는 빈 자리만 두고
+# 실제 읽기는 캐시 밖에서 진행 표시 콜백과 함께 키마다 한 번만 함
+@st.cache_resource(max_entries=4)
+def workbook_slot(keys):
+    return {"lock": threading.Lock()}
+
+
+def load_workbooks_cached(keys, progress=None, file_progress=None):
+    slot = workbook_slot(keys)
+    with slot["lock"]:
+        if "consolidated" not in slot:
+            with st.spinner("📂 엑셀 파일을 읽는 중..."):
+                workbooks = load_workbooks(
+                    list(keys),
+                    progress=progress,
+                    file_progress=file_progress if len(keys) > 1 else None,
+                )
+                slot["consolidated"] = consolidate(workbooks)
+    return slot["consolidated"]
+
+
+# ✅ 선택한 법인의 원장·계좌·현금흐름표 (법인 조합별로 캐시)
+@st.cache_resource(max_entries=16)
+def select_entities(keys, entities, _consolidated):
+    return _consolidated.select(entities)
+
+
+# ✅ 현금흐름표 행렬 (행 × 월 PeriodIndex, 법인 조합별로 캐시)
+@st.cache_resource(max_entries=16)
+def statement_matrix(keys, entities, _cashflow):
+    return StatementMatrix.build(_cashflow)
+
+
+# ✅ 선택 월 구간 현금흐름표 행렬 (행렬 버전·금액 기준·선택 기간·0행 숨기기별)
+@st.cache_resource(max_entries=32)
+def statement_selection(version, entities, source, start, end, hide_zero, _full_statement):
+    return _full_statement.select(month_range(*start, *end), hide_zero)
+
+
+# ✅ 표시용 현금흐름표 HTML (Level 1·2 행 배경색·천 단위 쉼표까지 캐시 안에서 한 번만 그림)
+# Styler 를 st.dataframe 에 넘기면 다시 그릴 때마다 모든 셀을 다시 계산하므로, 완성된 HTML 만 화면에 붙임
+@st.cache_resource(max_entries=32)
+def statement_table(version, entities, source, start, end, hide_zero, _full_statement):
+    df_result = statement_selection(version, entities, source, start, end, hide_zero, _full_statement).to_frame()
+    level = df_result['Level'].to_numpy()
+    shades = np.select([level == key for key in LEVEL_SHADES], list(LEVEL_SHADES.values()), '')
+    styles = pd.DataFrame(
+        np.repeat(shades[:, None], df_result.shape[1], axis=1),
+        index=df_result.index, columns=df_result.columns
+    )
+    amounts = df_result.select_dtypes('number').columns.drop('Level')
+    table = (
+        df_result.style
+        .apply(lambda _: styles, axis=None)
+        .format(na_rep='')
+        .format('{:,.0f}', subset=amounts, na_rep='')
+        .format('{:.0f}', subset=['Level'], na_rep='')
+        .set_properties(subset=amounts, **{'text-align': 'right'})
+        .hide(axis='index')
+        .to_html()
+    )
+    height = min(len(df_result), STATEMENT_MAX_ROWS) * 35 + 38
+    return f'<div class="statement-table" style="max-height: {height}px;">{table}</div>'
+
+
+# ✅ 입금·출금 상세내역 (조회 기간·방향별 행, 검색·정렬 결과까지 캐시하고 화면에는 한 페이지만 보냄)
+@st.cache_resource(max_entries=16)
+def detail_pages(version, entities, rows_filter, start, end, _timeline):
+    rows = _timeline.query(start, end, "right", include=[rows_filter], exclude=[TRANSFER_ROWS])
+    return DetailPages.build(rows)
+
+
+@st.cache_resource(max_entries=64)
+def detail_view(version, entities, rows_filter, start, end, search, sort_by, descending, _pages):
+    return _pages.search(search).sort(sort_by, descending)
+
+
+# ✅ 그래프 캐시 (원장 버전 + 그래프 입력값별 Figure, 최근 사용 순으로 메모리 한도 안에서 유지)
+# 입력값이 같은 그래프는 다시 만들지 않고 저장된 Figure 를 그대로 표시
+@st.cache_resource
+def figure_cache():
+    return BudgetCache(figure_nbytes)
+
+
+def figure_nbytes(fig):
+    # 그래프 크기 추정 (직렬화 없이 trace 별 배열 길이 합 × 점당 바이트)
+    points = sum(
+        np.size(value)
+        for trace in fig.data
+        for value in (getattr(trace, name, None) for name in FIGURE_ARRAYS)
+        if value is not None
+    )
+    return FIGURE_BASE_BYTES + points * FIGURE_POINT_BYTES
+
+
+# ✅ 원장 월별 합계 (CODE × 월, 행이 추가되면 해당 월만 다시 더함)
+@st.cache_resource
+def monthly_ledger_cache():
+    return AppendOnlyCache(MonthlyLedger.build)
+
+
+# ✅ 잔액 인덱스 (원장 버전별, 행만 추가된 버전은 이전 인덱스에 이어서 갱신)
+@st.cache_resource
+def balance_index_cache():
+    return AppendOnlyCache(BalanceIndex.build)
+
+
+# ✅ 일 단위 집계 큐브 (일자 × 계좌 × 대분류 × 중분류 × 입출금 방향)
+@st.cache_resource
+def daily_cube_cache():
+    return AppendOnlyCache(DailyCube.build)
+
+
+# ✅ 지출일 순 정렬 원장 (기간 조회는 이진 탐색으로 구간만 잘라냄)
+@st.cache_resource
+def timeline_cache():
+    return AppendOnlyCache(LedgerTimeline.build)
+
+
+# ✅ 자금일보 시트 ↔ 원장 대사 (원장 버전·법인 조합별로 캐시)
+@st.cache_resource(max_entries=16)
+def reconciliation(version, entities, _daily, _accounts, _workbooks, _balances, _cube):
+    return reconcile(_daily, _accounts, _workbooks, _balances, _cube)
+
 
 # ✅ 파일 자동 로드
-default_path = os.path.join(DATA_FOLDER, excel_files[0])
-with open(default_path, "rb") as f:
-    uploaded_file = BytesIO(f.read())
+workbook_keys = tuple(workbook_key(path) for path in excel_paths)
 
-st.success(f"📄 자동 로드된 파일: `{excel_files[0]}`")
+# 읽는 동안 처리 속도 표시 (캐시 함수 밖에 자리를 만들어 두고, 다 읽으면 지움)
+load_status = st.empty()
+
+
+def show_load_progress(rows, total_rows, elapsed):
+    rate = rows / elapsed if elapsed > 0 else 0
+    total_text = f" / 약 {total_rows:,}행" if total_rows else ""
+    load_status.info(f"⏳ Daily 시트 읽는 중: {rows:,}행{total_text} ({rate:,.0f}행/초)")
+
+
+def show_file_progress(done, total, elapsed):
+    load_status.info(f"⏳ 워크북 읽는 중: {done}/{total}개 파일 ({elapsed:,.1f}초)")
+
+
+consolidated = load_workbooks_cached(workbook_keys, show_load_progress, show_file_progress)
+load_status.empty()
+
+st.success("📄 자동 로드된 파일: " + ", ".join(f"`{name}`" for name in excel_files))
+
+# 🏢 법인 선택 (여러 법인의 워크북이 있을 때만 표시)
+entities = consolidated.entities
+if len(entities) > 1:
+    selected_entities = st.multiselect("법인 선택", entities, default=entities)
+    if not selected_entities:
+        st.warning("법인을 1개 이상 선택해주세요.")
+        st.stop()
+else:
+    selected_entities = entities
+
+selection = tuple(sorted(selected_entities))
+df_daily, account_info, df_cashflow, skipped_cashflow, appended_rows = select_entities(
+    workbook_keys, selection, consolidated
+)
+balances = balance_index_cache().get(
+    (consolidated.version, selection),
+    df_daily,
+    parent=(consolidated.parent_version, selection),
+    new_rows=appended_rows,
+)
+cube = daily_cube_cache().get(
+    (consolidated.version, selection),
+    df_daily,
+    parent=(consolidated.parent_version, selection),
+    new_rows=appended_rows,
+)
+timeline = timeline_cache().get(
+    (consolidated.version, selection),
+    df_daily,
+    parent=(consolidated.parent_version, selection),
+    new_rows=appended_rows,
+)
 
-# ✅ Daily 시트 로드 및 처리
-    
-    # Daily 시트 로드
-df_daily = pd.read_excel(uploaded_file, sheet_name="Daily")
-df_daily['지출일'] = pd.to_datetime(df_daily['지출일'])
-    
 # 탭 생성
 tab1, tab2 = st.tabs(["💰 자금일보", "💸 현금흐름표"])
 
@@ -59,27 +292,19 @@ with tab1:
         end_datetime = pd.to_datetime(end_date)
         end_datetime = end_datetime + offsets.Day(1) - offsets.Second(1)
 
+    # 그래프 캐시 키 (원장 버전·법인 선택·조회 기간)
+    chart_key = (consolidated.version, selection, start_datetime, end_datetime)
+
     # 1. 기준기간 주요 현황
     st.header("1. 기준기간 주요 현황")
     
-    # 기말잔액 계산
-    final_balance = df_daily[df_daily['지출일'] <= end_datetime]['집행 금액'].sum()
-    
-    # 입금액 계산 ("계좌 대체" 제외)
-    total_deposit = df_daily[
-        (df_daily['지출일'] >= start_datetime) & 
-        (df_daily['지출일'] <= end_datetime) &
-        (df_daily['입금'].notna()) &
-        (df_daily['현금흐름 대분류'] != "계좌 대체")  # 계좌 대체 제외
-    ]['입금'].sum()
+    # 기말잔액 계산 (잔액 인덱스 조회)
+    final_balance = balances.balance_at(end_datetime)
     
-    # 출금액 계산 ("계좌 대체" 제외)
-    total_withdrawal = -1 * df_daily[
-        (df_daily['지출일'] >= start_datetime) & 
-        (df_daily['지출일'] <= end_datetime) &
-        (df_daily['출금'].notna()) &
-        (df_daily['현금흐름 대분류'] != "계좌 대체")  # 계좌 대체 제외
-    ]['출금'].sum()
+    # 입금액·출금액 계산 (집계 큐브, "계좌 대체" 제외)
+    period_totals = cube.totals(start_datetime, end_datetime)
+    total_deposit = float(period_totals['입금'])
+    total_withdrawal = -1 * float(period_totals['출금'])
 
     # CSS 스타일 정의
     st.markdown("""
@@ -143,82 +368,10 @@ with tab1:
     st.markdown("<div style='margin-top: 30px;'></div>", unsafe_allow_html=True)  # 상단 여백 추가
     st.header("2. 계좌별 통합 현황")
     
-    # 자금일보 시트 전체 읽기
-    df_raw = pd.read_excel(uploaded_file, sheet_name="자금일보", header=None)
-    
-    # 1. "계좌별 통합 현황" 위치 찾기
-    summary_row = None
-    for idx, row in df_raw.iterrows():
-        if row.astype(str).str.contains("계좌별 통합 현황").any():
-            summary_row = idx
-            break
-    
-    if summary_row is not None:
-        # 2. 헤더 행 찾기
-        header_row = summary_row + 1
-        
-        # 3. 실제 데이터 시작 행
-        data_start_row = header_row + 1
-        
-        # 4. 합계 행 찾기
-        end_row = None
-        for idx, row in df_raw.iloc[data_start_row:].iterrows():
-            if row.astype(str).str.contains("합계").any():
-                end_row = idx
-                break
-        
-        # 5. 계좌 정보 읽기
-        account_info = pd.read_excel(
-            uploaded_file,
-            sheet_name="자금일보",
-            header=header_row,
-            nrows=end_row-data_start_row
-        )
-        
-        # 6. 각 계좌별 잔액 계산
-        results = []
-        for _, row in account_info.iterrows():
-            account_no = row['계좌번호']
-            
-            # 기초잔액 계산
-            initial_balance = float(df_daily[
-                (df_daily['지출일'] < start_datetime) &
-                (df_daily['계좌번호'] == account_no)
-            ]['집행 금액'].sum())
-            
-            # 입금 계산 ("계좌 대체" 제외)
-            deposits = df_daily[
-                (df_daily['지출일'] >= start_datetime) &
-                (df_daily['지출일'] <= end_datetime) &
-                (df_daily['계좌번호'] == account_no) &
-                (df_daily['입금'].notna()) &
-                (df_daily['현금흐름 대분류'] != "계좌 대체")  # 계좌 대체 제외
-            ]['입금'].sum()
-            
-            # 출금 계산 ("계좌 대체" 제외)
-            withdrawals = df_daily[
-                (df_daily['지출일'] >= start_datetime) &
-                (df_daily['지출일'] <= end_datetime) &
-                (df_daily['계좌번호'] == account_no) &
-                (df_daily['출금'].notna()) &
-                (df_daily['현금흐름 대분류'] != "계좌 대체")  # 계좌 대체 제외
-            ]['출금'].sum()
-            
-            # 기말잔액 계산
-            final_balance = initial_balance + deposits - withdrawals
-            
-            results.append({
-                '구분': row['구분'],
-                '금융사': row['금융사'],
-                '계좌번호': account_no,
-                '기초잔액': initial_balance,
-                '입금': deposits,
-                '출금': -withdrawals,  # 출금은 음수로 표시
-                '기말잔액': final_balance
-            })
-        
-        # 7. 결과를 데이터프레임으로 변환
-        summary_df = pd.DataFrame(results)
+    # account_info: 자금일보 시트의 "계좌별 통합 현황" 계좌 목록 (로더에서 추출)
+    if account_info is not None:
+        # 6~7. 각 계좌별 잔액 계산 (입출금은 집계 큐브, 계좌 대체 제외, 기초잔액은 잔액 인덱스)
+        summary_df = account_summary(df_daily, account_info, start_datetime, end_datetime, balances, cube)
         
         # 숫자 컬럼들을 float 타입으로 변환
         numeric_columns = ['기초잔액', '입금', '출금', '기말잔액']
@@ -237,38 +390,16 @@ with tab1:
         totals['계좌번호'] = ''
         
         final_df = pd.concat([summary_df, totals], ignore_index=True)
-        
-        # 최종 데이터프레임의 숫자 컬럼들도 float로 변환
-        for col in numeric_columns:
-            final_df[col] = pd.to_numeric(final_df[col], errors='coerce')
 
-            # 데이터프레임 표시하기 전에 숫자 컬럼들을 먼저 변환
-            numeric_columns = ['기초잔액', '입금', '출금', '기말잔액']
-            
-            # 숫자 포맷팅 함수
-            def format_number(x):
-                if pd.isna(x):
-                    return ''
-                return '{:,.0f}'.format(float(x))
-
-            # 숫자 컬럼들을 float로 변환 후 포맷팅
-            final_df_display = final_df.copy()
-            for col in numeric_columns:
-                final_df_display[col] = pd.to_numeric(final_df_display[col], errors='coerce')
-                final_df_display[col] = final_df_display[col].apply(format_number)
-
-            # 테이블 표시
+        # 테이블 표시 (금액은 숫자 그대로, 표시 형식만 컬럼별로 지정)
         st.dataframe(
-                final_df_display,  # 포맷팅된 데이터프레임 사용
+            final_df,
             hide_index=True,
             column_config={
                 "구분": st.column_config.TextColumn("구분", width="medium"),
                 "금융사": st.column_config.TextColumn("금융사", width="medium"),
                 "계좌번호": st.column_config.TextColumn("계좌번호", width="medium"),
-                    "기초잔액": st.column_config.TextColumn("기초잔액", width="medium"),
-                    "입금": st.column_config.TextColumn("입금", width="medium"),
-                    "출금": st.column_config.TextColumn("출금", width="medium"),
-                    "기말잔액": st.column_config.TextColumn("기말잔액", width="medium")
+                **{col: amount_column(col) for col in numeric_columns},
             },
             use_container_width=True
         )
@@ -277,113 +408,114 @@ with tab1:
     st.header("3. 입출금 상세 내역")
     
     
-        # 전체 데이터 준비 (그래프용)
-    df_all_transactions = df_daily[
-        (df_daily["지출일"] > start_datetime) &
-        (df_daily["지출일"] <= end_datetime) &
-        (df_daily["현금흐름 대분류"] != "계좌 대체")
-        ].copy()
-
-        # 입금 상세내역
-    st.subheader("입금 상세내역")
-    details = df_all_transactions[df_all_transactions["입금"].notna()]
-    
-    if not details.empty:
-        display_columns = ["금융사", "계좌번호", "지출일", "집행 금액", "적요", 
-                        "현금흐름 대분류", "현금흐름 중분류"]
-        details_display = details[display_columns].copy()
-            
-            # 집행 금액 포맷팅
-        details_display['집행 금액'] = details_display['집행 금액'].apply(
-                lambda x: '{:,.0f}'.format(float(x)) if pd.notna(x) else ''
+        # 전체 데이터 준비 (시작일 초과 ~ 종료일, 계좌 대체 제외)
+    df_all_transactions = period_transactions(df_daily, start_datetime, end_datetime, timeline)
+
+    # 입금·출금 항목별 집계 (집계 큐브에서 한 번의 groupby, 시작일 다음 날부터)
+    breakdown = cube.breakdown(start_datetime, end_datetime, inclusive="right")
+
+    # 입금용 색상 팔레트 (붉은색, 주황색, 노란색 계열)
+    inflow_colors = [
+        '#FF6B6B',  # 붉은색
+        '#FFA07A',  # 연한 주황
+        '#FFB74D',  # 진한 주황
+        '#FFD700',  # 골든로드
+        '#FFF176',  # 연한 노랑
+        '#FF7043',  # 깊은 주황
+        '#FF9800',  # 표준 주황
+        '#FFEB3B'   # 밝은 노랑
+    ]
+
+    # 출금용 색상 팔레트 (푸른색, 초록색 계열)
+    outflow_colors = [
+        '#4CAF50',  # 초록
+        '#2196F3',  # 파랑
+        '#00BCD4',  # 청록
+        '#009688',  # 틸
+        '#3F51B5',  # 남색
+        '#8BC34A',  # 연한 초록
+        '#03A9F4',  # 연한 파랑
+        '#00796B'   # 깊은 청록
+    ]
+
+    # 입금/출금 상세내역과 항목별 분석 (두 방향이 같은 화면 구성을 공유)
+    def show_direction_section(label, rows_filter, by_category, colors, bar_sign):
+        st.subheader(f"{label} 상세내역")
+        # 건수·합계는 집계 큐브에서 (원장 행을 읽지 않음)
+        summary = cube.slice(start_datetime, end_datetime, "right", direction=rows_filter[1])[['집행 금액', '건수']].sum()
+        if summary['건수'] == 0:
+            return 0
+
+        details = detail_pages(
+            consolidated.version, selection, rows_filter, start_datetime, end_datetime, timeline
+        )
+
+        # 검색·정렬·페이지 선택 (서버에서 처리하고 한 페이지만 표시)
+        search_col, sort_col, order_col, page_col = st.columns([4, 2, 1, 1])
+        with search_col:
+            search = st.text_input(
+                "검색", key=f"{label}_search", placeholder="금융사·계좌번호·적요·현금흐름 분류"
             )
-        
-        # 합계 행 추가
-        total_amount = details['집행 금액'].sum()
-        totals = pd.DataFrame([{
-            '금융사': '합계',
-            '계좌번호': '',
-            '지출일': None,
-                '집행 금액': '{:,.0f}'.format(float(total_amount)),
-            '적요': '',
-            '현금흐름 대분류': '',
-            '현금흐름 중분류': ''
-        }])
-        details_display = pd.concat([details_display, totals])
-        
+        with sort_col:
+            sort_by = st.selectbox("정렬 기준", list(details.frame.columns), index=2, key=f"{label}_sort")
+        with order_col:
+            descending = st.checkbox("내림차순", key=f"{label}_descending")
+        view = detail_view(
+            consolidated.version, selection, rows_filter, start_datetime, end_datetime,
+            search, sort_by, descending, details
+        )
+        with page_col:
+            # 검색으로 페이지 수가 줄어들면 마지막 페이지를 표시
+            page = min(st.number_input("페이지", min_value=1, value=1, key=f"{label}_page"), view.pages())
+
+        # 합계 (검색어가 없으면 큐브 합계, 있으면 검색 결과 합계)
+        if search.strip():
+            count, total_amount = view.count, view.total()
+        else:
+            count, total_amount = int(summary['건수']), summary['집행 금액']
+        first = min((page - 1) * PAGE_SIZE + 1, count)
+        last = min(page * PAGE_SIZE, count)
+        st.caption(f"총 {count:,}건 중 {first:,}~{last:,}번째 · 합계 ￦{total_amount:,.0f}")
+
         st.dataframe(
-            details_display,
+            view.page(page),
             hide_index=True,
+            column_config={"집행 금액": amount_column("집행 금액")},
             use_container_width=True
         )
 
-            # 입금 현금흐름 중분류별 분석
-        st.subheader("입금 항목별 분석")
-            
-            # 데이터 확인 및 처리
-        details['집행 금액_숫자'] = pd.to_numeric(details['집행 금액'], errors='coerce')
-            
-            # 중분류별 금액 집계
-        inflow_by_category = details.groupby('현금흐름 중분류')['집행 금액_숫자'].sum()
-            
-            # 데이터프레임으로 변환하고 컬럼명 변경
-        inflow_df = inflow_by_category.reset_index()
-        inflow_df.columns = ['중분류', '금액']
-            
-            # 금액 포맷팅
-        inflow_df['금액'] = inflow_df['금액'].apply(lambda x: '{:,.0f}'.format(x))
-            
-            # 입금용 색상 팔레트 (붉은색, 주황색, 노란색 계열)
-        inflow_colors = [
-                '#FF6B6B',  # 붉은색
-                '#FFA07A',  # 연한 주황
-                '#FFB74D',  # 진한 주황
-                '#FFD700',  # 골든로드
-                '#FFF176',  # 연한 노랑
-                '#FF7043',  # 깊은 주황
-                '#FF9800',  # 표준 주황
-                '#FFEB3B'   # 밝은 노랑
-            ]
-
-            # 출금용 색상 팔레트 (푸른색, 초록색 계열)
-        outflow_colors = [
-                '#4CAF50',  # 초록
-                '#2196F3',  # 파랑
-                '#00BCD4',  # 청록
-                '#009688',  # 틸
-                '#3F51B5',  # 남색
-                '#8BC34A',  # 연한 초록
-                '#03A9F4',  # 연한 파랑
-                '#00796B'   # 깊은 청록
-            ]
-
-            # 테이블과 도넛 차트를 나란히 배치
+        # 현금흐름 중분류별 분석
+        st.subheader(f"{label} 항목별 분석")
+
+        # 데이터프레임으로 변환하고 컬럼명 변경
+        category_df = by_category.reset_index()
+        category_df.columns = ['중분류', '금액']
+
+        # 테이블과 도넛 차트를 나란히 배치
         col1, col2 = st.columns([1, 2])  # 1:2 비율로 분할
             
         with col1:
-                # 중분류별 금액 테이블
-                st.write("중분류별 금액:")
-                st.dataframe(
-                    inflow_df,
-                    hide_index=True,
-                    column_config={
-                        "중분류": st.column_config.TextColumn(
-                            "중분류",
-                            width="small"
-                        ),
-                        "금액": st.column_config.TextColumn(
-                            "금액",
-                            width="small"
-                        )
-                    },
-                    use_container_width=True
-                )
+            # 중분류별 금액 테이블
+            st.write("중분류별 금액:")
+            st.dataframe(
+                category_df,
+                hide_index=True,
+                column_config={
+                    "중분류": st.column_config.TextColumn(
+                        "중분류",
+                        width="small"
+                    ),
+                    "금액": amount_column("금액", width="small")
+                },
+                use_container_width=True
+            )
             
         with col2:
-                # 파이 차트 (입금용)
+            # 파이 차트
+            def build_pie_chart():
                 fig_pie = go.Figure(data=[go.Pie(
-                    labels=inflow_by_category.index,
-                    values=inflow_by_category.values,
+                    labels=by_category.index,
+                    values=by_category.values,
                     hole=.3,
                     hovertemplate="<b>%{label}</b><br>" +
                                 "금액: ￦%{value:,.0f}<br>" +
@@ -391,14 +523,14 @@ with tab1:
                     textposition="outside",  # 라벨을 외부에 표시
                     textinfo="label+percent",  # 라벨과 퍼센트 모두 표시
                     showlegend=True,  # 범례 표시
-                    marker_colors=inflow_colors  # 입금용 색상 적용
+                    marker_colors=colors  # 방향별 색상 적용
                 )])
                 fig_pie.update_layout(
-                    title="입금 항목별 비중",
+                    title=f"{label} 항목별 비중",
                     height=400,
                     margin=dict(t=30, b=30, l=50, r=100),  # 우측 여백 증가
                     annotations=[dict(
-                        text='입금<br>비중',
+                        text=f'{label}<br>비중',
                         x=0.5,
                         y=0.5,
                         font_size=15,
@@ -411,234 +543,183 @@ with tab1:
                         x=1.02
                     )
                 )
-                st.plotly_chart(fig_pie, use_container_width=True)
+                return fig_pie
+
+            fig_pie = figure_cache().get((*chart_key, label, '항목별 비중'), build_pie_chart)
+            st.plotly_chart(fig_pie, use_container_width=True)
             
-            # 입금 막대 그래프
-        fig_bar = go.Figure(data=[go.Bar(
-                x=inflow_by_category.index,
-                y=inflow_by_category.values,
-                text=[f'￦{x:,.0f}' for x in inflow_by_category.values],
+        # 막대 그래프 (출금은 아래 방향)
+        def build_bar_chart():
+            fig_bar = go.Figure(data=[go.Bar(
+                x=by_category.index,
+                y=bar_sign * by_category.values,
+                text=[f'￦{x:,.0f}' for x in by_category.values],
                 textposition='auto',
-                marker_color=inflow_colors  # 입금용 색상 적용
+                marker_color=colors
             )])
-        fig_bar.update_layout(
-                title="입금 항목별 금액",
+            fig_bar.update_layout(
+                title=f"{label} 항목별 금액",
                 yaxis_title="금액(원)",
                 height=400,
                 yaxis=dict(tickformat=",")
             )
+            return fig_bar
+
+        fig_bar = figure_cache().get((*chart_key, label, '항목별 금액'), build_bar_chart)
         st.plotly_chart(fig_bar, use_container_width=True)
-    else:
+        return count
+
+    inflow_count = show_direction_section(
+        "입금", INFLOW_ROWS, breakdown["입금"].dropna(), inflow_colors, 1
+    )
+    if not inflow_count:
         st.write("해당 기간에 입금 내역이 없습니다.")
 
-    # 출금 상세내역
-    st.subheader("출금 상세내역")
-    details = df_all_transactions[df_all_transactions["출금"].notna()]
-    
-    if not details.empty:
-        display_columns = ["금융사", "계좌번호", "지출일", "집행 금액", "적요", 
-                        "현금흐름 대분류", "현금흐름 중분류"]
-        details_display = details[display_columns].copy()
-            
-            # 집행 금액 포맷팅
-        details_display['집행 금액'] = details_display['집행 금액'].apply(
-                lambda x: '{:,.0f}'.format(float(x)) if pd.notna(x) else ''
-            )
-        
-        # 합계 행 추가
-        total_amount = details['집행 금액'].sum()
-        totals = pd.DataFrame([{
-            '금융사': '합계',
-            '계좌번호': '',
-            '지출일': None,
-                '집행 금액': '{:,.0f}'.format(float(total_amount)),
-            '적요': '',
-            '현금흐름 대분류': '',
-            '현금흐름 중분류': ''
-        }])
-        details_display = pd.concat([details_display, totals])
-        
-        st.dataframe(
-            details_display,
-            hide_index=True,
-            use_container_width=True
-        )
+    outflow_count = show_direction_section(
+        "출금", OUTFLOW_ROWS, breakdown["출금"].dropna(), outflow_colors, -1
+    )
+    if outflow_count:
+        # 일별 입출금 추이 그래프 추가
+        if not df_all_transactions.empty:
+            # 집계 단위: 자동이면 기간 길이에 맞춰 일·주·월·분기 중 선택 (그래프 막대 수 제한)
+            grain_choice = st.radio("추이 집계 단위", ["자동"] + list(GRAINS.values()), horizontal=True)
+            if grain_choice == "자동":
+                grain = auto_grain(start_datetime, end_datetime)
+            else:
+                grain = next(code for code, name in GRAINS.items() if name == grain_choice)
+            grain_name = GRAINS[grain]
+
+            st.subheader(f"{grain_name}별 입출금 추이")
             
-            # 출금 현금흐름 중분류별 분석 그래프
-        st.subheader("출금 항목별 분석")
+            def build_trend_chart():
+                daily_summary = cube.by_period(start_datetime, end_datetime, grain, inclusive="right")
+
+                # 점이 많으면 순변동(LTTB)과 입금·출금(구간별 최대·최소) 모양을 유지하는 날짜만 남기고 순변동 선은 WebGL 로 그림
+                large_series = len(daily_summary) > MAX_CHART_POINTS
+                if large_series:
+                    keep = np.union1d(
+                        lttb(daily_summary['입금'].fillna(0) - daily_summary['출금'].fillna(0), MAX_CHART_POINTS // 2),
+                        np.union1d(
+                            extreme_indices(daily_summary['입금'].fillna(0), MAX_CHART_POINTS // 8),
+                            extreme_indices(daily_summary['출금'].fillna(0), MAX_CHART_POINTS // 8),
+                        ),
+                    )
+                    daily_summary = daily_summary.iloc[keep]
             
-            # 데이터 확인 및 처리
-        details['집행 금액_숫자'] = pd.to_numeric(details['집행 금액'], errors='coerce').abs()
+                fig = go.Figure()
             
-            # 중분류별 금액 집계
-        outflow_by_category = details.groupby('현금흐름 중분류')['집행 금액_숫자'].sum()
+                # 입금 막대 그래프
+                fig.add_trace(go.Bar(
+                    name='입금',
+                    x=daily_summary['지출일'],
+                    y=daily_summary['입금'].fillna(0),
+                    marker_color='rgba(244, 67, 54, 0.7)',  # 부드러운 빨간색
+                    hovertemplate='<b>입금</b>: %{y:,.0f}원<extra></extra>'
+                ))
             
-            # 데이터프레임으로 변환하고 컬럼명 변경
-        outflow_df = outflow_by_category.reset_index()
-        outflow_df.columns = ['중분류', '금액']
+                # 출금 막대 그래프
+                fig.add_trace(go.Bar(
+                    name='출금',
+                    x=daily_summary['지출일'],
+                    y=-daily_summary['출금'].fillna(0),
+                    marker_color='rgba(33, 150, 243, 0.7)',  # 부드러운 파란색
+                    hovertemplate='<b>출금</b>: %{y:,.0f}원<extra></extra>'
+                ))
             
-            # 금액 포맷팅
-        outflow_df['금액'] = outflow_df['금액'].apply(lambda x: '{:,.0f}'.format(x))
+                # 순변동 선 그래프
+                net_change = daily_summary['입금'].fillna(0) - daily_summary['출금'].fillna(0)
+                fig.add_trace((go.Scattergl if large_series else go.Scatter)(
+                    name='순변동',
+                    x=daily_summary['지출일'],
+                    y=net_change,
+                    line=dict(color='rgba(156, 39, 176, 0.9)', width=3),  # 보라색
+                    mode='lines' if large_series else 'lines+markers',  # 점이 적으면 선과 점을 함께 표시
+                    marker=dict(size=8),
+                    hovertemplate='<b>순변동</b>: %{y:,.0f}원<extra></extra>'
+                ))
             
-            # 테이블과 도넛 차트를 나란히 배치
-        col1, col2 = st.columns([1, 2])  # 1:2 비율로 분할
-            
-        with col1:
-                # 데이터 확인용 출력 (디버깅)
-                st.write("중분류별 금액:")
-                st.dataframe(
-                    outflow_df,
-                    hide_index=True,
-                    column_config={
-                        "중분류": st.column_config.TextColumn(
-                            "중분류",
-                            width="small"
-                        ),
-                        "금액": st.column_config.TextColumn(
-                            "금액",
-                            width="small"
-                        )
+                # 그래프 레이아웃 설정
+                fig.update_layout(
+                    barmode='relative',
+                    title={
+                        'text': f'{grain_name}별 입출금 현황',
+                        'y':0.95,
+                        'x':0.5,
+                        'xanchor': 'center',
+                        'yanchor': 'top',
+                        'font': dict(size=20)
                     },
-                    use_container_width=True
-                )
-            
-        with col2:
-                # 파이 차트 (출금용)
-                fig_pie = go.Figure(data=[go.Pie(
-                    labels=outflow_by_category.index,
-                    values=outflow_by_category.values,
-                    hole=.3,
-                    hovertemplate="<b>%{label}</b><br>" +
-                                "금액: ￦%{value:,.0f}<br>" +
-                                "비중: %{percent}<extra></extra>",
-                    textposition="outside",  # 라벨을 외부에 표시
-                    textinfo="label+percent",  # 라벨과 퍼센트 모두 표시
-                    showlegend=True,  # 범례 표시
-                    marker_colors=outflow_colors  # 출금용 색상 적용
-                )])
-                fig_pie.update_layout(
-                    title="출금 항목별 비중",
-                    height=400,
-                    margin=dict(t=30, b=30, l=50, r=100),  # 우측 여백 증가
-                    annotations=[dict(
-                        text='출금<br>비중',
-                        x=0.5,
-                        y=0.5,
-                        font_size=15,
-                        showarrow=False
-                    )],
+                    xaxis_title='거래일자',
+                    yaxis_title='금액(원)',
+                    height=500,  # 그래프 높이 증가
+                    hovermode='x unified',
+                    plot_bgcolor='rgba(255,255,255,0.9)',  # 배경색 설정
+                    paper_bgcolor='rgba(255,255,255,0.9)',
+                    yaxis=dict(
+                        tickformat=',',
+                        gridcolor='rgba(0,0,0,0.1)',  # 그리드 색상
+                        zerolinecolor='rgba(0,0,0,0.2)',  # 0선 색상
+                    ),
+                    xaxis=dict(
+                        gridcolor='rgba(0,0,0,0.1)',
+                        showgrid=True,
+                    ),
+                    showlegend=True,
                     legend=dict(
-                        yanchor="top",
-                        y=1.0,
-                        xanchor="left",
-                        x=1.02
-                    )
+                        orientation='h',
+                        yanchor='bottom',
+                        y=1.02,
+                        xanchor='right',
+                        x=1,
+                        bgcolor='rgba(255,255,255,0.8)',
+                        bordercolor='rgba(0,0,0,0.2)',
+                        borderwidth=1
+                    ),
+                    margin=dict(l=50, r=50, t=80, b=50)  # 여백 조정
                 )
-                st.plotly_chart(fig_pie, use_container_width=True)
             
-            # 출금 막대 그래프
-        fig_bar = go.Figure(data=[go.Bar(
-                x=outflow_by_category.index,
-                y=-outflow_by_category.values,
-                text=[f'￦{x:,.0f}' for x in outflow_by_category.values],
-                textposition='auto',
-                marker_color=outflow_colors  # 출금용 색상 적용
-            )])
-        fig_bar.update_layout(
-                title="출금 항목별 금액",
-                yaxis_title="금액(원)",
-                height=400,
-                yaxis=dict(tickformat=",")
-            )
-        st.plotly_chart(fig_bar, use_container_width=True)
+                # 그래프 테마 업데이트
+                fig.update_xaxes(showline=True, linewidth=1, linecolor='rgba(0,0,0,0.2)')
+                fig.update_yaxes(showline=True, linewidth=1, linecolor='rgba(0,0,0,0.2)')
+                return fig
 
-        # 일별 입출금 추이 그래프 추가
-        if not df_all_transactions.empty:
-            st.subheader("일별 입출금 추이")
-            
-            daily_summary = df_all_transactions.groupby("지출일").agg({
-                "입금": "sum",
-                "출금": "sum"
-            }).reset_index()
-            
-            fig = go.Figure()
-            
-            # 입금 막대 그래프
-            fig.add_trace(go.Bar(
-                name='입금',
-                x=daily_summary['지출일'],
-                y=daily_summary['입금'].fillna(0),
-                marker_color='rgba(244, 67, 54, 0.7)',  # 부드러운 빨간색
-                hovertemplate='<b>입금</b>: %{y:,.0f}원<extra></extra>'
-            ))
-            
-            # 출금 막대 그래프
-            fig.add_trace(go.Bar(
-                name='출금',
-                x=daily_summary['지출일'],
-                y=-daily_summary['출금'].fillna(0),
-                marker_color='rgba(33, 150, 243, 0.7)',  # 부드러운 파란색
-                hovertemplate='<b>출금</b>: %{y:,.0f}원<extra></extra>'
-            ))
-            
-            # 순변동 선 그래프
-            net_change = daily_summary['입금'].fillna(0) - daily_summary['출금'].fillna(0)
-            fig.add_trace(go.Scatter(
-                name='순변동',
-                x=daily_summary['지출일'],
-                y=net_change,
-                line=dict(color='rgba(156, 39, 176, 0.9)', width=3),  # 보라색
-                mode='lines+markers',  # 선과 점을 함께 표시
-                marker=dict(size=8),
-                hovertemplate='<b>순변동</b>: %{y:,.0f}원<extra></extra>'
-            ))
-            
-            # 그래프 레이아웃 설정
-            fig.update_layout(
-                barmode='relative',
-                title={
-                    'text': '일별 입출금 현황',
-                    'y':0.95,
-                    'x':0.5,
-                    'xanchor': 'center',
-                    'yanchor': 'top',
-                    'font': dict(size=20)
-                },
-                xaxis_title='거래일자',
-                yaxis_title='금액(원)',
-                height=500,  # 그래프 높이 증가
-                hovermode='x unified',
-                plot_bgcolor='rgba(255,255,255,0.9)',  # 배경색 설정
-                paper_bgcolor='rgba(255,255,255,0.9)',
-                yaxis=dict(
-                    tickformat=',',
-                    gridcolor='rgba(0,0,0,0.1)',  # 그리드 색상
-                    zerolinecolor='rgba(0,0,0,0.2)',  # 0선 색상
-                ),
-                xaxis=dict(
-                    gridcolor='rgba(0,0,0,0.1)',
-                    showgrid=True,
-                ),
-                showlegend=True,
-                legend=dict(
-                    orientation='h',
-                    yanchor='bottom',
-                    y=1.02,
-                    xanchor='right',
-                    x=1,
-                    bgcolor='rgba(255,255,255,0.8)',
-                    bordercolor='rgba(0,0,0,0.2)',
-                    borderwidth=1
-                ),
-                margin=dict(l=50, r=50, t=80, b=50)  # 여백 조정
-            )
-            
-            # 그래프 테마 업데이트
-            fig.update_xaxes(showline=True, linewidth=1, linecolor='rgba(0,0,0,0.2)')
-            fig.update_yaxes(showline=True, linewidth=1, linecolor='rgba(0,0,0,0.2)')
+            fig = figure_cache().get((*chart_key, '입출금 추이', grain), build_trend_chart)
+            if fig.data[-1].type == 'scattergl':
+                st.caption(f"기간이 길어 {MAX_CHART_POINTS:,}개 안팎의 점으로 줄여 그렸습니다 (추세와 최대·최소 구간 유지).")
             
             st.plotly_chart(fig, use_container_width=True)
 
+    # 🔎 자금일보 시트 ↔ Daily 원장 대사 (시트의 계좌별 현황, Daily 잔액 열)
+    with st.expander("🔎 자금일보 시트 대사"):
+        # 일자별 대사는 워크북별 원본 원장 기준 (통합 원장은 뒤 연도 이월잔액 행이 빠져 있음)
+        selected_workbooks = [f for f in consolidated.workbooks if entity_name(f.key.path) in selection]
+        result = reconciliation(
+            consolidated.version, selection, df_daily, account_info, selected_workbooks, balances, cube
+        )
+        if result.matched:
+            st.success("자금일보 시트의 계좌별 현황과 Daily 잔액이 원장 계산값과 모두 일치합니다.")
+        else:
+            if not result.accounts.empty:
+                st.warning(f"계좌별 현황 불일치 {len(result.accounts):,}건 (시트의 조회 기간 기준)")
+                st.dataframe(
+                    result.accounts,
+                    hide_index=True,
+                    column_config={
+                        **{col: amount_column(col) for col in ['시트', '원장', '차이']},
+                        **{col: st.column_config.DateColumn(col, format="YYYY-MM-DD") for col in ['시작일', '종료일']},
+                    }
+                )
+            if not result.dates.empty:
+                st.warning(f"Daily 잔액 불일치 {len(result.dates):,}일")
+                st.dataframe(
+                    result.dates,
+                    hide_index=True,
+                    column_config={
+                        **{col: amount_column(col) for col in ['시트 잔액', '원장 잔액', '차이']},
+                        '지출일': st.column_config.DateColumn('지출일', format="YYYY-MM-DD"),
+                    }
+                )
+
 # 두 번째 탭: 현금흐름표
 with tab2:
     st.header("현금흐름표")
@@ -661,165 +742,101 @@ with tab2:
     # 합계 0인 행 숨기기 체크박스 추가
     hide_zero_rows = st.checkbox("합계 0인 행 숨기기")
 
-    if uploaded_file is not None:
-        # 기본 헤더 정의
-        base_headers = ['Level', '현금 흐름 구분', '유입/유출', '구분1', '구분2', 'CODE']
-        
-        # 전체 데이터 읽기
-        df_full = pd.read_excel(
-            uploaded_file,
-            sheet_name="월별_CashFlow",
-            skiprows=2
-        )
-        
-        # Level 1인 마지막 행 찾기 (실제 데이터의 끝 지점)
-        last_row_mask = (df_full['Level'] == 1)
-        matching_rows = df_full.index[last_row_mask].tolist()
-        
-        if matching_rows:
-            # 마지막 Level 1 행의 인덱스가 아닌, 전체 Level 1 행을 포함하도록 수정
-            df_base = df_full.iloc[:matching_rows[-1] + 1, 3:9]  # D열부터 I열까지 (인덱스는 0부터 시작하므로 3:9)
-        else:
+    # 금액 기준: 엑셀에서 계산된 월별_CashFlow 시트 또는 Daily 원장에서 직접 계산
+    statement_source = st.radio(
+        "금액 기준", ["월별_CashFlow 시트", "Daily 원장"], horizontal=True,
+        help="Daily 원장 기준은 시트의 행 구성(CODE, Level)에 원장의 월별 집행 금액을 채워 계산합니다."
+    )
+
+    # 월별_CashFlow 시트 (로더에서 행 구분 컬럼 + 월별 금액 행렬로 정리됨)
+    df_full = df_cashflow
+    if skipped_cashflow:
+        st.warning("행 구성이 달라 현금흐름표 합산에서 제외된 파일: " + ", ".join(skipped_cashflow))
+
+    if not df_full.empty:
+        # 로더에서 마지막 Level 1 행까지 잘라 둠
+        if not (df_full['Level'] == 1).any():
             st.error("데이터에서 Level 1인 행을 찾을 수 없습니다.")
-            df_base = df_full.iloc[:, 3:9]
-        
-        # 날짜 데이터 처리
-        date_cols = df_full.columns[9:]  # J열부터의 열 이름들
-        date_mapping = {}
-        
-        for col in date_cols:
-            try:
-                if pd.notna(col):
-                    date = pd.to_datetime(col)
-                    formatted_date = f"{date.year}년 {date.month:02d}월"
-                    date_mapping[col] = formatted_date
-            except:
-                continue
-        
-        # 선택된 기간의 월별 열 생성
-        selected_months = []
-        current_date = pd.Timestamp(f"{start_year}-{start_month}-01")
-        end_date = pd.Timestamp(f"{end_year}-{end_month}-01")
-        
-        while current_date <= end_date:
-            selected_months.append(f"{current_date.year}년 {current_date.month:02d}월")
-            current_date = current_date + pd.DateOffset(months=1)
-        
-        # 최종 데이터프레임 생성
-        result_columns = base_headers + selected_months + ['합계']  # '증감'을 '합계'로 변경
-        df_result = pd.DataFrame(columns=result_columns)
-        df_result[base_headers] = df_base
-        
-        # 선택된 기간의 데이터 매핑
-        monthly_data = df_full.iloc[:matching_rows[-1] + 1, 9:]  # J열부터의 데이터
-        for orig_col, formatted_date in date_mapping.items():
-            if formatted_date in selected_months:
-                df_result[formatted_date] = monthly_data[orig_col]
-        
-        # None 값을 빈 문자열로 변경 (특정 열만)
-        text_columns = ['현금 흐름 구분', '유입/유출', '구분1', '구분2']
-        df_result[text_columns] = df_result[text_columns].fillna('')
-        
-        # 6. 합계 계산
-        if len(selected_months) > 0:
-            # 합계 0인 행 숨기기 기능
-            if hide_zero_rows:
-                sum_columns = selected_months
-                row_sums = df_result[sum_columns].astype(float).sum(axis=1)
-                mask = (df_result['Level'].isin([1, 2])) | (row_sums != 0)
-                df_result = df_result[mask]
-            
-            # 선택된 모든 월의 합계 계산
-            df_result['합계'] = df_result[selected_months].astype(float).sum(axis=1)
-            df_result['합계'] = df_result['합계'].apply(lambda x: f'{x:,.0f}' if pd.notnull(x) else '')
-            
-            # 기초현금과 기말현금 행의 합계는 빈 문자열로 설정
-            df_result.loc[df_result['현금 흐름 구분'] == '기초현금', '합계'] = ''
-            df_result.loc[df_result['현금 흐름 구분'] == '기말현금', '합계'] = ''
-
-            # 표 스타일링
-            def color_rows(row):
-                level = row['Level']
-                if level == 1:
-                    return ['background-color: #E5E5E5'] * len(row)
-                elif level == 2:
-                    return ['background-color: rgb(235, 244, 245)'] * len(row)
-                else:
-                    return [''] * len(row)
 
-            styled_df = df_result.style\
-                .format(lambda x: f'{x:,.0f}' if isinstance(x, (int, float)) else x)\
-                .apply(color_rows, axis=1)
+        # 선택된 기간 (월 PeriodIndex) 과 표시용 월 이름
+        selected_periods = month_range(start_year, start_month, end_year, end_month)
+        selected_months = month_labels(selected_periods)
 
-        # 결과 표시
-        st.write("현금흐름표:")
-        st.dataframe(
-            styled_df,
-            use_container_width=True,
-            height=len(df_result) * 35 + 38
+        # 현금흐름표 행렬 (원장 기준이면 시트 행 구성에 원장 월별 합계를 채움)
+        full_statement = statement_matrix(workbook_keys, selection, df_full)
+        statement_version = workbook_keys
+        if statement_source == "Daily 원장":
+            statement_version = (workbook_keys, consolidated.version)
+            monthly = monthly_ledger_cache().get(
+                (consolidated.version, selection),
+                df_daily,
+                parent=(consolidated.parent_version, selection),
+                new_rows=appended_rows,
+            )
+            full_statement = monthly.statement(full_statement)
+
+        # 선택 월 구간만 잘라낸 행렬 (합계 0인 행 숨기기) -> 표시용 표 (선택 월 + 합계)
+        statement_key = (
+            statement_version, selection, statement_source, (start_year, start_month), (end_year, end_month)
         )
+        statement_html = statement_table(*statement_key, hide_zero_rows, full_statement)
+
+        # 그래프·예측은 표의 0행 숨기기와 무관하게 전체 행 기준 (그래프 캐시 키에서 체크박스 제외)
+        statement = statement_selection(*statement_key, False, full_statement)
+
+        # 결과 표시 (기초현금과 기말현금 행의 합계는 빈 칸, 행이 많으면 표 안에서 스크롤)
+        st.write("현금흐름표:")
+        st.html(STATEMENT_CSS + statement_html)
 
         # 그래프를 위한 데이터 준비
         if len(selected_months) > 0:
             try:
                 # 기초현금과 기말현금 데이터 추출
-                initial_cash_row = df_result[df_result['현금 흐름 구분'] == '기초현금']
-                final_cash_row = df_result[df_result['현금 흐름 구분'] == '기말현금']
+                initial_cash = statement_row(statement, '기초현금')
+                final_cash = statement_row(statement, '기말현금')
                 
-                if not initial_cash_row.empty and not final_cash_row.empty:
-                    initial_cash = initial_cash_row[selected_months].values[0].astype(float)
-                    final_cash = final_cash_row[selected_months].values[0].astype(float)
-
+                if initial_cash is not None and final_cash is not None:
                     # 1. 월별 현금 잔액 추이 그래프
-                    fig1 = go.Figure()
-                    fig1.add_trace(go.Scatter(
-                        x=selected_months, 
-                        y=initial_cash,
-                        name='기초현금', 
-                        line=dict(color='green', width=2)
-                    ))
-                    fig1.add_trace(go.Scatter(
-                        x=selected_months, 
-                        y=final_cash,
-                        name='기말현금', 
-                        line=dict(color='red', dash='dash')
-                    ))
-                    fig1.update_layout(
-                        title='월별 현금 잔액 추이',
-                        xaxis_title='연도월',
-                        yaxis_title='금액',
-                        height=400,
-                        yaxis=dict(tickformat=",")
-                    )
+                    def build_balance_chart():
+                        fig1 = go.Figure()
+                        fig1.add_trace(go.Scatter(
+                            x=selected_months, 
+                            y=initial_cash,
+                            name='기초현금', 
+                            line=dict(color='green', width=2)
+                        ))
+                        fig1.add_trace(go.Scatter(
+                            x=selected_months, 
+                            y=final_cash,
+                            name='기말현금', 
+                            line=dict(color='red', dash='dash')
+                        ))
+                        fig1.update_layout(
+                            title='월별 현금 잔액 추이',
+                            xaxis_title='연도월',
+                            yaxis_title='금액',
+                            height=400,
+                            yaxis=dict(tickformat=",")
+                        )
+                        return fig1
+
+                    fig1 = figure_cache().get((*statement_key, '현금 잔액 추이'), build_balance_chart)
                     st.plotly_chart(fig1, use_container_width=True)
 
-                    # 2. 현금 유입/유출 비교 그래프
-                    cash_flows = {
-                        '영업활동': [],
-                        '투자활동': [],
-                        '재무활동': []
-                    }
-                    
-                    # Level 1인 행에서 영업, 투자, 재무 데이터 추출
-                    for keyword, activity in [('영업', '영업활동'), ('투자', '투자활동'), ('재무', '재무활동')]:
-                        mask = (df_result['Level'] == 1) & (df_result['현금 흐름 구분'].str.contains(keyword, na=False, case=False))
-                        matching_rows = df_result[mask]
-                        
-                        if not matching_rows.empty:
-                            # 선택된 월의 데이터를 리스트로 변환
-                            cash_flows[activity] = matching_rows[selected_months].values[0].astype(float)
+                    # 2. 현금 유입/유출 비교 그래프 (Level 1 영업, 투자, 재무 행)
+                    cash_flows = activity_flows(statement)
 
                     # 데이터가 있는 경우에만 그래프 생성
-                    if any(len(flows) > 0 for flows in cash_flows.values()):
-                        fig2 = go.Figure()
-                        colors = {
-                            '영업활동': 'rgba(244, 67, 54, 0.7)',    # 부드러운 빨간색
-                            '투자활동': 'rgba(33, 150, 243, 0.7)',   # 부드러운 파란색
-                            '재무활동': 'rgba(156, 39, 176, 0.7)'    # 보라색
-                        }
+                    if cash_flows:
+                        def build_activity_chart():
+                            fig2 = go.Figure()
+                            colors = {
+                                '영업활동': 'rgba(244, 67, 54, 0.7)',    # 부드러운 빨간색
+                                '투자활동': 'rgba(33, 150, 243, 0.7)',   # 부드러운 파란색
+                                '재무활동': 'rgba(156, 39, 176, 0.7)'    # 보라색
+                            }
                         
-                        for activity, flows in cash_flows.items():
-                            if len(flows) > 0:  # 데이터가 있는 경우만 그래프에 추가
+                            for activity, flows in cash_flows.items():
                                 fig2.add_trace(go.Bar(
                                     name=activity,
                                     x=selected_months,
@@ -827,61 +844,31 @@ with tab2:
                                     marker_color=colors[activity]
                                 ))
                         
-                        fig2.update_layout(
-                            title='현금 유입/유출 비교',
-                            xaxis_title='연도월',
-                            yaxis_title='금액',
-                            barmode='group',
-                            height=400,
-                            showlegend=True,
-                            legend_title='활동 구분',
-                            yaxis=dict(tickformat=",")
-                        )
+                            fig2.update_layout(
+                                title='현금 유입/유출 비교',
+                                xaxis_title='연도월',
+                                yaxis_title='금액',
+                                barmode='group',
+                                height=400,
+                                showlegend=True,
+                                legend_title='활동 구분',
+                                yaxis=dict(tickformat=",")
+                            )
+                            return fig2
+
+                        fig2 = figure_cache().get((*statement_key, '현금 유입/유출'), build_activity_chart)
                         st.plotly_chart(fig2, use_container_width=True)
 
                 # 변동비/고정비 상세 비중 분석
-                try:
-                    # 변동비와 고정비 행 찾기
-                    variable_cost_rows = df_result[df_result['구분1'] == '변동비']
-                    fixed_cost_rows = df_result[df_result['구분1'] == '고정비']
-
-                    if not variable_cost_rows.empty and not fixed_cost_rows.empty:
-                        variable_cost_idx = variable_cost_rows.index[0]
-                        fixed_cost_idx = fixed_cost_rows.index[0]
-
-                        # 변동비 하위레벨 추출
-                        variable_subcosts = df_result[
-                            (df_result.index > variable_cost_idx) & 
-                            (df_result.index < fixed_cost_idx) &
-                            (df_result['구분2'].notna())
-                        ]
-                        
-                        # 금액이 0이 아닌 행만 선택
-                        variable_subcosts = variable_subcosts[
-                            variable_subcosts[selected_months].astype(float).abs().sum(axis=1) > 0
-                        ]
-
-                        # 고정비 하위레벨 추출
-                        fixed_subcosts = df_result[
-                            (df_result.index > fixed_cost_idx) & 
-                            (df_result['Level'] == 4)
-                        ]
-                        
-                        # Level이 3이나 1이 나오는 행 이후는 제외
-                        if not fixed_subcosts.empty:
-                            end_idx = fixed_subcosts.index[-1]
-                            for idx in fixed_subcosts.index:
-                                if df_result.loc[idx:, 'Level'].isin([1, 3]).any():
-                                    end_idx = df_result.loc[idx:, 'Level'].isin([1, 3]).idxmax()
-                                    break
-                            fixed_subcosts = fixed_subcosts.loc[:end_idx-1]
-                        
-                        # 금액이 0이 아닌 행만 선택
-                        fixed_subcosts = fixed_subcosts[
-                            fixed_subcosts[selected_months].astype(float).abs().sum(axis=1) > 0
-                        ]
+                costs = cost_breakdown(statement)
+                if costs is None:
+                    st.error("변동비/고정비 상세 분석 그래프 생성 중 오류가 발생했습니다.")
+                else:
+                    variable_subcosts = costs.variable
+                    fixed_subcosts = costs.fixed
 
-                        # 그래프 생성
+                    # 그래프 생성
+                    def build_cost_chart():
                         fig_cost = go.Figure()
 
                         # 색상 정의
@@ -902,39 +889,36 @@ with tab2:
                         ]
 
                         # 변동비 하위 항목 추가
-                        for idx, (_, row) in enumerate(variable_subcosts.iterrows()):
+                        for idx, (name, amounts) in enumerate(zip(variable_subcosts.rows["구분2"], np.abs(variable_subcosts.values.to_numpy()))):
                             fig_cost.add_trace(go.Bar(
-                                name=f'변동비-{row["구분2"]}',
+                                name=f'변동비-{name}',
                                 x=selected_months,
-                                y=row[selected_months].astype(float).abs(),
+                                y=amounts,
                                 marker_color=orange_colors[idx % len(orange_colors)],
-                                text=[f'￦{abs(float(v)):,.0f}' for v in row[selected_months]],
+                                text=[f'￦{v:,.0f}' for v in amounts] if len(selected_months) <= TEXT_LABEL_LIMIT else None,
                                 textposition='auto',
                                 legendgroup='변동비',
                                 legendgrouptitle_text='변동비'
                             ))
 
                         # 고정비 하위 항목 추가
-                        for idx, (_, row) in enumerate(fixed_subcosts.iterrows()):
+                        for idx, (name, amounts) in enumerate(zip(fixed_subcosts.rows["구분2"], np.abs(fixed_subcosts.values.to_numpy()))):
                             fig_cost.add_trace(go.Bar(
-                                name=f'고정비-{row["구분2"]}',
+                                name=f'고정비-{name}',
                                 x=selected_months,
-                                y=row[selected_months].astype(float).abs(),
+                                y=amounts,
                                 marker_color=blue_colors[idx % len(blue_colors)],
-                                text=[f'￦{abs(float(v)):,.0f}' for v in row[selected_months]],
+                                text=[f'￦{v:,.0f}' for v in amounts] if len(selected_months) <= TEXT_LABEL_LIMIT else None,
                                 textposition='auto',
                                 legendgroup='고정비',
                                 legendgrouptitle_text='고정비'
                             ))
 
                         # 총액 선 그래프 추가
-                        total_variable = variable_subcosts[selected_months].astype(float).abs().sum()
-                        total_fixed = fixed_subcosts[selected_months].astype(float).abs().sum()
-
                         fig_cost.add_trace(go.Scatter(
                             name='변동비 총액',
                             x=selected_months,
-                            y=total_variable,
+                            y=costs.variable_total,
                             line=dict(color='rgba(255, 87, 34, 1)', width=2),
                             legendgroup='변동비'
                         ))
@@ -942,7 +926,7 @@ with tab2:
                         fig_cost.add_trace(go.Scatter(
                             name='고정비 총액',
                             x=selected_months,
-                            y=total_fixed,
+                            y=costs.fixed_total,
                             line=dict(color='rgba(33, 150, 243, 1)', width=2),
                             legendgroup='고정비'
                         ))
@@ -961,37 +945,20 @@ with tab2:
                                 groupclick="toggleitem"
                             )
                         )
+                        return fig_cost
 
-                        st.plotly_chart(fig_cost, use_container_width=True)
+                    fig_cost = figure_cache().get((*statement_key, '변동비/고정비'), build_cost_chart)
 
-                    # 표 생성을 위한 데이터 준비
-                    summary_data = {
-                        '구분': ['변동비 합계', '고정비 합계', '변동비 비중(%)', '고정비 비중(%)', '총계'],
-                    }
-                    
-                    # 각 월별 금액과 비중 계산
-                    for month in selected_months:
-                        variable_sum = variable_subcosts[month].astype(float).abs().sum()
-                        fixed_sum = fixed_subcosts[month].astype(float).abs().sum()
-                        total_sum = variable_sum + fixed_sum
-                        
-                        # 비중 계산 (총계가 0인 경우 예외 처리)
-                        if total_sum > 0:
-                            variable_ratio = (variable_sum / total_sum) * 100
-                            fixed_ratio = (fixed_sum / total_sum) * 100
-                        else:
-                            variable_ratio = fixed_ratio = 0
-                        
-                        summary_data[month] = [
-                            f'{variable_sum:,.0f}',
-                            f'{fixed_sum:,.0f}',
-                            f'{variable_ratio:.1f}%',
-                            f'{fixed_ratio:.1f}%',
-                            f'{total_sum:,.0f}'
-                        ]
+                    st.plotly_chart(fig_cost, use_container_width=True)
 
-                    # DataFrame 생성
-                    summary_df = pd.DataFrame(summary_data)
+                    # 표 생성을 위한 데이터 준비 (금액은 천 단위 쉼표, 비중은 소수 첫째 자리)
+                    cost_summary = costs.summary()
+                    summary_df = pd.DataFrame({'구분': cost_summary.index})
+                    for period, month in zip(selected_periods, selected_months):
+                        summary_df[month] = [
+                            f'{v:.1f}%' if '비중' in label else f'{v:,.0f}'
+                            for label, v in cost_summary[period].items()
+                        ]
                     
                     # 표 스타일링
                     def style_summary_table(df):
@@ -1023,110 +990,124 @@ with tab2:
 
                     # 기말 현금잔액 예상액 추이 그래프 생성
                     try:
-                        # 숫자 열만 선택 (현금 흐름 구분 등의 문자열 열 제외)
-                        numeric_columns = [col for col in df_result.columns if '년' in str(col) and '월' in str(col)]
-                        # 마지막 열을 종료월로 설정
-                        end_month = numeric_columns[-1]
-                        
-                        # 최근 3개월 선택
-                        recent_months = sorted(numeric_columns)[-3:]
-                        
-                        # 고정비 합계 행 찾기
-                        fixed_cost_row = summary_df[summary_df['구분'] == '고정비 합계']
-                        
-                        # 최근 3개월 고정비 평균 계산
-                        recent_fixed_costs = []
-                        for month in recent_months:
-                            cost_str = fixed_cost_row[month].iloc[0]
-                            # 문자열에서 숫자로 변환 ('￦' 기호와 쉼표 제거)
-                            cost = float(str(cost_str).replace('￦', '').replace(',', ''))
-                            recent_fixed_costs.append(cost)
-                        
-                        avg_fixed_cost = sum(recent_fixed_costs) / len(recent_fixed_costs)
+                        # 최근 3개월 고정비 평균
+                        avg_fixed_cost = average_fixed_cost(costs.fixed_total)
                         st.write("5. 평균 고정비 (3개월 평균 고정비):", f"{avg_fixed_cost:,.0f}")
                         
-                        # 기말현금 데이터 확인
-                        ending_cash_row = df_result[df_result['현금 흐름 구분'] == '기말현금']
+                        # 기말현금 데이터 확인 (종료월 기말현금에서 시작)
+                        ending_cash = statement_row(statement, '기말현금')
                         
-                        if not ending_cash_row.empty:
-                            # 초기 현금 확인
-                            initial_cash_str = ending_cash_row[end_month].iloc[0]
-                            
-                            # 문자열 처리
-                            if isinstance(initial_cash_str, str):
-                                initial_cash = float(initial_cash_str.replace(',', ''))
-                            else:
-                                initial_cash = float(initial_cash_str)
+                        if ending_cash is not None:
+                            initial_cash = float(ending_cash[-1])
                             st.write("6. 초기 현금:", f"{initial_cash:,.0f}")
                             
-                            # 미래 현금 계산
-                            future_cash = []
-                            dates = []
-                            current_cash = initial_cash
-                            
-                            # 종료 연월 파싱
-                            end_year = int(end_month.split('년')[0])
-                            end_month_num = int(end_month.split('년')[1].split('월')[0])
-                            
-                            # 현금이 음수가 될 때까지 계산 (24개월 제한 삭제)
-                            month_count = 0
-                            while current_cash > 0:  # 24개월 제한 조건 제거
-                                future_cash.append(current_cash)
-                                
-                                new_month = end_month_num + month_count
-                                year = end_year + (new_month - 1) // 12
-                                month = ((new_month - 1) % 12) + 1
-                                dates.append(f'{year}년 {month:02d}월')
-                                
-                                current_cash -= avg_fixed_cost
-                                month_count += 1
-                            
-                            # 마지막 음수 값 포함
-                            future_cash.append(current_cash)
-                            new_month = end_month_num + month_count
-                            year = end_year + (new_month - 1) // 12
-                            month = ((new_month - 1) % 12) + 1
-                            dates.append(f'{year}년 {month:02d}월')
+                            # 미래 현금 계산 (현금이 음수가 될 때까지, 최대 10년)
+                            forecast_months, future_cash = runway_forecast(initial_cash, avg_fixed_cost, selected_periods[-1])
+                            dates = month_labels(forecast_months)
                             
                             # 그래프 생성
-                            fig_forecast = go.Figure()
+                            def build_forecast_chart():
+                                fig_forecast = go.Figure()
                             
-                            fig_forecast.add_trace(go.Scatter(
-                                x=dates,
-                                y=future_cash,
-                                mode='lines+markers+text',
-                                name='예상 기말현금',
-                                line=dict(color='rgb(33, 150, 243)', width=2),
-                                text=[f'￦{val:,.0f}' for val in future_cash],
-                                textposition='top center'
-                            ))
+                                fig_forecast.add_trace(go.Scatter(
+                                    x=dates,
+                                    y=future_cash,
+                                    mode='lines+markers+text' if len(dates) <= TEXT_LABEL_LIMIT else 'lines+markers',
+                                    name='예상 기말현금',
+                                    line=dict(color='rgb(33, 150, 243)', width=2),
+                                    text=[f'￦{val:,.0f}' for val in future_cash] if len(dates) <= TEXT_LABEL_LIMIT else None,
+                                    textposition='top center'
+                                ))
                             
-                            fig_forecast.update_layout(
-                                title='기말 현금잔액 예상액 추이',
-                                xaxis_title='연월',
-                                yaxis_title='금액(원)',
-                                yaxis=dict(tickformat=','),
-                                showlegend=True,
-                                height=500
-                            )
+                                fig_forecast.update_layout(
+                                    title='기말 현금잔액 예상액 추이',
+                                    xaxis_title='연월',
+                                    yaxis_title='금액(원)',
+                                    yaxis=dict(tickformat=','),
+                                    showlegend=True,
+                                    height=500
+                                )
                             
-                            fig_forecast.add_hline(y=0, line_dash="dash", line_color="red")
+                                fig_forecast.add_hline(y=0, line_dash="dash", line_color="red")
+                                return fig_forecast
+
+                            fig_forecast = figure_cache().get((*statement_key, '기말 현금잔액 예상'), build_forecast_chart)
                             
                             st.plotly_chart(fig_forecast, use_container_width=True)
                             
                             # 현금 소진 예상 시점 안내 (항상 표시)
-                            for i, cash in enumerate(future_cash):
-                                if cash <= 0:
-                                    st.warning(f'현재 고정비 지출 수준 유지 시 {dates[i]}에 현금이 소진될 것으로 예상됩니다.')
-                                    break
+                            depletion = depletion_month(dates, future_cash)
+                            if depletion is not None:
+                                st.warning(f'현재 고정비 지출 수준 유지 시 {depletion}에 현금이 소진될 것으로 예상됩니다.')
+                            else:
+                                st.info(f'현재 고정비 지출 수준 유지 시 {len(dates) - 1}개월 안에는 현금이 소진되지 않습니다.')
+
+                            # 런웨이 시나리오 비교 (고정비 산정 기간별 × 증가율 × 월 유입, 몬테카를로 범위)
+                            with st.expander("📈 런웨이 시나리오 비교"):
+                                scol1, scol2 = st.columns(2)
+                                with scol1:
+                                    growth_pct = st.slider("고정비 월 증가율 (%)", -10.0, 10.0, 0.0, 0.5)
+                                with scol2:
+                                    monthly_inflow = st.number_input("월 예상 유입액 (원)", value=0, step=1_000_000)
+
+                                windows = [1, 3, 6, 12]
+                                burns = [average_fixed_cost(costs.fixed_total, window) for window in windows]
+                                paths = project_cash(initial_cash, burn_schedule(burns, growth_pct / 100, monthly_inflow))
+                                runways = runway_months(paths)
+                                bands = monte_carlo_bands(
+                                    initial_cash, costs.fixed_total.to_numpy(), growth_pct / 100, monthly_inflow
+                                )
+                                horizon = pd.period_range(selected_periods[-1], periods=paths.shape[1], freq='M')
+                                horizon_labels = month_labels(horizon)
+
+                                def build_scenario_chart():
+                                    fig_scenario = go.Figure()
+                                    fig_scenario.add_trace(go.Scatter(
+                                        x=horizon_labels, y=bands[2], mode='lines',
+                                        line=dict(width=0), showlegend=False, hoverinfo='skip'
+                                    ))
+                                    fig_scenario.add_trace(go.Scatter(
+                                        x=horizon_labels, y=bands[0], mode='lines',
+                                        line=dict(width=0), fill='tonexty', fillcolor='rgba(33, 150, 243, 0.15)',
+                                        name='몬테카를로 10~90%'
+                                    ))
+                                    fig_scenario.add_trace(go.Scatter(
+                                        x=horizon_labels, y=bands[1], mode='lines',
+                                        line=dict(color='rgba(33, 150, 243, 0.8)', dash='dot'),
+                                        name='몬테카를로 중앙값'
+                                    ))
+                                    for window, path in zip(windows, paths):
+                                        fig_scenario.add_trace(go.Scatter(
+                                            x=horizon_labels, y=path, mode='lines',
+                                            name=f'최근 {window}개월 평균 고정비'
+                                        ))
+                                    fig_scenario.update_layout(
+                                        title='런웨이 시나리오별 기말 현금잔액',
+                                        xaxis_title='연월',
+                                        yaxis_title='금액(원)',
+                                        yaxis=dict(tickformat=','),
+                                        height=500
+                                    )
+                                    fig_scenario.add_hline(y=0, line_dash="dash", line_color="red")
+                                    return fig_scenario
+
+                                fig_scenario = figure_cache().get((*statement_key, '런웨이 시나리오', growth_pct, monthly_inflow), build_scenario_chart)
+                                st.plotly_chart(fig_scenario, use_container_width=True)
+
+                                st.dataframe(pd.DataFrame({
+                                    '시나리오': [f'최근 {window}개월 평균 고정비' for window in windows],
+                                    '월 고정비': np.round(burns),
+                                    '현금 소진 예상 월': [
+                                        month_label(horizon[months]) if months >= 0 else f'{len(horizon) - 1}개월 내 소진 없음'
+                                        for months in runways
+                                    ],
+                                }), hide_index=True, column_config={'월 고정비': amount_column('월 고정비')})
 
                     except Exception as e:
                         st.error(f"오류 발생 위치 확인: {str(e)}")
                         import traceback
                         st.error(f"상세 오류: {traceback.format_exc()}")
 
-                except Exception as e:
-                    st.error("변동비/고정비 상세 분석 그래프 생성 중 오류가 발생했습니다.")
             except Exception as e:
                 st.error(f"그래프 생성 중 오류 발생: {str(e)}")
                 st.write("오류 상세:", e)
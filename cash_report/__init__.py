@@ -0,0 +1,224 @@
+"""자금일보 / 현금흐름표 계산 엔진."""
+
+from .balance import BalanceIndex
+from .batch import (
+    FREQUENCIES,
+    BatchReport,
+    Period,
+    PeriodReport,
+    batch_report,
+    make_periods,
+    period_reports,
+    report_tables,
+    write_report,
+)
+from .consolidate import (
+    ENTITY_COLUMN,
+    SOURCE_COLUMN,
+    SUPPORTED_EXTS,
+    ConsolidatedFrames,
+    SelectedFrames,
+    combine_cashflow,
+    consolidate,
+    discover_workbooks,
+    entity_name,
+    load_workbooks,
+)
+from .cube import GRAINS, MAX_TREND_POINTS, DailyCube, auto_grain
+from .detail import DETAIL_COLUMNS, PAGE_SIZE, DetailPages
+from .downsample import MAX_CHART_POINTS, extreme_indices, lttb
+from .forecast import (
+    BAND_QUANTILES,
+    MAX_HORIZON,
+    average_fixed_cost,
+    burn_schedule,
+    depletion_month,
+    monte_carlo_bands,
+    project_cash,
+    runway_forecast,
+    runway_months,
+)
+from .hierarchy import StatementTree
+from .incremental import AppendOnlyCache
+from .ledger import (
+    SUMMARY_COLUMNS,
+    TRANSFER_CATEGORY,
+    account_keys,
+    account_summary,
+    is_inflow,
+    is_outflow,
+    is_transfer,
+    period_transactions,
+)
+from .loader import (
+    CASHFLOW_SHEET,
+    DAILY_SHEET,
+    DailyPrefix,
+    DailyScan,
+    REPORT_PERIOD_COLUMNS,
+    REPORT_SHEET,
+    ProgressCallback,
+    WorkbookFrames,
+    WorkbookKey,
+    coerce_accounts,
+    coerce_daily,
+    extract_account_master,
+    extract_cashflow,
+    extract_report_period,
+    load_workbook_frames,
+    read_daily_streaming,
+    scan_daily,
+    workbook_key,
+)
+from .memo import DEFAULT_BUDGET, BudgetCache
+from .monthly import MonthlyLedger, code_labels
+from .predicates import (
+    INFLOW_ROWS,
+    OUTFLOW_ROWS,
+    TRANSFER_ROWS,
+    Predicate,
+    PredicateIndex,
+    account_predicates,
+)
+from .reconcile import (
+    TOLERANCE,
+    Reconciliation,
+    reconcile,
+    reconcile_accounts,
+    reconcile_dates,
+    reconcile_workbooks,
+)
+from .schema import (
+    AMOUNT_COLUMNS,
+    DIMENSION_COLUMNS,
+    DIRECTION_COLUMN,
+    INFLOW,
+    NO_FLOW,
+    OUTFLOW,
+    apply_ledger_schema,
+    concat_rows,
+    direction_flags,
+)
+from .sidecar import is_fresh, load_cached_workbook, read_sidecar, sidecar_dir, write_sidecar
+from .statement import (
+    CostBreakdown,
+    StatementMatrix,
+    activity_flows,
+    build_statement,
+    cost_breakdown,
+    month_label,
+    month_labels,
+    month_range,
+    statement_row,
+)
+from .timeline import LedgerTimeline
+
+__all__ = [
+    "AMOUNT_COLUMNS",
+    "AppendOnlyCache",
+    "BAND_QUANTILES",
+    "BalanceIndex",
+    "BatchReport",
+    "BudgetCache",
+    "CASHFLOW_SHEET",
+    "ConsolidatedFrames",
+    "CostBreakdown",
+    "DAILY_SHEET",
+    "DEFAULT_BUDGET",
+    "DETAIL_COLUMNS",
+    "DIMENSION_COLUMNS",
+    "DIRECTION_COLUMN",
+    "DailyCube",
+    "DailyPrefix",
+    "DailyScan",
+    "DetailPages",
+    "ENTITY_COLUMN",
+    "FREQUENCIES",
+    "GRAINS",
+    "INFLOW",
+    "INFLOW_ROWS",
+    "LedgerTimeline",
+    "MAX_CHART_POINTS",
+    "MAX_HORIZON",
+    "MAX_TREND_POINTS",
+    "MonthlyLedger",
+    "NO_FLOW",
+    "OUTFLOW",
+    "OUTFLOW_ROWS",
+    "PAGE_SIZE",
+    "Period",
+    "PeriodReport",
+    "Predicate",
+    "PredicateIndex",
+    "ProgressCallback",
+    "REPORT_PERIOD_COLUMNS",
+    "REPORT_SHEET",
+    "Reconciliation",
+    "SOURCE_COLUMN",
+    "SUMMARY_COLUMNS",
+    "SUPPORTED_EXTS",
+    "SelectedFrames",
+    "StatementMatrix",
+    "StatementTree",
+    "TOLERANCE",
+    "TRANSFER_CATEGORY",
+    "TRANSFER_ROWS",
+    "WorkbookFrames",
+    "WorkbookKey",
+    "account_keys",
+    "account_predicates",
+    "account_summary",
+    "activity_flows",
+    "apply_ledger_schema",
+    "auto_grain",
+    "average_fixed_cost",
+    "batch_report",
+    "build_statement",
+    "burn_schedule",
+    "code_labels",
+    "coerce_accounts",
+    "coerce_daily",
+    "combine_cashflow",
+    "concat_rows",
+    "consolidate",
+    "cost_breakdown",
+    "depletion_month",
+    "direction_flags",
+    "discover_workbooks",
+    "entity_name",
+    "extract_account_master",
+    "extract_cashflow",
+    "extract_report_period",
+    "extreme_indices",
+    "is_fresh",
+    "is_inflow",
+    "is_outflow",
+    "is_transfer",
+    "load_cached_workbook",
+    "load_workbook_frames",
+    "load_workbooks",
+    "lttb",
+    "make_periods",
+    "monte_carlo_bands",
+    "month_label",
+    "month_labels",
+    "month_range",
+    "period_reports",
+    "period_transactions",
+    "project_cash",
+    "read_daily_streaming",
+    "read_sidecar",
+    "reconcile",
+    "reconcile_accounts",
+    "reconcile_dates",
+    "reconcile_workbooks",
+    "report_tables",
+    "runway_forecast",
+    "runway_months",
+    "scan_daily",
+    "sidecar_dir",
+    "statement_row",
+    "workbook_key",
+    "write_report",
+    "write_sidecar",
+]
@@ -0,0 +1,69 @@
+"""기간별 자금일보 일괄 생성 명령.
+
+    python -m cash_report --start 2025-03-01 --end 2025-03-31 --freq B -o 2025-03.xlsx
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+from .batch import FREQUENCIES, batch_report, write_report
+from .consolidate import SUPPORTED_EXTS, consolidate, discover_workbooks, load_workbooks
+from .loader import workbook_key
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m cash_report", description="기간별 자금일보 일괄 생성")
+    parser.add_argument("--data", default="data", help="워크북 폴더 (기본: data)")
+    parser.add_argument("--start", required=True, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", required=True, help="종료일 (YYYY-MM-DD)")
+    parser.add_argument(
+        "--freq", default="D", choices=list(FREQUENCIES),
+        help="기간 단위: " + ", ".join(f"{k}={v}" for k, v in FREQUENCIES.items()),
+    )
+    parser.add_argument("--entity", action="append", help="법인 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: 워크북 읽기는 CPU 수, 기간 계산은 기간이 많을 때만 CPU 수)")
+    parser.add_argument("-o", "--output", required=True, help="출력 파일 (.xlsx 또는 .html)")
+    args = parser.parse_args(argv)
+
+    paths = discover_workbooks(args.data, SUPPORTED_EXTS)
+    if not paths:
+        print(f"{args.data} 폴더에 엑셀 파일이 없습니다.", file=sys.stderr)
+        return 1
+
+    started = time.perf_counter()
+
+    def show_file_progress(done, total, elapsed):
+        print(f"워크북 읽는 중: {done}/{total}개 파일 ({elapsed:,.1f}초)", file=sys.stderr)
+
+    workbooks = load_workbooks(
+        [workbook_key(path) for path in paths],
+        max_workers=args.workers,
+        file_progress=show_file_progress,
+    )
+    consolidated = consolidate(workbooks)
+
+    entities = args.entity or consolidated.entities
+    unknown = sorted(set(entities) - set(consolidated.entities))
+    if unknown:
+        print(f"없는 법인: {', '.join(unknown)} (가능: {', '.join(consolidated.entities)})", file=sys.stderr)
+        return 1
+    selected = consolidated.select(entities)
+    for name in selected.skipped:
+        print(f"행 구성이 달라 현금흐름표 합산에서 제외: {name}", file=sys.stderr)
+
+    report = batch_report(
+        selected.daily, selected.accounts, selected.cashflow,
+        args.start, args.end, args.freq, max_workers=args.workers,
+    )
+    write_report(report, args.output)
+    elapsed = time.perf_counter() - started
+    print(f"{len(report.periods)}개 기간 -> {os.path.abspath(args.output)} ({elapsed:,.1f}초)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
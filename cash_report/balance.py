@@ -0,0 +1,194 @@
+"""누적합 기반 잔액 인덱스.
+
+원장을 지출일 순으로 정렬해 집행 금액 누적합을 전체·계좌별로 들고 있는다.
+"D일 현재 잔액"은 이진 탐색 한 번과 배열 조회 한 번으로 구하고, 여러 계좌의
+잔액도 (계좌 코드, 지출일) 키 배열의 이진 탐색 한 번으로 함께 구한다. 행이
+추가되면 추가분만 정렬해 기존 정렬 배열에 끼워 넣고, 누적합은 처음 끼워 넣은
+위치부터만 다시 더한다 (뒤에 추가되는 행이면 추가분 길이만큼).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Hashable, Iterable
+
+import numpy as np
+import pandas as pd
+
+from .ledger import account_keys
+
+# 계좌 원장 정렬 키 (구조체 배열은 필드 순서대로 비교)
+ACCOUNT_KEY = np.dtype([("code", np.int64), ("date", "datetime64[ns]")])
+
+
+def _positions(values: np.ndarray, added: np.ndarray) -> np.ndarray:
+    # 정렬 배열에서 added (정렬됨) 각각을 끼워 넣을 위치 (같은 값이면 기존 값 뒤)
+    if not len(values):
+        return np.zeros(len(added), dtype=np.intp)
+    return np.searchsorted(values, added, side="right")
+
+
+def _merge(values: np.ndarray, at: np.ndarray, added: np.ndarray) -> np.ndarray:
+    # 정렬 배열의 at 위치들에 added 를 끼워 넣는다 (타입은 둘을 모두 담는 쪽으로)
+    dtype = np.result_type(values.dtype, added.dtype)
+    return np.insert(values.astype(dtype, copy=False), at, added.astype(dtype, copy=False))
+
+
+def _extend_cumulative(cumulative: np.ndarray, amounts: np.ndarray, start: int) -> np.ndarray:
+    # 앞에 0을 붙인 누적합 (cum[i] = 앞의 i개 행 합계) 을 start 행부터 다시 더한다.
+    # cum[start] 에서 이어 더하므로 처음부터 더한 것과 값이 같다
+    head = cumulative[:start + 1].astype(amounts.dtype, copy=False)
+    return np.concatenate([head[:-1], np.cumsum(np.concatenate([head[-1:], amounts[start:]]))])
+
+
+@dataclass(frozen=True)
+class BalanceIndex:
+    """지출일 정렬 원장의 집행 금액 누적합 (전체 + 계좌별). 지출일이 없는 행은 제외.
+
+    - dates / amounts / cumulative: 전체 원장 (지출일 순, 같은 날은 원래 순서)
+    - account_keys / account_amounts / account_cumulative: 계좌가 있는 행을
+      (계좌 코드, 지출일) 순으로. 계좌별 구간은 account_offsets[code]:account_offsets[code + 1]
+    - account_codes: 계좌 키 -> 코드 (accounts 위치)
+    """
+
+    keys: tuple[str, ...]
+    accounts: tuple[Hashable, ...]
+    account_codes: dict[Hashable, int]
+    dates: np.ndarray
+    amounts: np.ndarray
+    cumulative: np.ndarray
+    account_keys: np.ndarray
+    account_amounts: np.ndarray
+    account_cumulative: np.ndarray
+    account_offsets: np.ndarray
+
+    @classmethod
+    def empty(cls, keys: Iterable[str]) -> BalanceIndex:
+        """행이 없는 인덱스."""
+        zero = np.zeros(1, dtype=np.int64)
+        return cls(
+            keys=tuple(keys),
+            accounts=(),
+            account_codes={},
+            dates=np.empty(0, dtype="datetime64[ns]"),
+            amounts=np.empty(0, dtype=np.int64),
+            cumulative=zero,
+            account_keys=np.empty(0, dtype=ACCOUNT_KEY),
+            account_amounts=np.empty(0, dtype=np.int64),
+            account_cumulative=zero,
+            account_offsets=zero,
+        )
+
+    @classmethod
+    def build(cls, daily: pd.DataFrame, keys: Iterable[str] | None = None) -> BalanceIndex:
+        """원장에서 인덱스를 만든다."""
+        return cls.empty(keys or account_keys(daily)).extend(daily)
+
+    def extend(self, new_rows: pd.DataFrame) -> BalanceIndex:
+        """추가된 행을 반영한 새 인덱스 (기존 인덱스는 그대로 둔다).
+
+        추가분만 정렬해 기존 정렬 배열에 끼워 넣으므로 비용은 추가 행 수의 정렬과
+        배열 복사, 첫 삽입 위치 뒤의 누적합이다.
+        """
+        if new_rows.empty:
+            return self
+        codes, accounts = self._factorize(new_rows, self.keys, self.accounts)
+        dates, amounts = self._raw(new_rows)
+        valid = ~np.isnat(dates)
+        dates, amounts, codes = dates[valid], amounts[valid], codes[valid]
+
+        # 같은 날은 기존 행 뒤, 추가분끼리는 원래 순서 (전체를 안정 정렬한 것과 같은 순서)
+        order = np.argsort(dates, kind="stable")
+        at = _positions(self.dates, dates[order])
+        merged = _merge(self.amounts, at, amounts[order])
+
+        with_account = codes >= 0
+        added_keys = np.empty(int(with_account.sum()), dtype=ACCOUNT_KEY)
+        added_keys["code"], added_keys["date"] = codes[with_account], dates[with_account]
+        account_order = np.lexsort((added_keys["date"], added_keys["code"]))
+        account_at = _positions(self.account_keys, added_keys[account_order])
+        account_keys = np.insert(self.account_keys, account_at, added_keys[account_order])
+        account_merged = _merge(self.account_amounts, account_at, amounts[with_account][account_order])
+        known = len(self.accounts)
+
+        return BalanceIndex(
+            keys=self.keys,
+            accounts=accounts,
+            account_codes=self.account_codes | {a: code for code, a in enumerate(accounts[known:], known)},
+            dates=np.insert(self.dates, at, dates[order]),
+            amounts=merged,
+            cumulative=_extend_cumulative(self.cumulative, merged, int(at[0]) if len(at) else len(self.amounts)),
+            account_keys=account_keys,
+            account_amounts=account_merged,
+            account_cumulative=_extend_cumulative(
+                self.account_cumulative,
+                account_merged,
+                int(account_at[0]) if len(account_at) else len(self.account_amounts),
+            ),
+            account_offsets=np.searchsorted(account_keys["code"], np.arange(len(accounts) + 1)),
+        )
+
+    @staticmethod
+    def _raw(daily: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+        dates = daily["지출일"].to_numpy(dtype="datetime64[ns]")
+        amounts = daily["집행 금액"].fillna(0)
+        # int64 원장은 누적합도 정수로 계산 (큰 금액에서도 오차 없음)
+        amounts = amounts.to_numpy(dtype=np.int64 if amounts.dtype == np.int64 else float)
+        return dates, amounts
+
+    @staticmethod
+    def _factorize(
+        daily: pd.DataFrame, keys: tuple[str, ...], known: tuple[Hashable, ...]
+    ) -> tuple[np.ndarray, tuple[Hashable, ...]]:
+        # 계좌 키 -> 정수 코드 (기존 코드는 유지, 새 계좌는 뒤에 추가, 결측은 -1)
+        missing = daily[list(keys)].isna().any(axis=1).to_numpy()
+        if len(keys) == 1:
+            values = pd.Index(daily[keys[0]])
+        else:
+            values = pd.MultiIndex.from_frame(daily[list(keys)])
+        known_set = set(known)
+        accounts = known + tuple(a for a in values[~missing].unique() if a not in known_set)
+        if len(keys) == 1:
+            lookup = pd.Index(accounts, dtype=object)
+        else:
+            lookup = pd.MultiIndex.from_tuples(accounts, names=list(keys))
+        codes = lookup.get_indexer(values).astype(np.int64)
+        codes[missing] = -1
+        return codes, accounts
+
+    def _codes(self, accounts: Iterable[Hashable]) -> np.ndarray:
+        # 계좌 키 -> 코드 (없는 계좌는 -1)
+        return np.fromiter((self.account_codes.get(a, -1) for a in accounts), dtype=np.int64)
+
+    def _account_lookup(self, when: np.ndarray, codes: np.ndarray, side: str) -> np.ndarray:
+        # (when, code) 쌍마다 계좌 잔액: 키 배열에서 이진 탐색 한 번 (없는 계좌는 0)
+        known = codes >= 0
+        safe = np.where(known, codes, 0)
+        query = np.empty(np.broadcast_shapes(np.shape(when), np.shape(safe)), dtype=ACCOUNT_KEY)
+        query["code"], query["date"] = safe, when
+        pos = np.searchsorted(self.account_keys, query, side=side)
+        balance = self.account_cumulative[pos] - self.account_cumulative[self.account_offsets[safe]]
+        return np.where(known, balance, 0)
+
+    def _lookup(self, when, account: Hashable | None, side: str) -> np.ndarray | float:
+        when = np.asarray(pd.to_datetime(when), dtype="datetime64[ns]")
+        if account is None:
+            return self.cumulative[np.searchsorted(self.dates, when, side=side)]
+        return self._account_lookup(when, np.int64(self.account_codes.get(account, -1)), side)
+
+    def balance_at(self, when, account: Hashable | None = None) -> float:
+        """when 까지(당일 포함) 집행 금액 합계. account 가 없으면 전체."""
+        return float(self._lookup(when, account, "right"))
+
+    def balance_before(self, when, account: Hashable | None = None) -> float:
+        """when 이전(당일 제외) 집행 금액 합계."""
+        return float(self._lookup(when, account, "left"))
+
+    def balances_at(self, whens, account: Hashable | None = None) -> np.ndarray:
+        """여러 시점의 잔액을 한 번에 (당일 포함)."""
+        return np.asarray(self._lookup(whens, account, "right"), dtype=float)
+
+    def opening_balances(self, when, accounts: Iterable[Hashable]) -> np.ndarray:
+        """계좌 목록 각각의 when 이전 잔액."""
+        when = np.datetime64(pd.Timestamp(when), "ns")
+        return self._account_lookup(when, self._codes(accounts), "left").astype(float)
@@ -0,0 +1,223 @@
+"""기간별 자금일보 일괄 생성.
+
+시작일~종료일을 일·영업일·월 단위 기간으로 나누어 기간마다 계좌별 현황과
+입금·출금 항목별 합계를 만든다. 기간별 입출금 집계는 집계 큐브에서 구하고,
+계좌별 기초잔액은 첫 기간만 잔액 인덱스에서 조회한 뒤 이전 기간 기초잔액 +
+잔액 변동분으로 이어 간다. 기간 하나는 몇 밀리초면 끝나므로 기본은 한
+프로세스에서 계산하고, 프로세스 수를 지정했거나 기간이 아주 많을 때만 기간을
+나눠 프로세스 풀에서 계산한다 (프로세스마다 자기 기간의 큐브 조각만 보냄).
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import pandas as pd
+
+from .balance import BalanceIndex
+from .cube import DailyCube
+from .ledger import SUMMARY_COLUMNS, account_keys
+from .statement import build_statement, month_range
+
+# 기간 단위: 일, 영업일(월~금), 월
+FREQUENCIES = {"D": "일", "B": "영업일", "M": "월"}
+
+# 프로세스 수를 지정하지 않았을 때 프로세스 풀을 쓰는 최소 기간 수
+PARALLEL_MIN_PERIODS = 5000
+
+
+@dataclass(frozen=True)
+class Period:
+    """보고 기간 [start, end] (end 는 종료일 23:59:59)."""
+
+    label: str
+    start: pd.Timestamp
+    end: pd.Timestamp
+
+
+@dataclass(frozen=True)
+class PeriodReport:
+    """기간별 자금일보 (inflow/outflow: 현금흐름 중분류별 금액)."""
+
+    period: Period
+    accounts: pd.DataFrame | None
+    inflow: pd.Series
+    outflow: pd.Series
+
+
+@dataclass(frozen=True)
+class BatchReport:
+    """일괄 생성 결과 (statement: 기간에 걸친 월별 현금흐름표)."""
+
+    periods: list[PeriodReport]
+    statement: pd.DataFrame | None
+
+
+def _day_end(day: pd.Timestamp) -> pd.Timestamp:
+    return day + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+
+
+def make_periods(start, end, freq: str = "D") -> list[Period]:
+    """start~end 를 freq 단위 기간으로 나눈다. 월 단위의 첫·끝 기간은 범위로 자른다."""
+    if freq not in FREQUENCIES:
+        raise ValueError(f"지원하지 않는 기간 단위: {freq} ({', '.join(FREQUENCIES)})")
+    start, end = pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()
+    if freq == "M":
+        periods = []
+        for month in pd.period_range(start, end, freq="M"):
+            first = max(month.start_time, start)
+            last = min(month.end_time.normalize(), end)
+            periods.append(Period(f"{month.year}년 {month.month:02d}월", first, _day_end(last)))
+        return periods
+    days = pd.date_range(start, end, freq=freq)
+    return [Period(day.strftime("%Y-%m-%d"), day, _day_end(day)) for day in days]
+
+
+def _period_flows(cube: DailyCube, periods: list[Period], next_starts: list[pd.Timestamp]) -> list[tuple]:
+    """기간별 (계좌별 입출금, 잔액 변동분, 입금 항목별, 출금 항목별)."""
+    flows = []
+    for period, next_start in zip(periods, next_starts):
+        breakdown = cube.breakdown(period.start, period.end)
+        flows.append((
+            cube.by_account(period.start, period.end),
+            cube.net_by_account(period.start, next_start, inclusive="left"),
+            breakdown["입금"].dropna(),
+            breakdown["출금"].dropna(),
+        ))
+    return flows
+
+
+def _chunks(items: list, count: int) -> list[list]:
+    size = -(-len(items) // count)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def period_reports(
+    daily: pd.DataFrame,
+    accounts: pd.DataFrame | None,
+    periods: list[Period],
+    balances: BalanceIndex | None = None,
+    cube: DailyCube | None = None,
+    max_workers: int | None = None,
+) -> list[PeriodReport]:
+    """기간별 자금일보.
+
+    계좌별 현황은 화면의 계좌별 현황 표와 같은 정의(입금·출금은 계좌 대체
+    제외)이고, 다음 기간 기초잔액은 이 기간 기초잔액에 다음 기간 시작 전까지의
+    집행 금액 합계(계좌 대체 포함)를 더해 구한다. 항목별 합계는 기간 전체
+    [start, end] 기준이다. max_workers 가 없으면 기간이 PARALLEL_MIN_PERIODS 개
+    이상일 때만 CPU 수만큼 프로세스를 쓴다.
+    """
+    if not periods:
+        return []
+    balances = balances if balances is not None else BalanceIndex.build(daily)
+    cube = cube if cube is not None else DailyCube.build(daily)
+    next_starts = [p.start for p in periods[1:]] + [periods[-1].end + pd.Timedelta(seconds=1)]
+
+    if max_workers is None:
+        max_workers = (os.cpu_count() or 1) if len(periods) >= PARALLEL_MIN_PERIODS else 1
+    workers = min(len(periods), max_workers)
+    if workers <= 1:
+        flows = _period_flows(cube, periods, next_starts)
+    else:
+        chunks = _chunks(periods, workers)
+        starts = _chunks(next_starts, workers)
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=len(chunks), mp_context=context) as pool:
+            parts = pool.map(
+                _period_flows,
+                [cube.window(chunk[0].start, ends[-1]) for chunk, ends in zip(chunks, starts)],
+                chunks,
+                starts,
+            )
+            flows = [flow for part in parts for flow in part]
+
+    opening = None
+    if accounts is not None:
+        keys = account_keys(daily, accounts)
+        index = pd.MultiIndex.from_frame(accounts[keys]) if len(keys) > 1 else pd.Index(accounts[keys[0]])
+        opening = balances.opening_balances(periods[0].start, index)
+        base = accounts[["구분", "금융사", "계좌번호"]].reset_index(drop=True)
+
+    reports = []
+    for period, (by_account, net, inflow, outflow) in zip(periods, flows):
+        summary = None
+        if opening is not None:
+            totals = by_account.reindex(index, fill_value=0.0)
+            deposits = totals["입금"].to_numpy(dtype=float)
+            withdrawals = totals["출금"].to_numpy(dtype=float)
+            summary = base.copy()
+            summary["기초잔액"] = opening
+            summary["입금"] = deposits
+            summary["출금"] = -withdrawals
+            summary["기말잔액"] = opening + deposits - withdrawals
+            summary = summary[SUMMARY_COLUMNS]
+            opening = opening + net.reindex(index, fill_value=0.0).to_numpy(dtype=float)
+        reports.append(PeriodReport(period, summary, inflow, outflow))
+    return reports
+
+
+def batch_report(
+    daily: pd.DataFrame,
+    accounts: pd.DataFrame | None,
+    cashflow: pd.DataFrame | None,
+    start,
+    end,
+    freq: str = "D",
+    max_workers: int | None = None,
+) -> BatchReport:
+    """start~end 의 기간별 자금일보와 해당 월들의 현금흐름표."""
+    periods = make_periods(start, end, freq)
+    reports = period_reports(daily, accounts, periods, max_workers=max_workers)
+    statement = None
+    if cashflow is not None and not cashflow.empty:
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        statement = build_statement(cashflow, month_range(start.year, start.month, end.year, end.month))
+    return BatchReport(reports, statement)
+
+
+def _by_period(reports: list[PeriodReport], attribute: str) -> pd.DataFrame:
+    # 중분류 × 기간 행렬
+    columns = {report.period.label: getattr(report, attribute) for report in reports}
+    frame = pd.DataFrame(columns).fillna(0.0)
+    frame.index.name = "중분류"
+    frame["합계"] = frame.sum(axis=1)
+    return frame.reset_index()
+
+
+def report_tables(report: BatchReport) -> dict[str, pd.DataFrame]:
+    """출력용 표 (표 이름 -> DataFrame)."""
+    tables = {}
+    summaries = [
+        r.accounts.assign(기간=r.period.label)[["기간"] + SUMMARY_COLUMNS]
+        for r in report.periods
+        if r.accounts is not None
+    ]
+    if summaries:
+        tables["계좌별 현황"] = pd.concat(summaries, ignore_index=True)
+    tables["입금 항목별"] = _by_period(report.periods, "inflow")
+    tables["출금 항목별"] = _by_period(report.periods, "outflow")
+    if report.statement is not None:
+        tables["현금흐름표"] = report.statement
+    return tables
+
+
+def write_report(report: BatchReport, path: str) -> None:
+    """확장자에 따라 Excel(.xlsx, 표마다 시트) 또는 HTML 한 파일로 저장한다."""
+    tables = report_tables(report)
+    if path.lower().endswith(".xlsx"):
+        with pd.ExcelWriter(path, engine="openpyxl") as writer:
+            for name, table in tables.items():
+                table.to_excel(writer, sheet_name=name, index=False)
+        return
+    sections = [
+        f"<h2>{name}</h2>\n" + table.to_html(index=False, na_rep="", float_format=lambda x: f"{x:,.0f}")
+        for name, table in tables.items()
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<html><head><meta charset="utf-8"><title>자금일보</title></head><body>\n')
+        f.write("\n".join(sections))
+        f.write("\n</body></html>\n")
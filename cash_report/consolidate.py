@@ -0,0 +1,219 @@
+"""여러 워크북(법인·연도별)을 읽어 하나의 통합 원장으로 합친다.
+
+워크북마다 `load_cached_workbook` 으로 읽는다. 캐시가 유효한 파일은 현재
+프로세스에서 바로 읽고, 다시 파싱해야 하는 파일이 둘 이상이면 프로세스 풀에서
+나눠 읽는다 (openpyxl 파싱은 CPU 작업이라 스레드로는 빨라지지 않는다).
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import NamedTuple
+
+import pandas as pd
+
+from .loader import CASHFLOW_BASE_COLUMNS, ProgressCallback, WorkbookFrames, WorkbookKey
+from .schema import DIRECTION_COLUMN, NO_FLOW, apply_ledger_schema
+from .sidecar import is_fresh, load_cached_workbook
+
+# 통합 원장에 붙는 출처 컬럼
+SOURCE_COLUMN = "원본파일"
+ENTITY_COLUMN = "법인"
+TAG_COLUMNS = [SOURCE_COLUMN, ENTITY_COLUMN]
+
+# 읽을 수 있는 워크북 확장자
+SUPPORTED_EXTS = (".xlsx", ".xlsm", ".xls")
+
+# 파일 이름에서 법인명을 구분하는 문자 (예: ACOT_2025.xlsm -> ACOT)
+ENTITY_SEPARATOR = "_"
+
+
+@dataclass(frozen=True)
+class ConsolidatedFrames:
+    """여러 워크북을 합친 결과.
+
+    - workbooks: 워크북별 원본 프레임 (keys 와 같은 순서)
+    - daily / accounts: 원본파일·법인 컬럼이 붙은 통합 원장과 계좌 마스터
+    - version: 워크북 해시 목록. 파생 구조 캐시의 키로 쓴다
+    - parent_version / appended: 이전 버전에 행만 추가된 경우 그 버전과 추가된 행
+      (추가분이 없으면 appended 는 None)
+    """
+
+    keys: tuple[WorkbookKey, ...]
+    workbooks: tuple[WorkbookFrames, ...]
+    daily: pd.DataFrame
+    accounts: pd.DataFrame | None
+    version: tuple[str, ...] = ()
+    parent_version: tuple[str, ...] = ()
+    appended: pd.DataFrame | None = None
+
+    @property
+    def entities(self) -> list[str]:
+        return sorted({entity_name(key.path) for key in self.keys})
+
+    def select(self, entities) -> SelectedFrames:
+        """선택한 법인의 원장·계좌 마스터·현금흐름표."""
+        appended = self.appended
+        if set(entities) == set(self.entities):
+            daily, accounts = self.daily, self.accounts
+        else:
+            daily = self.daily[self.daily[ENTITY_COLUMN].isin(entities)]
+            accounts = self.accounts
+            if accounts is not None:
+                accounts = accounts[accounts[ENTITY_COLUMN].isin(entities)]
+            if appended is not None:
+                appended = appended[appended[ENTITY_COLUMN].isin(entities)]
+        workbooks = [f for f in self.workbooks if entity_name(f.key.path) in entities]
+        cashflow, skipped = combine_cashflow(workbooks)
+        return SelectedFrames(daily, accounts, cashflow, skipped, appended)
+
+
+class SelectedFrames(NamedTuple):
+    """법인 선택 결과 (skipped: 현금흐름표 합산에서 제외된 파일)."""
+
+    daily: pd.DataFrame
+    accounts: pd.DataFrame | None
+    cashflow: pd.DataFrame
+    skipped: list[str]
+    appended: pd.DataFrame | None
+
+
+def discover_workbooks(folder: str, exts=SUPPORTED_EXTS) -> list[str]:
+    """폴더 안의 엑셀 파일 경로 목록 (임시 파일 ~$ 제외, 이름순)."""
+    return sorted(
+        os.path.join(folder, name)
+        for name in os.listdir(folder)
+        if os.path.splitext(name)[1].lower() in exts and not name.startswith("~$")
+    )
+
+
+def entity_name(path: str) -> str:
+    """파일 이름의 첫 부분을 법인명으로 쓴다."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return stem.split(ENTITY_SEPARATOR, 1)[0]
+
+
+def load_workbooks(
+    keys: list[WorkbookKey],
+    max_workers: int | None = None,
+    progress: ProgressCallback | None = None,
+    file_progress: ProgressCallback | None = None,
+) -> list[WorkbookFrames]:
+    """워크북들을 읽는다. 다시 파싱할 파일이 여럿이면 프로세스 풀을 쓴다.
+
+    `progress` 는 현재 프로세스에서 Daily 시트를 읽을 때의 행 진행 상황,
+    `file_progress` 는 (완료 파일 수, 전체 파일 수, 경과 초) 이다.
+    """
+    started = time.perf_counter()
+    results: dict[WorkbookKey, WorkbookFrames] = {}
+    stale = [key for key in keys if not is_fresh(key)]
+
+    def finished(key: WorkbookKey, frames: WorkbookFrames) -> None:
+        results[key] = frames
+        if file_progress is not None:
+            file_progress(len(results), len(keys), time.perf_counter() - started)
+
+    for key in keys:
+        if key not in stale:
+            finished(key, load_cached_workbook(key))
+
+    workers = min(len(stale), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        for key in stale:
+            finished(key, load_cached_workbook(key, progress=progress))
+    else:
+        # 서버 스레드가 있는 프로세스를 fork 하지 않도록 spawn 사용
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = {pool.submit(load_cached_workbook, key): key for key in stale}
+            for future in as_completed(futures):
+                finished(futures[future], future.result())
+
+    return [results[key] for key in keys]
+
+
+def _tag(frame: pd.DataFrame, key: WorkbookKey) -> pd.DataFrame:
+    return frame.assign(**{
+        SOURCE_COLUMN: os.path.basename(key.path),
+        ENTITY_COLUMN: entity_name(key.path),
+    })
+
+
+def consolidate(workbooks: list[WorkbookFrames]) -> ConsolidatedFrames:
+    """워크북별 원장과 계좌 마스터를 출처를 붙여 하나로 합친다.
+
+    같은 법인의 워크북이 여럿(연도별)이면 가장 이른 워크북만 이월잔액 행
+    (입금·출금이 모두 비어 있는 행)을 유지한다. 뒤 워크북의 이월잔액은 앞
+    워크북의 거래 합계와 같으므로 그대로 두면 잔액이 두 번 더해진다.
+    """
+    first_date = {
+        frames.key: frames.daily["지출일"].min() for frames in workbooks
+    }
+    earliest: dict[str, WorkbookKey] = {}
+    for frames in sorted(workbooks, key=lambda f: (pd.isna(first_date[f.key]), first_date[f.key])):
+        earliest.setdefault(entity_name(frames.key.path), frames.key)
+
+    def prepare(frames: WorkbookFrames, daily: pd.DataFrame) -> pd.DataFrame:
+        if earliest[entity_name(frames.key.path)] != frames.key:
+            daily = daily[daily[DIRECTION_COLUMN] != NO_FLOW]
+        return _tag(daily, frames.key)
+
+    ledgers = [prepare(frames, frames.daily) for frames in workbooks]
+    daily = apply_ledger_schema(pd.concat(ledgers, ignore_index=True), TAG_COLUMNS)
+
+    # 행만 추가된 워크북의 추가분 (파생 구조를 이어서 갱신할 때 사용)
+    tails = [
+        prepare(frames, frames.daily.iloc[frames.tail_start:])
+        for frames in workbooks
+        if frames.tail_start is not None
+    ]
+
+    # 계좌 마스터는 법인·계좌번호별로 가장 최근 워크북 것을 사용
+    masters = [
+        _tag(frames.accounts, frames.key)
+        for frames in sorted(workbooks, key=lambda f: (pd.isna(first_date[f.key]), first_date[f.key]))
+        if frames.accounts is not None
+    ]
+    accounts = None
+    if masters:
+        accounts = pd.concat(masters, ignore_index=True)
+        accounts = accounts.drop_duplicates([ENTITY_COLUMN, "계좌번호"], keep="last").reset_index(drop=True)
+
+    return ConsolidatedFrames(
+        keys=tuple(frames.key for frames in workbooks),
+        workbooks=tuple(workbooks),
+        daily=daily,
+        accounts=accounts,
+        version=tuple(frames.key.sha256 for frames in workbooks),
+        parent_version=tuple(
+            frames.parent_sha256 if frames.tail_start is not None else frames.key.sha256
+            for frames in workbooks
+        ),
+        appended=apply_ledger_schema(pd.concat(tails, ignore_index=True), TAG_COLUMNS) if tails else None,
+    )
+
+
+def combine_cashflow(workbooks: list[WorkbookFrames]) -> tuple[pd.DataFrame, list[str]]:
+    """월별_CashFlow 행렬을 합친다.
+
+    행 구성(CODE 순서)이 첫 워크북과 같은 워크북만 합치며, 같은 월은 더하고
+    없는 월은 이어 붙인다. 구성이 달라 제외한 파일 이름 목록을 함께 돌려준다.
+    """
+    base = workbooks[0].cashflow[CASHFLOW_BASE_COLUMNS].reset_index(drop=True)
+    months, skipped = [], []
+    for frames in workbooks:
+        cashflow = frames.cashflow.reset_index(drop=True)
+        if len(cashflow) != len(base) or not cashflow["CODE"].equals(base["CODE"]):
+            skipped.append(os.path.basename(frames.key.path))
+            continue
+        months.append(cashflow.drop(columns=CASHFLOW_BASE_COLUMNS))
+
+    values = pd.concat(months, axis=1)
+    if values.columns.has_duplicates:
+        values = values.T.groupby(level=0).sum(min_count=1).T
+    values = values[sorted(values.columns.unique())]
+    return pd.concat([base, values], axis=1), skipped
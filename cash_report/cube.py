@@ -0,0 +1,202 @@
+"""일 단위 집계 큐브.
+
+원장을 (일자, 계좌, 현금흐름 대분류, 현금흐름 중분류, 입출금 방향) 단위로 한 번
+합산해 둔다. 자금일보 탭의 상단 지표, 계좌별 입출금, 중분류별 입출금, 일별
+추이는 모두 이 큐브의 기간 조각을 다시 묶는 것으로 계산하므로, 조회 비용은
+원장 행 수가 아니라 기간 안의 일수(셀 수)에 비례한다. 주·월·분기 단위 셀도
+함께 만들어 두어 긴 기간의 추이는 구간 수에 비례하는 비용으로 구한다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from .ledger import TRANSFER_CATEGORY, account_keys
+from .schema import DIRECTION_COLUMN, INFLOW, OUTFLOW, concat_rows
+
+DAY_COLUMN = "지출일"
+
+CATEGORY_COLUMNS = ["현금흐름 대분류", "현금흐름 중분류"]
+MEASURE_COLUMNS = ["입금", "출금", "집행 금액", "절대금액", "건수"]
+
+# 추이 집계 단위 (주는 월요일 시작). 일 단위 외에는 큐브에 구간 셀을 미리 만들어 둔다
+GRAINS = {"D": "일", "W": "주", "M": "월", "Q": "분기"}
+ROLLUP_GRAINS = ["W", "M", "Q"]
+
+# 추이 그래프 한 장에 그릴 최대 구간 수 (auto_grain 기준)
+MAX_TREND_POINTS = 120
+
+
+def _cells(daily: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    # 원장 -> 일 단위 셀 (지출일이 없는 행은 제외)
+    daily = daily[daily["지출일"].notna()]
+    frame = pd.DataFrame({
+        DAY_COLUMN: daily["지출일"].dt.normalize(),
+        **{key: daily[key] for key in keys + CATEGORY_COLUMNS + [DIRECTION_COLUMN]},
+        "입금": daily["입금"],
+        "출금": daily["출금"],
+        "집행 금액": daily["집행 금액"],
+        "절대금액": daily["집행 금액"].abs(),
+        "건수": 1,
+    })
+    return _regroup(frame, keys)
+
+
+def _regroup(cells: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    dims = [DAY_COLUMN] + keys + CATEGORY_COLUMNS + [DIRECTION_COLUMN]
+    return (
+        cells.groupby(dims, dropna=False, sort=True, observed=True)[MEASURE_COLUMNS]
+        .sum()
+        .reset_index()
+    )
+
+
+def _bucket_start(days, grain: str):
+    # 일자가 속한 grain 구간의 시작일
+    return days.to_period(grain).start_time if isinstance(days, pd.Timestamp) else days.dt.to_period(grain).dt.start_time
+
+
+def _rollup(cells: pd.DataFrame, keys: list[str], grain: str) -> pd.DataFrame:
+    # 일 단위 셀 -> grain 단위 셀 (지출일 컬럼은 구간 시작일)
+    return _regroup(cells.assign(**{DAY_COLUMN: _bucket_start(cells[DAY_COLUMN], grain)}), keys)
+
+
+def auto_grain(start, end, max_points: int = MAX_TREND_POINTS) -> str:
+    """[start, end] 추이를 max_points 개 이하 구간으로 그리는 가장 작은 집계 단위."""
+    days = (pd.Timestamp(end).normalize() - pd.Timestamp(start).normalize()).days + 1
+    for grain, size in [("D", 1), ("W", 7), ("M", 30.4), ("Q", 91.3)]:
+        if days / size <= max_points:
+            return grain
+    return "Q"
+
+
+@dataclass(frozen=True)
+class DailyCube:
+    """일 단위 집계 셀 (지출일 순 정렬)과 주·월·분기 단위 셀 (rollups[grain])."""
+
+    keys: tuple[str, ...]
+    cells: pd.DataFrame
+    rollups: dict[str, pd.DataFrame] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, daily: pd.DataFrame) -> DailyCube:
+        keys = account_keys(daily)
+        cells = _cells(daily, keys)
+        return cls(tuple(keys), cells, {grain: _rollup(cells, keys, grain) for grain in ROLLUP_GRAINS})
+
+    def extend(self, new_rows: pd.DataFrame) -> DailyCube:
+        """추가된 행을 반영한 새 큐브 (추가분만 셀로 만든 뒤 기존 셀과 합친다)."""
+        if new_rows.empty:
+            return self
+        keys = list(self.keys)
+        added = _cells(new_rows, keys)
+        merged = concat_rows([self.cells, added])
+        rollups = {
+            grain: _regroup(concat_rows([cells, _rollup(added, keys, grain)]), keys)
+            for grain, cells in self.rollups.items()
+        }
+        return DailyCube(self.keys, _regroup(merged, keys), rollups)
+
+    @property
+    def days(self) -> np.ndarray:
+        return self.cells[DAY_COLUMN].to_numpy(dtype="datetime64[ns]")
+
+    def slice(
+        self,
+        start,
+        end,
+        inclusive: str = "both",
+        exclude_transfer: bool = True,
+        direction: int | None = None,
+    ) -> pd.DataFrame:
+        """기간 안의 셀. inclusive 는 Series.between 과 같은 의미 ("both", "right", ...)."""
+        days = self.days
+        start = np.datetime64(pd.Timestamp(start), "ns")
+        end = np.datetime64(pd.Timestamp(end), "ns")
+        lo = np.searchsorted(days, start, side="left" if inclusive in ("both", "left") else "right")
+        hi = np.searchsorted(days, end, side="right" if inclusive in ("both", "right") else "left")
+        cells = self.cells.iloc[lo:hi]
+        if exclude_transfer:
+            cells = cells[cells["현금흐름 대분류"] != TRANSFER_CATEGORY]
+        if direction is not None:
+            cells = cells[cells[DIRECTION_COLUMN] == direction]
+        return cells
+
+    def window(self, start, end) -> DailyCube:
+        """[start, end] 일 단위 셀만 담은 작은 큐브 (구간 셀 없음, 프로세스 간 전달용)."""
+        return DailyCube(self.keys, self.slice(start, end, exclude_transfer=False))
+
+    def totals(self, start, end, inclusive: str = "both") -> pd.Series:
+        """기간 합계 (계좌 대체 제외)."""
+        return self.slice(start, end, inclusive)[MEASURE_COLUMNS].sum()
+
+    def by_account(self, start, end, inclusive: str = "both") -> pd.DataFrame:
+        """계좌별 입금·출금 합계 (계좌 대체 제외)."""
+        cells = self.slice(start, end, inclusive)
+        return cells.groupby(list(self.keys), sort=False, observed=True)[["입금", "출금"]].sum()
+
+    def net_by_account(self, start, end, inclusive: str = "both") -> pd.Series:
+        """계좌별 집행 금액 합계 (계좌 대체·이월잔액 포함, 잔액 변동분)."""
+        cells = self.slice(start, end, inclusive, exclude_transfer=False)
+        return cells.groupby(list(self.keys), sort=False, dropna=False, observed=True)["집행 금액"].sum()
+
+    def breakdown(self, start, end, inclusive: str = "both") -> pd.DataFrame:
+        """현금흐름 중분류별 입금·출금 합계 (계좌 대체 제외, 한 번의 groupby).
+
+        입금은 입금 거래의 집행 금액 합계, 출금은 출금 거래의 집행 금액 절댓값
+        합계이다. 해당 방향 거래가 없는 중분류는 NaN 이다.
+        """
+        cells = self.slice(start, end, inclusive)
+        sums = cells.groupby(["현금흐름 중분류", DIRECTION_COLUMN], observed=True)[["집행 금액", "절대금액"]].sum()
+        amounts = sums["집행 금액"].unstack(DIRECTION_COLUMN)
+        absolute = sums["절대금액"].unstack(DIRECTION_COLUMN)
+        return pd.DataFrame(
+            {"입금": amounts.get(INFLOW), "출금": absolute.get(OUTFLOW)},
+            index=amounts.index,
+        )
+
+    def by_day(self, start, end, inclusive: str = "both") -> pd.DataFrame:
+        """일별 입금·출금 합계 (계좌 대체 제외, 거래가 있는 날만)."""
+        cells = self.slice(start, end, inclusive)
+        return cells.groupby(DAY_COLUMN)[["입금", "출금"]].sum().reset_index()
+
+    def by_period(self, start, end, grain: str = "D", inclusive: str = "both") -> pd.DataFrame:
+        """grain 단위 입금·출금 합계 (계좌 대체 제외, 거래가 있는 구간만).
+
+        지출일 컬럼은 구간 시작일이다. 기간 안에 통째로 들어가는 구간은 미리
+        만든 구간 셀에서, 기간 경계에 걸친 첫·끝 구간은 일 단위 셀에서 더한다.
+        """
+        if grain == "D" or grain not in self.rollups:
+            return self.by_day(start, end, inclusive)
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        day = pd.Timedelta(days=1)
+
+        # 기간에 포함되는 첫날·마지막 날 (셀의 지출일은 자정)
+        first = start.normalize()
+        if first != start or inclusive not in ("both", "left"):
+            first += day
+        last = end.normalize()
+        if last == end and inclusive not in ("both", "right"):
+            last -= day
+        if last < first:
+            return pd.DataFrame(columns=[DAY_COLUMN, "입금", "출금"])
+
+        # 통째로 포함되는 구간은 [full_start, full_end) 에서 시작하는 구간들
+        full_start = _bucket_start(first, grain)
+        if full_start < first:
+            full_start = (first.to_period(grain) + 1).start_time
+        full_end = _bucket_start(last + day, grain)
+
+        if full_start < full_end:
+            cells = pd.concat([
+                self.slice(first, full_start, inclusive="left"),
+                DailyCube(self.keys, self.rollups[grain]).slice(full_start, full_end, inclusive="left"),
+                self.slice(full_end, last),
+            ], ignore_index=True)
+        else:
+            cells = self.slice(first, last)
+        buckets = _bucket_start(cells[DAY_COLUMN], grain)
+        return cells.groupby(buckets.rename(DAY_COLUMN))[["입금", "출금"]].sum().reset_index()
@@ -0,0 +1,78 @@
+"""입출금 상세내역 페이지 조회.
+
+기간 조회 결과에서 표시 컬럼만 한 번 잡아 두고, 검색·정렬은 행 위치 배열에서
+처리해 화면에는 한 페이지 분량만 잘라 보낸다. 검색은 categorical 컬럼이면 범주
+값에만 문자열 비교를 하고 코드로 행을 고르므로 행 수만큼 문자열을 만들지 않는다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+DETAIL_COLUMNS = ["금융사", "계좌번호", "지출일", "집행 금액", "적요", "현금흐름 대분류", "현금흐름 중분류"]
+SEARCH_COLUMNS = ["금융사", "계좌번호", "적요", "현금흐름 대분류", "현금흐름 중분류"]
+
+# 한 페이지 행 수
+PAGE_SIZE = 100
+
+
+def _contains(values: pd.Series, text: str) -> np.ndarray:
+    # 대소문자 무시 부분 문자열 포함 여부 (결측은 False)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        hits = values.cat.categories.astype("str").str.contains(text, case=False, regex=False)
+        codes = values.cat.codes.to_numpy()
+        return np.asarray(hits, dtype=bool)[codes] & (codes >= 0)
+    found = values.astype("str").str.contains(text, case=False, regex=False)
+    return found.fillna(False).to_numpy(dtype=bool)
+
+
+@dataclass(frozen=True)
+class DetailPages:
+    """상세내역 표 (frame) 와 표시 순서 (order: 표시할 frame 행 위치)."""
+
+    frame: pd.DataFrame
+    order: np.ndarray
+
+    @classmethod
+    def build(cls, rows: pd.DataFrame) -> DetailPages:
+        frame = rows[[c for c in DETAIL_COLUMNS if c in rows.columns]]
+        return cls(frame, np.arange(len(frame)))
+
+    @property
+    def count(self) -> int:
+        return len(self.order)
+
+    def total(self, column: str = "집행 금액") -> float:
+        """표시 행의 column 합계."""
+        return self.frame[column].to_numpy()[self.order].sum()
+
+    def search(self, text: str) -> DetailPages:
+        """SEARCH_COLUMNS 중 하나에 text 가 들어 있는 행만 (빈 검색어는 그대로)."""
+        text = text.strip()
+        if not text:
+            return self
+        hits = np.zeros(len(self.frame), dtype=bool)
+        for name in SEARCH_COLUMNS:
+            if name in self.frame.columns:
+                hits |= _contains(self.frame[name], text)
+        return DetailPages(self.frame, self.order[hits[self.order]])
+
+    def sort(self, column: str | None, descending: bool = False) -> DetailPages:
+        """column 기준 안정 정렬 (결측은 맨 뒤, column 이 None 이면 그대로)."""
+        if column is None:
+            return self
+        values = self.frame[column].iloc[self.order].reset_index(drop=True)
+        ranked = values.sort_values(ascending=not descending, kind="stable", na_position="last")
+        return DetailPages(self.frame, self.order[ranked.index.to_numpy()])
+
+    def pages(self, size: int = PAGE_SIZE) -> int:
+        """페이지 수 (행이 없어도 1)."""
+        return max(1, -(-self.count // size))
+
+    def page(self, number: int, size: int = PAGE_SIZE) -> pd.DataFrame:
+        """1 부터 세는 number 번째 페이지 행 (범위를 벗어나면 첫·마지막 페이지)."""
+        number = min(max(number, 1), self.pages(size))
+        return self.frame.iloc[self.order[(number - 1) * size:number * size]]
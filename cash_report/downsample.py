@@ -0,0 +1,64 @@
+"""그래프용 시계열 점 줄이기.
+
+점이 많은 시계열은 모양을 유지하는 점만 골라 그린다.
+
+- lttb: Largest-Triangle-Three-Buckets. 구간마다 앞에서 고른 점·다음 구간 평균과
+  만드는 삼각형 넓이가 가장 큰 점을 남긴다 (선 그래프).
+- extreme_indices: 구간마다 최솟값·최댓값 위치를 남긴다 (막대 그래프의 급등·급락 보존).
+
+두 함수 모두 원래 순서의 위치 배열을 돌려주므로 같은 위치로 x 값과 다른 열을
+함께 고를 수 있다.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+# 그래프 한 장에 그릴 최대 점 수 (넘으면 줄여서 그림)
+MAX_CHART_POINTS = 500
+
+
+def lttb(values, threshold: int, x=None) -> np.ndarray:
+    """values 에서 threshold 개 점의 위치 (처음·끝 점 포함, 오름차순).
+
+    점 수가 threshold 이하면 전체 위치이다. x 를 주지 않으면 등간격으로 본다.
+    """
+    y = np.nan_to_num(np.asarray(values, dtype=float))
+    size = len(y)
+    if threshold >= size or threshold < 3:
+        return np.arange(size)
+    x = np.arange(size, dtype=float) if x is None else np.asarray(x, dtype=float)
+
+    # 처음·끝 점을 뺀 나머지를 threshold - 2 개 구간으로
+    edges = (np.arange(threshold - 1) * ((size - 2) / (threshold - 2))).astype(np.int64) + 1
+    edges[-1] = size - 1
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0], keep[-1] = 0, size - 1
+    anchor = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        after = slice(hi, edges[i + 2] if i + 2 < len(edges) else size)
+        mean_x, mean_y = x[after].mean(), y[after].mean()
+        area = np.abs(
+            (x[anchor] - mean_x) * (y[lo:hi] - y[anchor]) - (x[anchor] - x[lo:hi]) * (mean_y - y[anchor])
+        )
+        anchor = lo + int(area.argmax())
+        keep[i + 1] = anchor
+    return keep
+
+
+def extreme_indices(values, buckets: int) -> np.ndarray:
+    """buckets 개 구간마다 최솟값·최댓값 위치 (오름차순, 처음·끝 점 포함).
+
+    점 수가 2 × buckets 이하면 전체 위치이다.
+    """
+    y = np.nan_to_num(np.asarray(values, dtype=float))
+    size = len(y)
+    if size <= 2 * buckets:
+        return np.arange(size)
+    starts = np.arange(buckets) * size // buckets
+    ends = np.append(starts[1:], size)
+    groups = np.repeat(np.arange(buckets), ends - starts)
+    # 구간 안에서 값 순 정렬 -> 구간 첫 자리가 최솟값, 끝 자리가 최댓값
+    order = np.lexsort((y, groups))
+    return np.unique(np.concatenate([[0, size - 1], order[starts], order[ends - 1]]))
@@ -0,0 +1,95 @@
+"""고정비 기준 현금 소진(런웨이) 예측.
+
+시나리오(월 고정비 × 증가율 × 월 유입)마다 월별 순유출 행렬을 만들고 누적
+차감으로 잔액 경로를 한 번에 구한다. 예측은 최대 `MAX_HORIZON` 개월까지만
+하므로 고정비가 0 이하여도 끝난다.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+# 최대 예측 개월 수 (10년)
+MAX_HORIZON = 120
+
+# 몬테카를로 범위 (하위 10%, 중앙값, 상위 10%)
+BAND_QUANTILES = (0.1, 0.5, 0.9)
+
+
+def average_fixed_cost(fixed_total: pd.Series, window: int = 3) -> float:
+    """최근 `window` 개월 (월 순) 고정비 평균 (고정비 월이 없으면 0)."""
+    recent = sorted(fixed_total.index)[-window:]
+    if not recent:
+        return 0.0
+    return sum(float(fixed_total[month]) for month in recent) / len(recent)
+
+
+def burn_schedule(burns, growth=0.0, inflows=0.0, horizon: int = MAX_HORIZON) -> np.ndarray:
+    """시나리오 × 월 순유출 (S, horizon).
+
+    k 번째 달 순유출은 burn × (1 + growth)^k − inflow 이다. 인자는 스칼라 또는
+    시나리오 수 길이의 배열이며 서로 브로드캐스트된다.
+    """
+    burns, growth, inflows = (np.atleast_1d(np.asarray(x, dtype=float))[:, None] for x in (burns, growth, inflows))
+    return burns * (1.0 + growth) ** np.arange(horizon) - inflows
+
+
+def project_cash(initial_cash: float, schedule: np.ndarray) -> np.ndarray:
+    """initial_cash 에서 월별 순유출을 차례로 뺀 잔액 경로 (S, horizon + 1, 첫 열은 시작 잔액)."""
+    start = np.full((schedule.shape[0], 1), float(initial_cash))
+    return np.subtract.accumulate(np.hstack([start, schedule]), axis=1)
+
+
+def runway_months(paths: np.ndarray) -> np.ndarray:
+    """경로별로 잔액이 처음 0 이하(또는 결측)가 되는 개월 수 (예측 기간 안에 없으면 -1)."""
+    depleted = ~(paths > 0)
+    return np.where(depleted.any(axis=1), depleted.argmax(axis=1), -1)
+
+
+def runway_forecast(
+    initial_cash: float,
+    monthly_burn: float,
+    start: pd.Period,
+    horizon: int = MAX_HORIZON,
+) -> tuple[pd.PeriodIndex, np.ndarray]:
+    """start 월의 기말현금에서 매월 monthly_burn 씩 줄어드는 잔액.
+
+    잔액이 0 이하가 되는 첫 달까지, 그런 달이 없으면 horizon 개월 뒤까지 포함한다.
+    """
+    path = project_cash(initial_cash, burn_schedule(monthly_burn, horizon=horizon))
+    months = runway_months(path)[0]
+    end = months + 1 if months >= 0 else path.shape[1]
+    return pd.period_range(start, periods=end, freq="M"), path[0, :end]
+
+
+def monte_carlo_bands(
+    initial_cash: float,
+    history: np.ndarray,
+    growth: float = 0.0,
+    inflow: float = 0.0,
+    draws: int = 1000,
+    horizon: int = MAX_HORIZON,
+    quantiles=BAND_QUANTILES,
+    seed: int | None = 0,
+) -> np.ndarray:
+    """월 고정비를 과거 월별 고정비의 평균·표준편차 정규분포에서 뽑은 잔액 경로의 분위수.
+
+    결과는 (분위수, horizon + 1) 배열이다. 과거 고정비가 없으면 고정비 0 으로 본다
+    (average_fixed_cost 와 같음).
+    """
+    history = np.asarray(history, dtype=float)
+    if not history.size:
+        history = np.zeros(1)
+    rng = np.random.default_rng(seed)
+    burns = rng.normal(history.mean(), history.std(), size=(draws, horizon))
+    schedule = burns * (1.0 + growth) ** np.arange(horizon) - inflow
+    return np.quantile(project_cash(initial_cash, schedule), quantiles, axis=0)
+
+
+def depletion_month(months, values) -> pd.Period | str | None:
+    """잔액이 처음 0 이하가 되는 월."""
+    for month, value in zip(months, values):
+        if value <= 0:
+            return month
+    return None
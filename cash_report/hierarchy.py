@@ -0,0 +1,68 @@
+"""현금흐름표 Level 1~4 행 계층.
+
+월별_CashFlow 의 행은 Level 순서로 나열된 트리다 (Level 1 활동 > 2 유입/유출 >
+3 구분1 > 4 구분2). 행마다 부모 행과 하위 트리의 끝 위치를 한 번 계산해 두면
+하위 항목 조회는 위치 구간 자르기, 소계는 말단 행 누적합의 차로 처리된다.
+Level 이 비어 있는 행은 바로 앞 상위 행의 말단 행으로 본다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class StatementTree:
+    """행 위치 기준 계층.
+
+    위치 i 행의 하위 트리는 위치 (i, ends[i]) 구간이고 부모는 parents[i]
+    (최상위 행은 -1) 이다. index 는 행 위치에 대응하는 원래 행 번호이다.
+    """
+
+    index: pd.Index
+    parents: np.ndarray
+    ends: np.ndarray
+
+    @classmethod
+    def build(cls, levels: pd.Series) -> StatementTree:
+        depth = pd.to_numeric(levels, errors="coerce").to_numpy(dtype=float)
+        depth = np.where(np.isnan(depth), np.inf, depth)
+        size = len(depth)
+        parents = np.full(size, -1, dtype=np.int64)
+        ends = np.full(size, size, dtype=np.int64)
+        stack: list[int] = []
+        for i, level in enumerate(depth):
+            while stack and depth[stack[-1]] >= level:
+                ends[stack.pop()] = i
+            if stack:
+                parents[i] = stack[-1]
+            stack.append(i)
+        return cls(levels.index, parents, ends)
+
+    @property
+    def leaves(self) -> np.ndarray:
+        """하위 행이 없는 행 여부 (bool 배열)."""
+        return self.ends == np.arange(1, len(self.ends) + 1)
+
+    def descendants(self, label) -> pd.Index:
+        """label 행의 하위 트리 행 번호 (자기 자신 제외, 시트 순서)."""
+        position = self.index.get_loc(label)
+        return self.index[position + 1:self.ends[position]]
+
+    def children(self, label) -> pd.Index:
+        """label 행의 바로 아래 행 번호."""
+        position = self.index.get_loc(label)
+        below = slice(position + 1, self.ends[position])
+        return self.index[below][self.parents[below] == position]
+
+    def rollup(self, values: np.ndarray) -> np.ndarray:
+        """행마다 하위 트리 말단 행 값의 합 (values: 행 × 열, 결측은 0 으로 본다).
+
+        말단 행은 자기 값 그대로이다.
+        """
+        leaf_values = np.where(self.leaves[:, None], np.nan_to_num(values), 0.0)
+        prefix = np.vstack([np.zeros((1, values.shape[1])), leaf_values.cumsum(axis=0)])
+        return prefix[self.ends] - prefix[np.arange(len(self.ends))]
@@ -0,0 +1,46 @@
+"""행 추가만 있었던 원장 버전의 파생 구조를 이어서 갱신하는 캐시."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import pandas as pd
+
+
+class AppendOnlyCache:
+    """원장 버전별 파생 구조(잔액 인덱스, 집계 큐브 등) 보관소.
+
+    요청한 버전이 없고 부모 버전이 남아 있으며 추가된 행이 주어지면
+    부모 결과의 `extend(new_rows)` 로 만들고, 그 외에는 `build(daily)` 로
+    처음부터 만든다. 최근 사용한 `max_entries` 개 버전만 유지한다.
+    """
+
+    def __init__(self, build: Callable[[pd.DataFrame], object], max_entries: int = 4):
+        self._build = build
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        version: Hashable,
+        daily: pd.DataFrame,
+        parent: Hashable | None = None,
+        new_rows: pd.DataFrame | None = None,
+    ):
+        with self._lock:
+            if version in self._entries:
+                self._entries.move_to_end(version)
+                return self._entries[version]
+            base = self._entries.get(parent) if new_rows is not None else None
+
+        value = base.extend(new_rows) if base is not None else self._build(daily)
+
+        with self._lock:
+            self._entries[version] = value
+            self._entries.move_to_end(version)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return value
@@ -0,0 +1,105 @@
+"""Daily 원장 집계."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from .consolidate import ENTITY_COLUMN
+from .schema import DIRECTION_COLUMN, INFLOW, OUTFLOW
+
+if TYPE_CHECKING:
+    from .balance import BalanceIndex
+    from .cube import DailyCube
+    from .timeline import LedgerTimeline
+
+# 입출금 합계에서 제외하는 현금흐름 대분류
+TRANSFER_CATEGORY = "계좌 대체"
+
+SUMMARY_COLUMNS = ["구분", "금융사", "계좌번호", "기초잔액", "입금", "출금", "기말잔액"]
+
+
+def is_transfer(daily: pd.DataFrame) -> pd.Series:
+    """계좌 간 대체 거래 여부."""
+    return daily["현금흐름 대분류"] == TRANSFER_CATEGORY
+
+
+def is_inflow(daily: pd.DataFrame) -> pd.Series:
+    """입금 거래 여부."""
+    return daily[DIRECTION_COLUMN] == INFLOW
+
+
+def is_outflow(daily: pd.DataFrame) -> pd.Series:
+    """출금 거래 여부."""
+    return daily[DIRECTION_COLUMN] == OUTFLOW
+
+
+def period_transactions(
+    daily: pd.DataFrame,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    timeline: LedgerTimeline | None = None,
+) -> pd.DataFrame:
+    """상세 내역용 거래: start 초과 end 이하, 계좌 대체 제외.
+
+    `timeline` 이 있으면 정렬된 원장의 기간 구간에 조건 비트맵을 적용한다 (지출일 순).
+    """
+    if timeline is not None:
+        return timeline.query(start, end, "right", exclude=[("현금흐름 대분류", TRANSFER_CATEGORY)])
+    dates = daily["지출일"]
+    return daily[(dates > start) & (dates <= end) & ~is_transfer(daily)].copy()
+
+
+def account_keys(daily: pd.DataFrame, accounts: pd.DataFrame | None = None) -> list[str]:
+    """계좌를 식별하는 컬럼. 통합 원장이면 법인이 다른 같은 계좌번호를 구분한다."""
+    if ENTITY_COLUMN in daily.columns and (accounts is None or ENTITY_COLUMN in accounts.columns):
+        return [ENTITY_COLUMN, "계좌번호"]
+    return ["계좌번호"]
+
+
+def account_summary(
+    daily: pd.DataFrame,
+    accounts: pd.DataFrame,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    balances: BalanceIndex | None = None,
+    cube: DailyCube | None = None,
+) -> pd.DataFrame:
+    """계좌별 기초잔액·입금·출금·기말잔액을 원장 한 번의 groupby 로 계산한다.
+
+    기초잔액은 start 이전 집행 금액 합계, 입금·출금은 [start, end] 기간의
+    계좌 대체를 제외한 합계이다. 출금은 음수로 표시하며, 기간 중 거래가 없는
+    계좌도 accounts 순서대로 모두 포함한다. `balances` 가 있으면 기초잔액은
+    잔액 인덱스에서 조회하고, `cube` 까지 있으면 입금·출금도 일 단위 집계
+    큐브에서 구해 원장을 훑지 않는다.
+    """
+    keys = account_keys(daily, accounts)
+    if balances is not None and cube is not None:
+        totals = cube.by_account(start, end)
+    else:
+        dates = daily["지출일"]
+        in_period = (dates >= start) & (dates <= end) & ~is_transfer(daily)
+        flows = {
+            "입금": daily["입금"].where(in_period & is_inflow(daily), 0.0),
+            "출금": daily["출금"].where(in_period & is_outflow(daily), 0.0),
+        }
+        if balances is None:
+            flows["기초잔액"] = daily["집행 금액"].where(dates < start, 0.0)
+        totals = pd.DataFrame(flows).groupby([daily[key] for key in keys], sort=False).sum()
+
+    index = pd.MultiIndex.from_frame(accounts[keys]) if len(keys) > 1 else pd.Index(accounts[keys[0]])
+    totals = totals.reindex(index, fill_value=0.0)
+
+    summary = accounts[["구분", "금융사", "계좌번호"]].reset_index(drop=True)
+    if balances is None:
+        opening = totals["기초잔액"].to_numpy(dtype=float)
+    else:
+        opening = balances.opening_balances(start, index)
+    deposits = totals["입금"].to_numpy(dtype=float)
+    withdrawals = totals["출금"].to_numpy(dtype=float)
+    summary["기초잔액"] = opening
+    summary["입금"] = deposits
+    summary["출금"] = -withdrawals
+    summary["기말잔액"] = opening + deposits - withdrawals
+    return summary[SUMMARY_COLUMNS]
@@ -0,0 +1,590 @@
+"""엑셀 워크북 로더.
+
+앱이 사용하는 시트(Daily, 자금일보, 월별_CashFlow)를 openpyxl 워크북 한 번으로
+모두 읽는다. 결과는 파일 경로·수정시각·내용 해시로 식별되는 `WorkbookKey`
+단위로 캐시할 수 있다.
+
+Daily 시트는 행 수가 많으므로 read-only 워크시트를 값만 순회하면서 일정 행 수
+단위로 컬럼별 타입 배열로 바꿔 쌓는다. 워크북 전체 바이트, 셀 리스트,
+DataFrame 을 동시에 들고 있지 않으므로 최대 메모리가 최종 프레임 크기에 가깝다.
+다 읽은 원장에는 압축 스키마(`schema.apply_ledger_schema`)를 적용한다.
+
+이전 버전을 넘기면 Daily 시트 XML 의 이미 읽은 행 바이트(`DailyPrefix`)가 그대로인지
+지문만 비교하고, 같으면 그 뒤에 추가된 행 요소만 openpyxl 로 파싱한다. 다른
+시트는 zip 항목(CRC·크기)이 같으면 이전 결과를 그대로 쓴다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import re
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from openpyxl.cell.cell import ERROR_CODES
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+
+from .schema import apply_ledger_schema, concat_rows
+
+# 시트 이름
+DAILY_SHEET = "Daily"
+REPORT_SHEET = "자금일보"
+CASHFLOW_SHEET = "월별_CashFlow"
+
+# 자금일보 시트의 계좌 표 위치 표시
+ACCOUNT_TABLE_TITLE = "계좌별 통합 현황"
+ACCOUNT_TABLE_TOTAL = "합계"
+
+# Daily 시트의 날짜/숫자 컬럼 (나머지 텍스트 컬럼은 문자열로 통일)
+DATE_COLUMN = "지출일"
+NUMERIC_COLUMNS = ["추정 금액", "입금", "출금", "집행 금액", "잔액", "CODE"]
+
+# 계좌 마스터 컬럼 (자금일보 시트 "계좌별 통합 현황" 표)
+ACCOUNT_KEY_COLUMNS = ["구분", "금융사", "계좌번호"]
+ACCOUNT_FIGURE_COLUMNS = ["기초잔액", "입금", "출금", "기말잔액"]
+
+# 자금일보 시트의 조회 기간 라벨 (오른쪽 셀이 날짜). 계좌 마스터에 같은 이름의 컬럼으로 붙인다
+REPORT_PERIOD_COLUMNS = ["시작일", "종료일"]
+
+# 월별_CashFlow 시트의 행 구분 컬럼 (D~I열), 그 뒤는 월별 금액 열
+CASHFLOW_BASE_COLUMNS = ["Level", "현금 흐름 구분", "유입/유출", "구분1", "구분2", "CODE"]
+CASHFLOW_BASE_START = 3
+
+# Daily 스트리밍 읽기 단위 (행)
+STREAM_CHUNK_ROWS = 20_000
+
+_HASH_CHUNK = 1 << 20
+
+# 시트 XML 의 행 영역 표시
+_SHEET_DATA_OPEN = b"<sheetData>"
+_SHEET_DATA_CLOSE = b"</sheetData>"
+_ROW_OPEN = b"<row"
+_ROW_CLOSE = b"</row>"
+_ROW_NUMBER = re.compile(rb'<row[^>]*?\sr="(\d+)"')
+
+# 진행 상황 콜백: (읽은 행 수, 전체 행 수 추정치 또는 None, 경과 초)
+ProgressCallback = Callable[[int, "int | None", float], None]
+
+
+@dataclass(frozen=True)
+class WorkbookKey:
+    """워크북 파일 버전 식별자."""
+
+    path: str
+    mtime_ns: int
+    sha256: str
+
+
+@dataclass(frozen=True)
+class WorkbookFrames:
+    """워크북에서 읽어 들인 시트별 데이터프레임 (타입 변환 완료).
+
+    - daily: Daily 시트. 지출일은 datetime, 금액은 float, 텍스트는 str
+    - accounts: 자금일보 시트의 계좌 마스터 (없으면 None). 시트에 조회 기간이
+      있으면 시작일·종료일 컬럼이 붙는다
+    - cashflow: 월별_CashFlow 의 행 구분 컬럼 + 월별 금액 행렬
+      (월 컬럼 이름은 Timestamp, 마지막 Level 1 행까지)
+    - daily_prefix: daily 로 읽은 Daily 시트 행 바이트의 위치와 지문 (추가분 판별용)
+    - sheet_versions: 자금일보·월별_CashFlow 시트 zip 항목의 CRC·크기
+    - tail_start / parent_sha256: 이전 버전(parent_sha256) 원장에 행만 추가된
+      경우 새 행이 시작되는 위치. 처음부터 읽었으면 None
+    """
+
+    key: WorkbookKey
+    daily: pd.DataFrame
+    accounts: pd.DataFrame | None
+    cashflow: pd.DataFrame
+    daily_prefix: DailyPrefix | None = None
+    sheet_versions: dict[str, str] = field(default_factory=dict)
+    tail_start: int | None = None
+    parent_sha256: str | None = None
+
+
+@dataclass(frozen=True)
+class DailyPrefix:
+    """Daily 시트 XML 에서 이미 읽은 행 부분.
+
+    - extent / digest: <sheetData> 안 행 요소 바이트의 길이와 지문
+    - strings / styles / shared_digest: 공유 문자열 수, 셀 서식 수와 그 문자열·
+      서식의 날짜 여부 지문 (행 바이트가 같아도 문자열 번호나 서식 번호가 가리키는
+      값이 바뀌었을 수 있음. 뒤에 추가된 문자열·서식은 앞 행과 무관)
+    """
+
+    extent: int
+    digest: str
+    strings: int
+    styles: int
+    shared_digest: str
+
+
+@lru_cache(maxsize=32)
+def _file_sha256(path: str, mtime_ns: int, size: int) -> str:
+    # mtime/size가 같으면 다시 해시하지 않도록 캐시
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def workbook_key(path: str) -> WorkbookKey:
+    """파일의 현재 버전을 나타내는 키를 계산한다."""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return WorkbookKey(path, stat.st_mtime_ns, _file_sha256(path, stat.st_mtime_ns, stat.st_size))
+
+
+def _dedup_names(names: list) -> list[str]:
+    # pd.read_excel 과 같은 규칙으로 빈/중복 헤더 이름 정리
+    seen: dict[str, int] = {}
+    result = []
+    for i, name in enumerate(names):
+        name = f"Unnamed: {i}" if pd.isna(name) else str(name)
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        result.append(name if count == 0 else f"{name}.{count}")
+    return result
+
+
+def _first_row_containing(text: pd.DataFrame, needle: str, start: int = 0) -> int | None:
+    hits = text.iloc[start:].apply(lambda col: col.str.contains(needle, regex=False)).any(axis=1)
+    return int(hits.idxmax()) if hits.any() else None
+
+
+def extract_account_master(raw: pd.DataFrame) -> pd.DataFrame | None:
+    """자금일보 시트(header=None)에서 "계좌별 통합 현황" 표를 잘라낸다."""
+    text = raw.astype(str)
+
+    # "계좌별 통합 현황" 제목 바로 아래 행이 헤더
+    summary_row = _first_row_containing(text, ACCOUNT_TABLE_TITLE)
+    if summary_row is None:
+        return None
+    header_row = summary_row + 1
+    data_start_row = header_row + 1
+
+    # 합계 행 직전까지가 계좌 목록
+    end_row = _first_row_containing(text, ACCOUNT_TABLE_TOTAL, data_start_row)
+    if end_row is None:
+        end_row = len(raw)
+
+    accounts = raw.iloc[data_start_row:end_row].copy()
+    accounts.columns = _dedup_names(raw.iloc[header_row].tolist())
+    return accounts.reset_index(drop=True).infer_objects()
+
+
+def extract_report_period(raw: pd.DataFrame) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+    """자금일보 시트(header=None)의 시작일·종료일. 라벨이나 날짜가 없으면 None."""
+    text = raw.astype(str).to_numpy()
+    dates = []
+    for label in REPORT_PERIOD_COLUMNS:
+        hits = np.argwhere(text == label)
+        if len(hits) == 0 or hits[0][1] + 1 >= raw.shape[1]:
+            return None
+        row, col = hits[0]
+        value = pd.to_datetime(raw.iat[row, col + 1], errors="coerce")
+        if pd.isna(value):
+            return None
+        dates.append(value)
+    return dates[0], dates[1]
+
+
+def _as_text(series: pd.Series) -> pd.Series:
+    # 숫자·시간 등이 섞인 텍스트 컬럼을 문자열로 통일 (결측은 유지)
+    return series.where(series.isna(), series.astype(str)).astype(object)
+
+
+def _coerce_column(name: str, values: pd.Series) -> pd.Series:
+    # Daily 컬럼 하나를 앱에서 쓰는 타입으로 변환
+    if name == DATE_COLUMN:
+        return pd.to_datetime(values, errors="coerce").astype("datetime64[ns]")
+    if name in NUMERIC_COLUMNS:
+        return pd.to_numeric(values, errors="coerce").astype(float)
+    if pd.api.types.is_numeric_dtype(values):
+        return values
+    return _as_text(values)
+
+
+def coerce_daily(daily: pd.DataFrame) -> pd.DataFrame:
+    """Daily 시트를 앱에서 쓰는 타입으로 변환한다."""
+    daily = daily.copy()
+    for col in daily.columns:
+        daily[col] = _coerce_column(col, daily[col])
+    return daily
+
+
+def _free_text(series: pd.Series) -> pd.Series:
+    # pd.read_excel 처럼 정수값 실수는 정수로 표기한 문자열 (결측은 유지)
+    series = series.map(lambda v: int(v) if isinstance(v, float) and v.is_integer() else v)
+    return _as_text(series)
+
+
+def _finish_free_column(values: np.ndarray) -> pd.Series:
+    # 타입이 정해지지 않은 컬럼: 숫자만 있으면 float, 아니면 문자열
+    # (pd.read_excel 처럼 #VALUE! 등 오류 셀은 결측 처리)
+    series = pd.Series(values, dtype=object)
+    series = series.where(~series.isin(ERROR_CODES))
+    present = series[series.notna()]
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+        return series.astype(float)
+    return _free_text(series)
+
+
+@dataclass(frozen=True)
+class DailyScan:
+    """Daily 시트 스트리밍 결과.
+
+    - frame: first_row 이후 행 (타입 변환 완료)
+    - rows: frame 의 행 수 (빈 행 제외)
+    """
+
+    frame: pd.DataFrame
+    rows: int
+
+
+def _new_digest():
+    return hashlib.blake2b(digest_size=16)
+
+
+def scan_daily(
+    worksheet,
+    *,
+    first_row: int = 2,
+    chunk_rows: int = STREAM_CHUNK_ROWS,
+    progress: ProgressCallback | None = None,
+) -> DailyScan:
+    """read-only 워크시트에서 Daily 원장을 청크 단위로 읽어 타입 변환한다.
+
+    첫 행은 헤더이며, 데이터는 first_row 행부터 읽는다. 값이 모두 비어 있는 행은
+    건너뛴다.
+    """
+    started = time.perf_counter()
+    total = worksheet.max_row - first_row + 1 if worksheet.max_row else None
+    names = _dedup_names(list(next(worksheet.iter_rows(max_row=1, values_only=True), ())))
+    rows = worksheet.iter_rows(min_row=first_row, values_only=True)
+    width = len(names)
+    typed = {name: name == DATE_COLUMN or name in NUMERIC_COLUMNS for name in names}
+    parts: dict[str, list[np.ndarray]] = {name: [] for name in names}
+    done = 0
+
+    def flush(buffer: list[tuple]) -> None:
+        # 행 버퍼를 컬럼별 배열로 바꿔 쌓는다
+        for name, column in zip(names, zip(*buffer)):
+            values = np.array(column, dtype=object)
+            if typed[name]:
+                values = _coerce_column(name, pd.Series(values, dtype=object)).to_numpy()
+            parts[name].append(values)
+
+    buffer: list[tuple] = []
+    for row in rows:
+        if all(v is None for v in row):
+            continue
+        buffer.append(tuple(row[:width]) + (None,) * (width - len(row)))
+        done += 1
+        if len(buffer) >= chunk_rows:
+            flush(buffer)
+            buffer.clear()
+            if progress is not None:
+                progress(done, total, time.perf_counter() - started)
+    if buffer:
+        flush(buffer)
+        buffer.clear()
+
+    # 컬럼 단위로 이어 붙이고 청크는 바로 해제
+    columns = {}
+    for name in names:
+        chunks = parts.pop(name)
+        if typed[name]:
+            empty = _coerce_column(name, pd.Series([], dtype=object)).to_numpy()
+            values = np.concatenate(chunks) if chunks else empty
+            columns[name] = pd.Series(values)
+        else:
+            values = np.concatenate(chunks) if chunks else np.empty(0, dtype=object)
+            columns[name] = _finish_free_column(values)
+        del chunks
+
+    if progress is not None:
+        progress(done, total, time.perf_counter() - started)
+    return DailyScan(frame=pd.DataFrame(columns), rows=done)
+
+
+def read_daily_streaming(
+    worksheet,
+    *,
+    chunk_rows: int = STREAM_CHUNK_ROWS,
+    progress: ProgressCallback | None = None,
+) -> pd.DataFrame:
+    """Daily 원장 전체를 스트리밍으로 읽는다 (`scan_daily` 참고)."""
+    return scan_daily(worksheet, chunk_rows=chunk_rows, progress=progress).frame
+
+
+# 아래는 openpyxl read-only 워크북 내부(_archive, _worksheet_path, _shared_strings,
+# _date_formats 등)를 사용한다 (openpyxl 3.1)
+
+class _SplicedWorksheet(ReadOnlyWorksheet):
+    """시트 XML 대신 주어진 바이트(헤더 행 + 추가된 행)를 읽는 read-only 워크시트."""
+
+    def __init__(self, worksheet, source: bytes):
+        self._source = source
+        super().__init__(worksheet.parent, worksheet.title, worksheet._worksheet_path, worksheet._shared_strings)
+
+    def _get_source(self):
+        return io.BytesIO(self._source)
+
+
+def _sheet_version(worksheet) -> str:
+    # 시트 zip 항목의 CRC·크기 (압축을 풀지 않고 바뀜 여부 판별)
+    info = worksheet.parent._archive.getinfo(worksheet._worksheet_path)
+    return f"{info.CRC:08x}:{info.file_size}"
+
+
+def _shared_counts(worksheet) -> tuple[int, int]:
+    # (공유 문자열 수, 셀 서식 수)
+    return len(worksheet._shared_strings), len(worksheet.parent._cell_styles)
+
+
+def _shared_digest(worksheet, strings: int, styles: int) -> str:
+    # 앞 strings 개 공유 문자열과 앞 styles 개 셀 서식의 날짜 여부·기준일 지문
+    book = worksheet.parent
+    digest = _new_digest()
+    dates = sorted(i for i in book._date_formats if i < styles)
+    durations = sorted(i for i in book._timedelta_formats if i < styles)
+    digest.update(repr((book.epoch, dates, durations)).encode())
+    for text in worksheet._shared_strings[:strings]:
+        digest.update(repr(text).encode())
+    return digest.hexdigest()
+
+
+def _make_prefix(worksheet, extent: int, digest: str) -> DailyPrefix:
+    strings, styles = _shared_counts(worksheet)
+    return DailyPrefix(extent, digest, strings, styles, _shared_digest(worksheet, strings, styles))
+
+
+def _split_sheet(source) -> tuple[bytes, Iterator[bytes]] | None:
+    # 시트 XML -> (<sheetData> 까지의 앞부분, 행 요소 바이트 조각들). 행 영역이 없으면 None
+    head = b""
+    while _SHEET_DATA_OPEN not in head:
+        chunk = source.read(_HASH_CHUNK)
+        if not chunk:
+            return None
+        head += chunk
+    cut = head.index(_SHEET_DATA_OPEN) + len(_SHEET_DATA_OPEN)
+
+    def pieces(pending: bytes) -> Iterator[bytes]:
+        keep = len(_SHEET_DATA_CLOSE) - 1
+        while True:
+            end = pending.find(_SHEET_DATA_CLOSE)
+            if end >= 0:
+                yield pending[:end]
+                return
+            chunk = source.read(_HASH_CHUNK)
+            if not chunk:
+                return
+            # 닫는 태그가 조각 경계에 걸칠 수 있어 끝 몇 바이트는 다음 조각과 함께 본다
+            yield pending[:-keep]
+            pending = pending[-keep:] + chunk
+
+    return head[:cut], pieces(head[cut:])
+
+
+def _daily_prefix(worksheet) -> DailyPrefix | None:
+    """Daily 시트의 행 영역 전체를 `DailyPrefix` 로 (행 영역을 찾지 못하면 None)."""
+    with worksheet._get_source() as source:
+        split = _split_sheet(source)
+        if split is None:
+            return None
+        digest, extent = _new_digest(), 0
+        for piece in split[1]:
+            digest.update(piece)
+            extent += len(piece)
+    return _make_prefix(worksheet, extent, digest.hexdigest())
+
+
+def _appended_rows(worksheet, prefix: DailyPrefix) -> tuple[bytes | None, int, DailyPrefix] | None:
+    """prefix 뒤에 행만 추가됐으면 (추가 행 XML, 첫 추가 행 번호, 새 prefix), 아니면 None.
+
+    이미 읽은 행 바이트는 지문만 계산하고 파싱하지 않는다. 추가 행 XML 은 시트의
+    앞부분·헤더 행·추가 행만 이어 붙인 문서이다 (추가 행이 없으면 None).
+    """
+    strings, styles = _shared_counts(worksheet)
+    if (
+        strings < prefix.strings
+        or styles < prefix.styles
+        or _shared_digest(worksheet, prefix.strings, prefix.styles) != prefix.shared_digest
+    ):
+        return None
+    with worksheet._get_source() as source:
+        split = _split_sheet(source)
+        if split is None:
+            return None
+        head, pieces = split
+        digest, taken, header, added = _new_digest(), 0, b"", []
+        for piece in pieces:
+            if taken < prefix.extent:
+                part = piece[:prefix.extent - taken]
+                digest.update(part)
+                taken += len(part)
+                if _ROW_CLOSE not in header:
+                    header += part
+                if taken == prefix.extent and digest.hexdigest() != prefix.digest:
+                    return None
+                piece = piece[len(part):]
+            if piece:
+                added.append(piece)
+    tail = b"".join(added)
+    header = header[:header.find(_ROW_CLOSE) + len(_ROW_CLOSE)]
+    if taken < prefix.extent or header.count(_ROW_OPEN) != 1 or (tail and not tail.startswith(_ROW_OPEN)):
+        # 행이 줄었거나, 헤더 행을 찾지 못했거나, 행 경계가 아님
+        return None
+    digest.update(tail)
+    new_prefix = _make_prefix(worksheet, prefix.extent + len(tail), digest.hexdigest())
+    if not tail:
+        return None, 0, new_prefix
+    number = _ROW_NUMBER.match(tail)
+    source = head + header + tail + _SHEET_DATA_CLOSE + b"</worksheet>"
+    return source, int(number.group(1)) if number else 2, new_prefix
+
+
+def _is_text(values: pd.Series) -> bool:
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.cat.categories
+    return not pd.api.types.is_numeric_dtype(values)
+
+
+def _append_daily(daily: pd.DataFrame, tail: pd.DataFrame) -> pd.DataFrame:
+    """이전 원장 뒤에 추가 행 프레임(타입 변환만 된)을 붙인 원장.
+
+    타입이 정해지지 않은 컬럼은 한쪽만 문자열이면 양쪽 모두 문자열로 맞춘다
+    (시트 전체를 읽었을 때와 같은 타입).
+    """
+    if tail.empty:
+        return daily
+    free = [
+        name for name in tail.columns
+        if name in daily.columns and name != DATE_COLUMN and name not in NUMERIC_COLUMNS
+        and _is_text(daily[name]) != _is_text(tail[name])
+    ]
+    head_text = {
+        name: _free_text(pd.Series(daily[name].to_numpy(dtype=object), index=daily.index)).astype("str")
+        for name in free if not _is_text(daily[name])
+    }
+    if head_text:
+        daily = apply_ledger_schema(daily.assign(**head_text))
+    # 추가 행에 값이 없는 텍스트 컬럼(전부 결측 -> float)도 여기서 문자열이 된다
+    tail = tail.assign(**{
+        name: _free_text(tail[name].astype(object)).astype("str") for name in free if not _is_text(tail[name])
+    })
+    return concat_rows([daily, apply_ledger_schema(tail)])
+
+
+def coerce_accounts(accounts: pd.DataFrame) -> pd.DataFrame:
+    """계좌 마스터에서 계좌 컬럼과 금액 컬럼만 남기고 타입을 맞춘다."""
+    columns = [c for c in ACCOUNT_KEY_COLUMNS + ACCOUNT_FIGURE_COLUMNS if c in accounts.columns]
+    accounts = accounts[columns].copy()
+    for col in columns:
+        if col in ACCOUNT_FIGURE_COLUMNS:
+            accounts[col] = pd.to_numeric(accounts[col], errors="coerce").astype(float)
+        else:
+            accounts[col] = _as_text(accounts[col])
+    return accounts
+
+
+def extract_cashflow(df_full: pd.DataFrame) -> pd.DataFrame:
+    """월별_CashFlow 시트를 행 구분 컬럼 + 월별 숫자 행렬로 정리한다."""
+    base = df_full.iloc[:, CASHFLOW_BASE_START:CASHFLOW_BASE_START + len(CASHFLOW_BASE_COLUMNS)].copy()
+    base.columns = CASHFLOW_BASE_COLUMNS
+    base["Level"] = pd.to_numeric(base["Level"], errors="coerce")
+    for col in CASHFLOW_BASE_COLUMNS[1:]:
+        base[col] = _as_text(base[col])
+
+    # J열부터 날짜로 해석되는 열만 월별 금액으로 사용
+    months = {}
+    for col in df_full.columns[CASHFLOW_BASE_START + len(CASHFLOW_BASE_COLUMNS):]:
+        try:
+            month = pd.Timestamp(col) if pd.notna(col) else None
+        except (TypeError, ValueError):
+            continue
+        if month is not None:
+            months[month] = pd.to_numeric(df_full[col], errors="coerce").astype(float)
+
+    cashflow = pd.concat([base, pd.DataFrame(months, index=base.index)], axis=1)
+
+    # Level 1인 마지막 행까지가 실제 현금흐름표
+    level1_rows = cashflow.index[cashflow["Level"] == 1]
+    if len(level1_rows):
+        cashflow = cashflow.loc[:level1_rows[-1]]
+    return cashflow
+
+
+def _report_accounts(report_raw: pd.DataFrame) -> pd.DataFrame | None:
+    # 자금일보 시트 -> 계좌 마스터 (조회 기간 컬럼 포함)
+    accounts = extract_account_master(report_raw)
+    if accounts is not None:
+        accounts = coerce_accounts(accounts)
+        period = extract_report_period(report_raw)
+        if period is not None:
+            accounts = accounts.assign(**dict(zip(REPORT_PERIOD_COLUMNS, period)))
+    return accounts
+
+
+def load_workbook_frames(
+    key: WorkbookKey,
+    progress: ProgressCallback | None = None,
+    previous: WorkbookFrames | None = None,
+) -> WorkbookFrames:
+    """워크북을 한 번 열어 앱이 쓰는 시트를 모두 읽는다.
+
+    Daily 시트는 스트리밍으로 읽으며 `progress` 로 진행 상황을 알린다.
+    `previous` 가 주어지고 현재 Daily 시트의 행 바이트가 그 원장의 `daily_prefix`
+    로 시작하면 (행 추가만 있었던 경우) 추가된 행만 파싱해 이어 붙이고, zip 항목이
+    그대로인 다른 시트는 previous 의 결과를 쓴다.
+    """
+    with pd.ExcelFile(key.path, engine="openpyxl") as xl:
+        sheet = xl.book[DAILY_SHEET]
+        versions = {name: _sheet_version(xl.book[name]) for name in (REPORT_SHEET, CASHFLOW_SHEET)}
+        appended = None
+        if previous is not None and previous.daily_prefix is not None:
+            appended = _appended_rows(sheet, previous.daily_prefix)
+
+        if appended is not None:
+            source, first_row, prefix = appended
+            tail_start, parent_sha256 = len(previous.daily), previous.key.sha256
+            daily = previous.daily
+            if source is not None:
+                tail = scan_daily(_SplicedWorksheet(sheet, source), first_row=first_row, progress=progress)
+                daily = _append_daily(daily, tail.frame)
+        else:
+            # 처음 읽거나 앞부분이 바뀌었으면 (수정·삭제) 전체를 읽는다
+            tail_start = parent_sha256 = None
+            daily = apply_ledger_schema(scan_daily(sheet, progress=progress).frame)
+            prefix = _daily_prefix(sheet)
+
+        # 공유 문자열이 그대로일 때(appended)만 시트 바이트 비교로 이전 결과를 쓴다
+        unchanged = {
+            name for name, version in versions.items()
+            if appended is not None and previous.sheet_versions.get(name) == version
+        }
+        accounts = (
+            previous.accounts if REPORT_SHEET in unchanged
+            else _report_accounts(xl.parse(REPORT_SHEET, header=None))
+        )
+        cashflow = (
+            previous.cashflow if CASHFLOW_SHEET in unchanged
+            else extract_cashflow(xl.parse(CASHFLOW_SHEET, skiprows=2))
+        )
+
+    return WorkbookFrames(
+        key=key,
+        daily=daily,
+        accounts=accounts,
+        cashflow=cashflow,
+        daily_prefix=prefix,
+        sheet_versions=versions,
+        tail_start=tail_start,
+        parent_sha256=parent_sha256,
+    )
@@ -0,0 +1,59 @@
+"""메모리 한도가 있는 LRU 캐시.
+
+그래프 사양처럼 (원장 버전, 입력값) 키로 언제든 다시 만들 수 있는 결과를 보관한다.
+결과 크기는 만들 때 한 번 재고, 크기 합이 한도를 넘으면 가장 오래 안 쓴 것부터
+버린다.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+# 기본 메모리 한도 (64 MB)
+DEFAULT_BUDGET = 64 * 1024 * 1024
+
+
+class BudgetCache:
+    """키별 결과 보관소 (최근 사용 순, 크기 합 max_bytes 이하).
+
+    크기는 `sizeof(value)` (바이트) 로 잰다. 혼자서 max_bytes 를 넘는 결과는
+    보관하지 않고 그대로 돌려준다.
+    """
+
+    def __init__(self, sizeof: Callable[[object], int], max_bytes: int = DEFAULT_BUDGET):
+        self._sizeof = sizeof
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[object, int]] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """보관 중인 결과 크기 합."""
+        return self._nbytes
+
+    def get(self, key: Hashable, build: Callable[[], object]):
+        """key 의 결과 (없으면 build() 로 만들어 보관)."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+
+        value = build()
+        size = self._sizeof(value)
+        if size > self._max_bytes:
+            return value
+
+        with self._lock:
+            if key in self._entries:
+                self._nbytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._nbytes += size
+            while self._nbytes > self._max_bytes:
+                self._nbytes -= self._entries.popitem(last=False)[1][1]
+        return value
@@ -0,0 +1,120 @@
+"""Daily 원장에서 계산하는 월별 현금흐름표.
+
+원장을 (월, CODE) 단위 집행 금액 합계와 월별 입출금·이월잔액 합계로 한 번
+모아 두고, 월별_CashFlow 시트의 행 구성(CODE, Level 계층)에 채워 현금흐름표
+행렬을 만든다. Level 4 행은 CODE 별 합계, 상위 행은 하위 트리 합계, 기초현금·
+현금의증감·기말현금은 원장 잔액 흐름이다. 행이 추가되면 추가분이 속한 월만
+다시 더한다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .schema import DIRECTION_COLUMN, NO_FLOW
+from .statement import BALANCE_ROWS, StatementMatrix
+
+OPENING_ROW, CLOSING_ROW = BALANCE_ROWS
+CHANGE_ROW = "현금의증감"
+
+
+def code_labels(values: pd.Series) -> pd.Series:
+    """CODE 값을 비교용 문자열로 (정수 CODE 는 6자리, 그 외는 앞뒤 공백 제거)."""
+    numbers = pd.to_numeric(values, errors="coerce")
+    integral = numbers.notna() & (numbers == numbers.round())
+    padded = numbers[integral].map(lambda n: f"{int(n):06d}")
+    return values.astype("str").str.strip().mask(integral, padded)
+
+
+def _aggregate(daily: pd.DataFrame) -> tuple[pd.DataFrame, pd.Series, pd.Series]:
+    # (CODE × 월 입출금 합계, 월별 입출금 합계, 월별 이월잔액 합계). 금액 0 행과 지출일 없는 행은 제외
+    daily = daily[daily["지출일"].notna() & (daily["집행 금액"] != 0)]
+    months = daily["지출일"].dt.to_period("M")
+    amounts = daily["집행 금액"].astype(float)
+    carried = (daily[DIRECTION_COLUMN] == NO_FLOW).to_numpy()
+
+    moving = ~carried & daily["CODE"].notna().to_numpy()
+    flows = (
+        amounts[moving]
+        .groupby([code_labels(daily["CODE"][moving]), months[moving]])
+        .sum()
+        .unstack(fill_value=0.0)
+    )
+    movement = amounts[~carried].groupby(months[~carried]).sum()
+    carried = amounts[carried].groupby(months[carried]).sum()
+    return flows, movement, carried
+
+
+def _merge(base: pd.DataFrame, added: pd.DataFrame) -> pd.DataFrame:
+    # 추가분이 있는 월 열만 다시 더한다
+    codes = base.index.union(added.index)
+    merged = base.reindex(index=codes, columns=base.columns.union(added.columns), fill_value=0.0)
+    merged[added.columns] = merged[added.columns] + added.reindex(index=codes, fill_value=0.0)
+    return merged
+
+
+@dataclass(frozen=True)
+class MonthlyLedger:
+    """원장의 월별 합계 (월은 PeriodIndex).
+
+    - flows: CODE × 월 집행 금액 합계 (입출금 행)
+    - movement: 월별 입출금 합계 (CODE 가 없는 계좌 대체 등 포함)
+    - carried: 월별 이월잔액 행 합계
+    """
+
+    flows: pd.DataFrame
+    movement: pd.Series
+    carried: pd.Series
+
+    @classmethod
+    def build(cls, daily: pd.DataFrame) -> MonthlyLedger:
+        return cls(*_aggregate(daily))
+
+    def extend(self, new_rows: pd.DataFrame) -> MonthlyLedger:
+        """추가된 행을 반영한 새 합계 (추가분이 속한 월만 다시 더한다)."""
+        if new_rows.empty:
+            return self
+        flows, movement, carried = _aggregate(new_rows)
+        return MonthlyLedger(
+            _merge(self.flows, flows),
+            self.movement.add(movement, fill_value=0.0),
+            self.carried.add(carried, fill_value=0.0),
+        )
+
+    @property
+    def months(self) -> pd.PeriodIndex:
+        """원장의 첫 달부터 마지막 달까지."""
+        seen = self.movement.index.union(self.carried.index)
+        if seen.empty:
+            return pd.PeriodIndex([], freq="M")
+        return pd.period_range(seen.min(), seen.max(), freq="M")
+
+    def statement(self, layout: StatementMatrix) -> StatementMatrix:
+        """layout(시트 전체 행의 현금흐름표 행렬)의 행 구성에 원장 금액을 채운 행렬.
+
+        같은 CODE 의 말단 행이 여러 개면 첫 행에만 채운다. 시트에 없는 CODE 의
+        금액은 현금의증감·기말현금에만 반영된다.
+        """
+        months = self.months
+        rows = layout.rows
+        labels = rows["현금 흐름 구분"].to_numpy()
+        codes = code_labels(rows["CODE"])
+        balance = np.isin(labels, [OPENING_ROW, CHANGE_ROW, CLOSING_ROW])
+        targets = np.flatnonzero(layout.tree.leaves & ~balance & ~codes.duplicated().to_numpy())
+
+        flows = self.flows.reindex(columns=months, fill_value=0.0)
+        sources = flows.index.get_indexer(codes.to_numpy()[targets])
+        values = np.zeros((len(rows), len(months)))
+        values[targets[sources >= 0]] = flows.to_numpy()[sources[sources >= 0]]
+        values = layout.tree.rollup(values)
+
+        movement = self.movement.reindex(months, fill_value=0.0).to_numpy()
+        carried = self.carried.reindex(months, fill_value=0.0).to_numpy()
+        opening = np.concatenate([[0.0], np.cumsum(carried + movement)[:-1]]) + carried
+        values[labels == OPENING_ROW] = opening
+        values[labels == CHANGE_ROW] = movement
+        values[labels == CLOSING_ROW] = opening + movement
+        return StatementMatrix(rows, pd.DataFrame(values, index=rows.index, columns=months), layout.tree)
@@ -0,0 +1,124 @@
+"""원장 표준 조건의 비트맵 인덱스.
+
+원장 버전마다 한 번, 구분 컬럼(현금흐름 대분류·중분류, 금융사, 계좌번호, 법인 등)
+과 입출금 방향의 값별 행 여부를 `np.packbits` 로 압축한 비트맵으로 만들어 둔다.
+조회는 행 위치 구간(정렬 원장의 기간 구간)에 해당하는 바이트만 AND 한 뒤 한 번
+풀기 때문에, 조건을 늘려도 원장 전체를 다시 훑지 않는다.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .consolidate import ENTITY_COLUMN
+from .ledger import TRANSFER_CATEGORY
+from .schema import DIMENSION_COLUMNS, DIRECTION_COLUMN, INFLOW, OUTFLOW
+
+# 조건 키: (컬럼, 값)
+Predicate = tuple[str, Hashable]
+
+# 표준 조건
+TRANSFER_ROWS = ("현금흐름 대분류", TRANSFER_CATEGORY)
+INFLOW_ROWS = (DIRECTION_COLUMN, INFLOW)
+OUTFLOW_ROWS = (DIRECTION_COLUMN, OUTFLOW)
+
+INDEXED_COLUMNS = DIMENSION_COLUMNS + [ENTITY_COLUMN, DIRECTION_COLUMN]
+
+
+def _value_masks(values: pd.Series) -> dict[Hashable, np.ndarray]:
+    # 값별 행 여부 (결측은 어느 값에도 속하지 않음)
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    return {value: codes == i for i, value in enumerate(uniques)}
+
+
+def _append_bits(bits: np.ndarray, size: int, added: np.ndarray) -> np.ndarray:
+    # size 비트가 든 압축 비트맵 뒤에 added 비트를 붙인다. 기존 바이트는 그대로 두고
+    # 비트가 덜 찬 마지막 바이트만 추가분과 함께 다시 압축한다
+    used = size % 8
+    if not used:
+        return np.concatenate([bits, np.packbits(added)])
+    tail = np.concatenate([np.unpackbits(bits[-1:], count=used).astype(bool), added])
+    return np.concatenate([bits[:-1], np.packbits(tail)])
+
+
+@dataclass(frozen=True)
+class PredicateIndex:
+    """조건별 압축 비트맵 (bitmaps[(컬럼, 값)] 은 길이 ceil(size / 8) 의 uint8 배열).
+
+    columns 는 인덱스를 만든 컬럼 (행 추가 시 같은 컬럼만 인덱스한다).
+    """
+
+    size: int
+    bitmaps: dict[Predicate, np.ndarray]
+    columns: tuple[str, ...] = ()
+
+    @classmethod
+    def build(cls, daily: pd.DataFrame, columns: Iterable[str] | None = None) -> PredicateIndex:
+        columns = [c for c in (columns or INDEXED_COLUMNS) if c in daily.columns]
+        bitmaps = {
+            (column, value): np.packbits(mask)
+            for column in columns
+            for value, mask in _value_masks(daily[column]).items()
+        }
+        return cls(len(daily), bitmaps, tuple(columns))
+
+    def extend(self, new_rows: pd.DataFrame) -> PredicateIndex:
+        """행이 뒤에 추가된 원장의 인덱스 (추가 행의 비트만 압축해 바이트 경계에서 잇는다)."""
+        if new_rows.empty:
+            return self
+        added = {
+            (column, value): mask
+            for column in self.columns
+            if column in new_rows.columns
+            for value, mask in _value_masks(new_rows[column]).items()
+        }
+        empty = np.zeros(len(new_rows), dtype=bool)
+        blank = np.zeros(-(-self.size // 8), dtype=np.uint8)
+        bitmaps = {
+            key: _append_bits(self.bitmaps.get(key, blank), self.size, added.get(key, empty))
+            for key in self.bitmaps.keys() | added.keys()
+        }
+        return PredicateIndex(self.size + len(new_rows), bitmaps, self.columns)
+
+    def mask(
+        self,
+        lo: int = 0,
+        hi: int | None = None,
+        include: Iterable[Predicate] = (),
+        exclude: Iterable[Predicate] = (),
+    ) -> np.ndarray:
+        """행 위치 [lo, hi) 중 include 조건을 모두 만족하고 exclude 조건은 아닌 행 (bool 배열).
+
+        원장에 없는 값의 include 는 빈 결과, exclude 는 영향이 없다.
+        """
+        hi = self.size if hi is None else hi
+        if hi <= lo:
+            return np.zeros(0, dtype=bool)
+        first, last = lo // 8, -(-hi // 8)
+        acc = np.full(last - first, 0xFF, dtype=np.uint8)
+        for key in include:
+            bits = self.bitmaps.get(key)
+            if bits is None:
+                return np.zeros(hi - lo, dtype=bool)
+            acc &= bits[first:last]
+        for key in exclude:
+            bits = self.bitmaps.get(key)
+            if bits is not None:
+                acc &= ~bits[first:last]
+        offset = lo - first * 8
+        return np.unpackbits(acc)[offset:offset + hi - lo].astype(bool)
+
+    def count(self, include: Iterable[Predicate] = (), exclude: Iterable[Predicate] = ()) -> int:
+        """전체 원장에서 조건을 만족하는 행 수."""
+        return int(self.mask(include=include, exclude=exclude).sum())
+
+
+def account_predicates(keys: Iterable[str], account) -> list[Predicate]:
+    """계좌 키 값(계좌번호 또는 (법인, 계좌번호))을 조건 목록으로."""
+    keys = list(keys)
+    values = account if isinstance(account, tuple) and len(keys) > 1 else (account,)
+    return list(zip(keys, values))
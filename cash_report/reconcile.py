@@ -0,0 +1,141 @@
+"""자금일보 시트와 Daily 원장 대사.
+
+- 계좌별: 자금일보 시트 "계좌별 통합 현황" 표의 기초잔액·입금·출금·기말잔액을
+  같은 조회 기간(시트의 시작일~종료일)의 원장 계산값과 비교한다. 원장 값은 잔액
+  인덱스·집계 큐브의 누적합에서 구하므로 계좌·기간 수와 무관하게 한 번에 끝난다.
+- 일자별: Daily 시트의 잔액 열(행 순서 누적 잔액)을 원본 파일별 집행 금액
+  누적합과 비교해, 차이가 나는 날짜의 마지막 행 잔액을 보고한다. 통합 원장은
+  뒤 연도 워크북의 이월잔액 행을 빼 두므로 워크북별 원본 원장으로 비교한다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from .balance import BalanceIndex
+from .consolidate import ENTITY_COLUMN, SOURCE_COLUMN
+from .cube import DailyCube
+from .ledger import account_summary
+from .loader import ACCOUNT_FIGURE_COLUMNS, ACCOUNT_KEY_COLUMNS, REPORT_PERIOD_COLUMNS, WorkbookFrames
+
+# 원 단위 반올림 오차 허용 범위
+TOLERANCE = 0.5
+
+
+@dataclass(frozen=True)
+class Reconciliation:
+    """대사 결과 (두 표 모두 차이가 있는 행만 담는다).
+
+    - accounts: 계좌 × 항목(기초잔액·입금·출금·기말잔액)별 시트·원장 값과 차이
+    - dates: 원본 파일 × 지출일별 마지막 행의 시트 잔액·원장 잔액과 차이
+    """
+
+    accounts: pd.DataFrame
+    dates: pd.DataFrame
+
+    @property
+    def matched(self) -> bool:
+        return self.accounts.empty and self.dates.empty
+
+
+def reconcile_accounts(
+    daily: pd.DataFrame,
+    accounts: pd.DataFrame | None,
+    balances: BalanceIndex | None = None,
+    cube: DailyCube | None = None,
+    tolerance: float = TOLERANCE,
+) -> pd.DataFrame:
+    """시트 계좌별 현황과 원장 계산값이 다른 (계좌, 항목) 목록.
+
+    조회 기간이 같은 계좌끼리 묶어 account_summary 로 한 번에 계산한다. 시작일·
+    종료일 컬럼이 없는 계좌 마스터는 비교하지 않는다.
+    """
+    ids = [c for c in [ENTITY_COLUMN] if accounts is not None and c in accounts.columns] + ACCOUNT_KEY_COLUMNS
+    columns = ids + REPORT_PERIOD_COLUMNS + ["항목", "시트", "원장", "차이"]
+    if accounts is None or not set(REPORT_PERIOD_COLUMNS) <= set(accounts.columns):
+        return pd.DataFrame(columns=columns)
+    balances = balances if balances is not None else BalanceIndex.build(daily)
+    cube = cube if cube is not None else DailyCube.build(daily)
+
+    parts = []
+    for (start, end), group in accounts.groupby(REPORT_PERIOD_COLUMNS, sort=False):
+        end = end + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+        ledger = account_summary(daily, group, start, end, balances, cube)
+        sheet = group.reset_index(drop=True)
+        parts.append(pd.concat([
+            sheet[ids + REPORT_PERIOD_COLUMNS],
+            sheet[ACCOUNT_FIGURE_COLUMNS].add_prefix("시트:"),
+            ledger[ACCOUNT_FIGURE_COLUMNS].add_prefix("원장:"),
+        ], axis=1))
+    wide = pd.concat(parts, ignore_index=True)
+
+    sheet = wide[[f"시트:{c}" for c in ACCOUNT_FIGURE_COLUMNS]].to_numpy(dtype=float)
+    ledger = wide[[f"원장:{c}" for c in ACCOUNT_FIGURE_COLUMNS]].to_numpy(dtype=float)
+    diff = np.nan_to_num(sheet) - ledger
+    rows, items = np.nonzero(np.abs(diff) > tolerance)
+    report = wide.iloc[rows][ids + REPORT_PERIOD_COLUMNS].reset_index(drop=True)
+    report["항목"] = np.asarray(ACCOUNT_FIGURE_COLUMNS)[items]
+    report["시트"] = sheet[rows, items]
+    report["원장"] = ledger[rows, items]
+    report["차이"] = diff[rows, items]
+    return report[columns]
+
+
+def reconcile_dates(daily: pd.DataFrame, tolerance: float = TOLERANCE) -> pd.DataFrame:
+    """Daily 잔액 열과 집행 금액 누적합이 다른 날짜 목록.
+
+    daily 는 이월잔액 행이 남아 있는 워크북 원장이어야 한다 (통합 원장은
+    `reconcile_workbooks`). 누적합은 원본 파일별로 시트 행 순서대로 구하고, 날짜마다
+    마지막 행끼리 비교한다 (그 날짜 안에서 차이가 난 행 수도 함께 보고).
+    """
+    columns = [SOURCE_COLUMN, "지출일", "시트 잔액", "원장 잔액", "차이", "불일치 행 수"]
+    if "잔액" not in daily.columns:
+        return pd.DataFrame(columns=columns)
+    source = daily[SOURCE_COLUMN] if SOURCE_COLUMN in daily.columns else pd.Series("", index=daily.index)
+    ledger = daily["집행 금액"].astype(float).groupby(source, observed=True, sort=False).cumsum()
+    frame = pd.DataFrame({
+        SOURCE_COLUMN: source,
+        "지출일": daily["지출일"].dt.normalize(),
+        "시트 잔액": daily["잔액"],
+        "원장 잔액": ledger,
+    })
+    frame = frame[frame["시트 잔액"].notna() & frame["지출일"].notna()]
+    frame["차이"] = frame["시트 잔액"] - frame["원장 잔액"]
+    frame["불일치 행 수"] = (frame["차이"].abs() > tolerance).astype(int)
+
+    by_date = frame.groupby([SOURCE_COLUMN, "지출일"], observed=True, sort=False)
+    report = by_date[["시트 잔액", "원장 잔액", "차이"]].last()
+    report["불일치 행 수"] = by_date["불일치 행 수"].sum()
+    report = report[report["불일치 행 수"] > 0].reset_index()
+    return report[columns]
+
+
+def reconcile_workbooks(workbooks, tolerance: float = TOLERANCE) -> pd.DataFrame:
+    """워크북별 원본 원장(WorkbookFrames.daily)의 일자별 대사 결과를 합친 표."""
+    reports = [
+        reconcile_dates(frames.daily.assign(**{SOURCE_COLUMN: os.path.basename(frames.key.path)}), tolerance)
+        for frames in workbooks
+    ]
+    if not reports:
+        return reconcile_dates(pd.DataFrame(), tolerance)
+    return pd.concat(reports, ignore_index=True)
+
+
+def reconcile(
+    daily: pd.DataFrame,
+    accounts: pd.DataFrame | None,
+    workbooks: list[WorkbookFrames],
+    balances: BalanceIndex | None = None,
+    cube: DailyCube | None = None,
+    tolerance: float = TOLERANCE,
+) -> Reconciliation:
+    """계좌별(통합 원장)·일자별(워크북별 원본 원장) 대사 결과."""
+    return Reconciliation(
+        reconcile_accounts(daily, accounts, balances, cube, tolerance),
+        reconcile_workbooks(workbooks, tolerance),
+    )
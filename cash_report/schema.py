@@ -0,0 +1,80 @@
+"""Daily 원장 압축 스키마.
+
+로드 시점에 원장 컬럼 타입을 정리한다.
+
+- 값 종류가 적은 구분 컬럼(금융사, 계좌번호, 현금흐름 대분류·중분류 등)은
+  categorical 로 바꿔 문자열 비교·groupby 를 정수 코드 연산으로 처리한다.
+- 입금·출금·집행 금액은 원 단위 int64 로 저장한다 (빈 값은 0). 소수가 있는
+  원장은 정확도를 잃지 않도록 float64 로 둔다.
+- 입출금 방향은 입금·출금의 빈 값 여부 대신 `방향` 컬럼(int8)으로 표시한다.
+- 값이 모두 문자열인 나머지 object 컬럼(적요 등)은 문자열 dtype 으로 바꾼다.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+DIMENSION_COLUMNS = ["집행 구분", "현금흐름 대분류", "현금흐름 중분류", "금융사", "계좌번호"]
+AMOUNT_COLUMNS = ["입금", "출금", "집행 금액"]
+
+# 입출금 방향: 입금 1, 출금 -1, 없음 0 (이월잔액 행 등)
+DIRECTION_COLUMN = "방향"
+INFLOW = 1
+OUTFLOW = -1
+NO_FLOW = 0
+
+
+def direction_flags(daily: pd.DataFrame) -> np.ndarray:
+    """입금·출금 값 유무로 방향을 정한다 (둘 다 있으면 입금)."""
+    return np.select(
+        [daily["입금"].notna().to_numpy(), daily["출금"].notna().to_numpy()],
+        [INFLOW, OUTFLOW],
+        NO_FLOW,
+    ).astype(np.int8)
+
+
+def _amount(values: pd.Series) -> pd.Series:
+    if pd.api.types.is_integer_dtype(values.dtype) and not values.hasnans:
+        return values.astype(np.int64)
+    filled = pd.to_numeric(values, errors="coerce").fillna(0.0).astype(float)
+    numbers = filled.to_numpy()
+    if np.isfinite(numbers).all() and (numbers == np.round(numbers)).all():
+        return filled.astype(np.int64)
+    return filled
+
+
+def apply_ledger_schema(daily: pd.DataFrame, dimensions: list[str] | None = None) -> pd.DataFrame:
+    """원장에 압축 스키마를 적용한 새 프레임. 이미 적용된 컬럼은 그대로 둔다.
+
+    타입이 적용된 원장끼리 합치면 범주가 다른 categorical 은 문자열로 풀리므로
+    합친 뒤 다시 호출한다. `dimensions` 로 categorical 컬럼을 추가할 수 있다.
+    """
+    columns = {}
+    if DIRECTION_COLUMN not in daily.columns:
+        columns[DIRECTION_COLUMN] = direction_flags(daily)
+    for name in AMOUNT_COLUMNS:
+        if name in daily.columns and daily[name].dtype != np.int64:
+            columns[name] = _amount(daily[name])
+    for name in DIMENSION_COLUMNS + list(dimensions or []):
+        if name in daily.columns and not isinstance(daily[name].dtype, pd.CategoricalDtype):
+            columns[name] = daily[name].astype("category")
+    for name in daily.columns:
+        if name not in columns and daily[name].dtype == object and pd.api.types.infer_dtype(daily[name]) == "string":
+            columns[name] = daily[name].astype("str")
+    return daily.assign(**columns) if columns else daily
+
+
+def concat_rows(frames: list[pd.DataFrame], ignore_index: bool = True) -> pd.DataFrame:
+    """프레임을 행 방향으로 이어 붙인다 (ignore_index 면 인덱스 새로 매김).
+
+    모든 프레임에서 categorical 인 컬럼은 범주를 합쳐(정렬) categorical 로 유지한다.
+    그냥 합치면 범주가 다를 때 문자열 컬럼으로 풀린다.
+    """
+    merged = pd.concat(frames, ignore_index=ignore_index)
+    for name in merged.columns:
+        parts = [frame[name] for frame in frames if name in frame.columns]
+        if len(parts) == len(frames) and all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            merged[name] = union_categoricals(parts, sort_categories=True)
+    return merged
@@ -0,0 +1,173 @@
+"""워크북 옆에 두는 컬럼형(Parquet) 캐시.
+
+타입 변환이 끝난 Daily 원장, 계좌 마스터, 월별_CashFlow 행렬을
+`data/.cache/<파일명>/` 아래 Parquet 파일로 저장한다. manifest.json 에 기록된
+워크북 해시가 현재 파일과 같을 때만 그대로 사용한다.
+
+워크북이 바뀌었으면 캐시된 원장을 이전 버전으로 넘겨 다시 읽는다. Daily 에
+행만 추가된 경우에는 추가된 행만 새 Parquet 조각(daily-NNNNN.parquet)으로
+덧붙이고, 그 외에는 원장을 처음부터 다시 쓴다. 추가분 판별에 쓰는 Daily 행
+바이트 지문(`DailyPrefix`)과 다른 시트의 zip 항목 버전도 manifest 에 기록한다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict
+
+import pandas as pd
+
+from .loader import (
+    CASHFLOW_BASE_COLUMNS,
+    DailyPrefix,
+    ProgressCallback,
+    WorkbookFrames,
+    WorkbookKey,
+    load_workbook_frames,
+)
+from .schema import concat_rows
+
+SIDECAR_DIRNAME = ".cache"
+MANIFEST_NAME = "manifest.json"
+
+# 저장 형식이 바뀌면 올려서 기존 캐시를 무효화
+SCHEMA_VERSION = 5
+
+_DAILY_PART = "daily-{:05d}.parquet"
+_ACCOUNTS_FILE = "accounts.parquet"
+_CASHFLOW_FILE = "cashflow.parquet"
+
+
+def sidecar_dir(workbook_path: str) -> str:
+    """워크북에 대응하는 캐시 디렉터리 경로."""
+    folder, name = os.path.split(os.path.abspath(workbook_path))
+    return os.path.join(folder, SIDECAR_DIRNAME, name)
+
+
+def _read_manifest(folder: str) -> dict | None:
+    try:
+        with open(os.path.join(folder, MANIFEST_NAME), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_fresh(key: WorkbookKey) -> bool:
+    """캐시가 현재 워크북 버전으로 만들어졌는지 확인한다."""
+    manifest = _read_manifest(sidecar_dir(key.path))
+    return (
+        manifest is not None
+        and manifest.get("schema") == SCHEMA_VERSION
+        and manifest.get("sha256") == key.sha256
+    )
+
+
+def read_sidecar(key: WorkbookKey, allow_stale: bool = False) -> WorkbookFrames | None:
+    """유효한 캐시가 있으면 읽어서 돌려주고, 없으면 None.
+
+    `allow_stale` 이면 다른 버전의 워크북으로 만든 캐시도 읽는다. 이때 돌려주는
+    프레임의 key 는 캐시를 만든 버전의 것이다.
+    """
+    folder = sidecar_dir(key.path)
+    manifest = _read_manifest(folder)
+    if manifest is None or manifest.get("schema") != SCHEMA_VERSION:
+        return None
+    if manifest.get("sha256") != key.sha256:
+        if not allow_stale:
+            return None
+        key = WorkbookKey(key.path, manifest.get("mtime_ns", 0), manifest["sha256"])
+    try:
+        parts = [pd.read_parquet(os.path.join(folder, name)) for name in manifest["daily_parts"]]
+        # 조각마다 categorical 범주가 다를 수 있어 범주를 합쳐 이어 붙인다
+        daily = concat_rows(parts) if len(parts) > 1 else parts[0]
+        accounts = (
+            pd.read_parquet(os.path.join(folder, _ACCOUNTS_FILE))
+            if manifest.get("has_accounts") else None
+        )
+        cashflow = pd.read_parquet(os.path.join(folder, _CASHFLOW_FILE))
+    except OSError:
+        return None
+
+    # Parquet 컬럼 이름은 문자열이므로 월 컬럼을 Timestamp로 복원
+    cashflow.columns = [
+        col if col in CASHFLOW_BASE_COLUMNS else pd.Timestamp(col)
+        for col in cashflow.columns
+    ]
+    return WorkbookFrames(
+        key=key,
+        daily=daily,
+        accounts=accounts,
+        cashflow=cashflow,
+        daily_prefix=DailyPrefix(**manifest["daily_prefix"]) if manifest.get("daily_prefix") else None,
+        sheet_versions=manifest.get("sheet_versions", {}),
+    )
+
+
+def _write_parquet(frame: pd.DataFrame, path: str) -> None:
+    tmp_path = path + ".tmp"
+    frame.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def write_sidecar(frames: WorkbookFrames) -> None:
+    """캐시를 기록한다. manifest 를 마지막에 써서 중간 상태가 쓰이지 않게 한다.
+
+    캐시된 버전에 행만 추가된 프레임이면 추가된 행만 새 조각으로 쓴다.
+    """
+    folder = sidecar_dir(frames.key.path)
+    os.makedirs(folder, exist_ok=True)
+
+    previous = _read_manifest(folder)
+    if (
+        frames.tail_start is not None
+        and previous is not None
+        and previous.get("schema") == SCHEMA_VERSION
+        and previous.get("sha256") == frames.parent_sha256
+    ):
+        daily_parts = list(previous["daily_parts"])
+        if frames.tail_start < len(frames.daily):
+            name = _DAILY_PART.format(len(daily_parts))
+            _write_parquet(frames.daily.iloc[frames.tail_start:], os.path.join(folder, name))
+            daily_parts.append(name)
+    else:
+        daily_parts = [_DAILY_PART.format(0)]
+        _write_parquet(frames.daily, os.path.join(folder, daily_parts[0]))
+    if frames.accounts is not None:
+        _write_parquet(frames.accounts, os.path.join(folder, _ACCOUNTS_FILE))
+    cashflow = frames.cashflow.copy()
+    cashflow.columns = [
+        col if col in CASHFLOW_BASE_COLUMNS else col.isoformat()
+        for col in cashflow.columns
+    ]
+    _write_parquet(cashflow, os.path.join(folder, _CASHFLOW_FILE))
+
+    manifest = {
+        "schema": SCHEMA_VERSION,
+        "sha256": frames.key.sha256,
+        "mtime_ns": frames.key.mtime_ns,
+        "has_accounts": frames.accounts is not None,
+        "daily_parts": daily_parts,
+        "daily_prefix": asdict(frames.daily_prefix) if frames.daily_prefix is not None else None,
+        "sheet_versions": frames.sheet_versions,
+    }
+    tmp_path = os.path.join(folder, MANIFEST_NAME + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, os.path.join(folder, MANIFEST_NAME))
+
+
+def load_cached_workbook(key: WorkbookKey, progress: ProgressCallback | None = None) -> WorkbookFrames:
+    """캐시가 유효하면 캐시에서, 아니면 워크북을 읽고 캐시를 갱신한다."""
+    frames = read_sidecar(key, allow_stale=True)
+    if frames is not None and frames.key.sha256 == key.sha256:
+        return frames
+
+    # 이전 버전 원장을 넘겨 추가된 행만 읽도록 한다
+    frames = load_workbook_frames(key, progress=progress, previous=frames)
+    try:
+        write_sidecar(frames)
+    except OSError:
+        # 쓰기 권한이 없는 위치라면 캐시 없이 계속 진행
+        pass
+    return frames
@@ -0,0 +1,217 @@
+"""월별_CashFlow 현금흐름표 재구성.
+
+시트는 한 번 행 × 월(PeriodIndex) 숫자 행렬로 만들어 두고, 월 구간 선택은 열
+구간 자르기, 합계와 0 행 숨기기는 행렬 연산으로 처리한다. 변동비·고정비 같은
+하위 항목은 Level 계층(StatementTree)의 하위 트리로 찾는다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .hierarchy import StatementTree
+from .loader import CASHFLOW_BASE_COLUMNS
+
+TEXT_COLUMNS = ["현금 흐름 구분", "유입/유출", "구분1", "구분2"]
+TOTAL_COLUMN = "합계"
+
+# 합계가 의미 없는 잔액 행
+BALANCE_ROWS = ["기초현금", "기말현금"]
+
+# Level 1 행에서 활동별 금액을 찾을 때 쓰는 키워드
+ACTIVITIES = [("영업", "영업활동"), ("투자", "투자활동"), ("재무", "재무활동")]
+
+VARIABLE_COST = "변동비"
+FIXED_COST = "고정비"
+
+
+def month_label(month: pd.Timestamp | pd.Period) -> str:
+    """월 표시 이름 (예: 2025년 03월)."""
+    return f"{month.year}년 {month.month:02d}월"
+
+
+def month_labels(months: pd.PeriodIndex) -> list[str]:
+    """월 PeriodIndex 의 표시 이름 목록."""
+    return [month_label(month) for month in months]
+
+
+def month_range(start_year: int, start_month: int, end_year: int, end_month: int) -> pd.PeriodIndex:
+    """시작월부터 종료월까지의 월 PeriodIndex. 종료월이 앞서면 빈 인덱스."""
+    start = pd.Period(year=start_year, month=start_month, freq="M")
+    end = pd.Period(year=end_year, month=end_month, freq="M")
+    return pd.period_range(start, end, freq="M")
+
+
+@dataclass(frozen=True)
+class StatementMatrix:
+    """현금흐름표 행렬.
+
+    rows 는 행 구분 컬럼(빈 텍스트는 ""), values 는 같은 인덱스의 행 × 월 금액
+    (float64, 열은 정렬된 월 PeriodIndex)이다. tree 는 시트 전체 행의 Level
+    계층으로, 행을 숨긴 행렬도 같은 tree 를 공유한다. 월 표시 이름은 to_frame
+    에서만 만든다.
+    """
+
+    rows: pd.DataFrame
+    values: pd.DataFrame
+    tree: StatementTree
+
+    @classmethod
+    def build(cls, cashflow: pd.DataFrame) -> StatementMatrix:
+        rows = cashflow[CASHFLOW_BASE_COLUMNS].copy()
+        rows[TEXT_COLUMNS] = rows[TEXT_COLUMNS].fillna("")
+        amounts = cashflow.drop(columns=CASHFLOW_BASE_COLUMNS)
+        months = pd.DatetimeIndex(amounts.columns).to_period("M")
+        # 같은 월이 여러 열이면 뒤쪽 열을 사용
+        keep = ~months.duplicated(keep="last")
+        values = pd.DataFrame(
+            amounts.to_numpy(dtype=float)[:, keep],
+            index=cashflow.index,
+            columns=months[keep],
+        ).sort_index(axis=1)
+        return cls(rows, values, StatementTree.build(rows["Level"]))
+
+    @property
+    def months(self) -> pd.PeriodIndex:
+        return self.values.columns
+
+    def select(self, months: pd.PeriodIndex, hide_zero: bool = False) -> StatementMatrix:
+        """months 구간의 행렬. 시트에 없는 월은 NaN 이다.
+
+        `hide_zero` 이면 Level 1·2 를 제외한 구간 합계 0 행을 숨긴다 (행 번호는 유지).
+        """
+        if len(months) == 0:
+            return StatementMatrix(self.rows, self.values.iloc[:, :0], self.tree)
+        lo = self.months.searchsorted(months[0])
+        hi = self.months.searchsorted(months[-1], side="right")
+        values = self.values.iloc[:, lo:hi]
+        if len(values.columns) != len(months):
+            values = values.reindex(columns=months)
+        rows = self.rows
+        if hide_zero:
+            keep = rows["Level"].isin([1, 2]).to_numpy() | (values.sum(axis=1).to_numpy() != 0)
+            rows, values = rows[keep], values[keep]
+        return StatementMatrix(rows, values, self.tree)
+
+    def take(self, index: pd.Index) -> StatementMatrix:
+        """index 행만 남긴 행렬."""
+        return StatementMatrix(self.rows.loc[index], self.values.loc[index], self.tree)
+
+    def subtree(self, label) -> pd.Index:
+        """label 행의 하위 트리 중 이 행렬에 남아 있는 행 번호."""
+        below = self.tree.descendants(label)
+        if below.empty:
+            return below
+        lo = self.rows.index.searchsorted(below[0])
+        hi = self.rows.index.searchsorted(below[-1], side="right")
+        return self.rows.index[lo:hi]
+
+    def rollup(self) -> pd.DataFrame:
+        """행별 하위 트리 말단 항목의 월별 합계 (숨긴 행은 0 으로 본다)."""
+        positions = self.tree.index.get_indexer(self.rows.index)
+        full = np.zeros((len(self.tree.index), len(self.months)))
+        full[positions] = self.values.to_numpy()
+        return pd.DataFrame(self.tree.rollup(full)[positions], index=self.rows.index, columns=self.months)
+
+    def totals(self) -> pd.Series:
+        """행별 합계 (기초현금·기말현금 행과 월이 없을 때는 NaN)."""
+        if len(self.months) == 0:
+            return pd.Series(np.nan, index=self.rows.index)
+        totals = self.values.sum(axis=1)
+        totals[self.rows["현금 흐름 구분"].isin(BALANCE_ROWS)] = np.nan
+        return totals
+
+    def row(self, label: str) -> np.ndarray | None:
+        """현금 흐름 구분이 label 인 첫 행의 월별 금액."""
+        positions = np.flatnonzero((self.rows["현금 흐름 구분"] == label).to_numpy())
+        if len(positions) == 0:
+            return None
+        return self.values.to_numpy()[positions[0]]
+
+    def to_frame(self) -> pd.DataFrame:
+        """표시용 표: 행 구분 컬럼 + 월 표시 이름 컬럼 + 합계 컬럼."""
+        values = self.values.set_axis(month_labels(self.months), axis=1)
+        return pd.concat([self.rows, values, self.totals().rename(TOTAL_COLUMN)], axis=1)
+
+
+def build_statement(cashflow: pd.DataFrame, months: pd.PeriodIndex, hide_zero: bool = False) -> pd.DataFrame:
+    """선택한 월의 현금흐름표 (표시용 표, StatementMatrix.select 참고)."""
+    return StatementMatrix.build(cashflow).select(months, hide_zero).to_frame()
+
+
+def statement_row(statement: StatementMatrix, label: str) -> np.ndarray | None:
+    """현금 흐름 구분이 label 인 첫 행의 월별 금액."""
+    return statement.row(label)
+
+
+def activity_flows(statement: StatementMatrix) -> dict[str, np.ndarray]:
+    """Level 1 영업·투자·재무활동 행의 월별 금액 (행이 없는 활동은 제외)."""
+    rows = statement.rows
+    level1 = (rows["Level"] == 1).to_numpy()
+    flows = {}
+    for keyword, activity in ACTIVITIES:
+        mask = level1 & rows["현금 흐름 구분"].str.contains(keyword, na=False, case=False).to_numpy()
+        positions = np.flatnonzero(mask)
+        if len(positions):
+            flows[activity] = statement.values.to_numpy()[positions[0]]
+    return flows
+
+
+@dataclass(frozen=True)
+class CostBreakdown:
+    """변동비·고정비 하위 항목 (선택 기간 금액이 0 인 항목 제외)."""
+
+    variable: StatementMatrix
+    fixed: StatementMatrix
+
+    @property
+    def months(self) -> pd.PeriodIndex:
+        return self.variable.months
+
+    @property
+    def variable_total(self) -> pd.Series:
+        return self.variable.values.abs().sum()
+
+    @property
+    def fixed_total(self) -> pd.Series:
+        return self.fixed.values.abs().sum()
+
+    def summary(self) -> pd.DataFrame:
+        """월별 변동비·고정비 합계와 비중(%) (행: 구분, 열: 월)."""
+        variable = self.variable_total.to_numpy(dtype=float)
+        fixed = self.fixed_total.to_numpy(dtype=float)
+        total = variable + fixed
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variable_ratio = np.where(total > 0, variable / total * 100, 0.0)
+            fixed_ratio = np.where(total > 0, fixed / total * 100, 0.0)
+        return pd.DataFrame(
+            [variable, fixed, variable_ratio, fixed_ratio, total],
+            index=pd.Index(["변동비 합계", "고정비 합계", "변동비 비중(%)", "고정비 비중(%)", "총계"], name="구분"),
+            columns=self.months,
+        )
+
+
+def cost_breakdown(statement: StatementMatrix) -> CostBreakdown | None:
+    """구분1 이 변동비·고정비인 Level 3 행의 하위 항목을 나눈다.
+
+    변동비 항목은 변동비 행의 하위 트리 전체, 고정비 항목은 고정비 행 하위
+    트리의 Level 4 행이다. 둘 중 하나라도 없으면 None.
+    """
+    rows = statement.rows
+    variable_rows = rows.index[rows["구분1"] == VARIABLE_COST]
+    fixed_rows = rows.index[rows["구분1"] == FIXED_COST]
+    if variable_rows.empty or fixed_rows.empty:
+        return None
+
+    variable = statement.subtree(variable_rows[0])
+    fixed = statement.subtree(fixed_rows[0])
+    fixed = fixed[rows.loc[fixed, "Level"].to_numpy() == 4]
+
+    def nonzero(index: pd.Index) -> StatementMatrix:
+        amounts = statement.values.loc[index]
+        return statement.take(index[amounts.abs().sum(axis=1).to_numpy() > 0])
+
+    return CostBreakdown(nonzero(variable), nonzero(fixed))
@@ -0,0 +1,96 @@
+"""지출일 순 정렬 원장과 기간 조회.
+
+원장을 지출일 순(같은 날은 원래 순서, 지출일 없는 행은 맨 뒤)으로 한 번 정렬해
+두고, 기간 조회는 정렬된 날짜 배열의 이진 탐색으로 위치 구간을 찾아 그 구간만
+잘라 준다. 조회 비용은 O(log n + k) 이다. 정렬 순서 기준의 조건 비트맵
+인덱스(`PredicateIndex`)를 함께 들고 있어 기간 구간에 조건을 AND 해 조회할 수 있다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .predicates import Predicate, PredicateIndex
+from .schema import apply_ledger_schema, concat_rows
+
+DATE_COLUMN = "지출일"
+
+
+def _sides(inclusive: str) -> tuple[str, str]:
+    # Series.between 의 inclusive -> searchsorted side (시작, 끝)
+    if inclusive not in ("both", "left", "right", "neither"):
+        raise ValueError(f"inclusive 는 both, left, right, neither 중 하나여야 합니다: {inclusive}")
+    return (
+        "left" if inclusive in ("both", "left") else "right",
+        "right" if inclusive in ("both", "right") else "left",
+    )
+
+
+@dataclass(frozen=True)
+class LedgerTimeline:
+    """지출일 순으로 정렬한 원장 (dates 는 지출일이 있는 행의 날짜 배열)."""
+
+    frame: pd.DataFrame
+    dates: np.ndarray
+    predicates: PredicateIndex
+
+    @classmethod
+    def build(cls, daily: pd.DataFrame) -> LedgerTimeline:
+        dates = daily[DATE_COLUMN].to_numpy(dtype="datetime64[ns]")
+        if np.isnat(dates).any() or (dates[1:] < dates[:-1]).any():
+            # NaT 는 맨 뒤로 정렬된다
+            order = np.argsort(dates, kind="stable")
+            daily, dates = daily.take(order), dates[order]
+            dates = dates[~np.isnat(dates)]
+        return cls(daily, dates, PredicateIndex.build(daily))
+
+    def extend(self, new_rows: pd.DataFrame) -> LedgerTimeline:
+        """행이 추가된 원장. 추가분이 모두 마지막 날짜 이후면 정렬 없이 이어 붙인다."""
+        if new_rows.empty:
+            return self
+        # 추가분 행 번호는 기존 원장 뒤에 이어서 (전체 원장으로 build 한 것과 같게)
+        size = len(self.frame)
+        new_rows = new_rows.set_axis(pd.RangeIndex(size, size + len(new_rows)))
+        frame = apply_ledger_schema(concat_rows([self.frame, new_rows], ignore_index=False))
+        new_dates = new_rows[DATE_COLUMN].to_numpy(dtype="datetime64[ns]")
+        in_order = (
+            len(self.dates) == len(self.frame)
+            and not np.isnat(new_dates).any()
+            and not (new_dates[1:] < new_dates[:-1]).any()
+            and (not len(self.dates) or new_dates[0] >= self.dates[-1])
+        )
+        if in_order:
+            return LedgerTimeline(
+                frame, np.concatenate([self.dates, new_dates]), self.predicates.extend(new_rows)
+            )
+        return LedgerTimeline.build(frame)
+
+    def positions(self, start, end, inclusive: str = "both") -> tuple[int, int]:
+        """기간에 해당하는 행의 위치 구간 [lo, hi)."""
+        left, right = _sides(inclusive)
+        lo = np.searchsorted(self.dates, np.datetime64(pd.Timestamp(start), "ns"), side=left)
+        hi = np.searchsorted(self.dates, np.datetime64(pd.Timestamp(end), "ns"), side=right)
+        return int(lo), int(max(lo, hi))
+
+    def between(self, start, end, inclusive: str = "both") -> pd.DataFrame:
+        """기간의 행 (복사 없이 잘라낸 구간). inclusive 는 Series.between 과 같다."""
+        lo, hi = self.positions(start, end, inclusive)
+        return self.frame.iloc[lo:hi]
+
+    def query(
+        self,
+        start,
+        end,
+        inclusive: str = "both",
+        include: list[Predicate] = (),
+        exclude: list[Predicate] = (),
+    ) -> pd.DataFrame:
+        """기간의 행 중 include 조건을 모두 만족하고 exclude 조건은 아닌 행."""
+        lo, hi = self.positions(start, end, inclusive)
+        rows = self.frame.iloc[lo:hi]
+        if not include and not exclude:
+            return rows
+        return rows[self.predicates.mask(lo, hi, include, exclude)]
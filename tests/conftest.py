@@ -0,0 +1,127 @@
+"""테스트용 작은 원장·워크북 생성 도우미."""
+
+from __future__ import annotations
+
+import datetime
+import sys
+from pathlib import Path
+
+import numpy as np
+import openpyxl
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from cash_report import WorkbookFrames, WorkbookKey, apply_ledger_schema  # noqa: E402
+
+CATEGORIES = {
+    "급여": ("운영비", 120204),
+    "이자 수입": ("기타 유입", 410101),
+    "보조금": ("보조금", 310101),
+    "계좌 대체": ("계좌 대체", None),
+}
+
+
+def make_daily(rows) -> pd.DataFrame:
+    """(지출일, 구분, 금액, 중분류, 계좌번호) 목록 -> Daily 원장 (압축 스키마 적용).
+
+    구분은 "입금"·"출금"·"이월" (이월잔액 행은 입금·출금이 비어 있음). 잔액은
+    시트처럼 행 순서 누적합이다.
+    """
+    records = []
+    for day, kind, amount, category, account in rows:
+        major, code = CATEGORIES[category]
+        records.append({
+            "지출일": pd.Timestamp(day),
+            "집행 구분": "완료",
+            "현금흐름 대분류": major,
+            "현금흐름 중분류": category,
+            "CODE": float(code) if code is not None else np.nan,
+            "입금": float(amount) if kind == "입금" else np.nan,
+            "출금": float(amount) if kind == "출금" else np.nan,
+            "집행 금액": float(-amount if kind == "출금" else amount),
+            "적요": f"{category} {day}",
+            "금융사": "하나은행",
+            "계좌번호": account,
+        })
+    daily = pd.DataFrame(records)
+    daily["잔액"] = daily["집행 금액"].cumsum()
+    return apply_ledger_schema(daily)
+
+
+def make_workbook(path: str, rows, accounts: pd.DataFrame | None = None) -> WorkbookFrames:
+    """원장만 있는 WorkbookFrames (해시는 파일 이름)."""
+    return WorkbookFrames(
+        key=WorkbookKey(path, 0, path),
+        daily=make_daily(rows),
+        accounts=accounts,
+        cashflow=pd.DataFrame(),
+    )
+
+
+def yearly_rows(year: int, opening: float, accounts=("391-001", "391-002"), days: int = 40) -> list[tuple]:
+    """opening 이월잔액(첫 계좌)으로 시작하는 한 해 원장 행."""
+    rng = np.random.default_rng(year)
+    rows = [(f"{year}-01-01", "이월", opening, "급여", accounts[0])]
+    for i in range(days):
+        day = pd.Timestamp(f"{year}-01-02") + pd.Timedelta(days=int(i * 7))
+        category = ["급여", "이자 수입", "보조금", "계좌 대체"][i % 4]
+        kind = "출금" if category == "급여" or (category == "계좌 대체" and i % 8 == 3) else "입금"
+        rows.append((day, kind, float(rng.integers(1, 500) * 1000), category, accounts[i % len(accounts)]))
+    return rows
+
+
+DAILY_HEADER = [
+    "작성일자", "지출일", "집행 구분", "현금흐름 대분류", "현금흐름 중분류", "CODE", "추정 금액",
+    "입금", "출금", "집행 금액", "잔액", "적요", "금융사", "계좌번호",
+]
+
+
+def daily_sheet_rows(count: int, start: int = 0) -> list[list]:
+    """Daily 시트 행 (start 번째 행부터 count 개, 같은 번호면 같은 값)."""
+    rows, day0 = [], datetime.datetime(2024, 1, 1)
+    for i in range(start, start + count):
+        category = list(CATEGORIES)[i % 4]
+        major, code = CATEGORIES[category]
+        amount = (i % 7 + 1) * 1000 * (-1 if category == "급여" else 1)
+        rows.append([
+            None, day0 + datetime.timedelta(days=i // 3), "완료", major, category, code, None,
+            amount if amount > 0 else None, -amount if amount < 0 else None, amount, None,
+            f"{category} {i}", "하나은행", f"391-00{i % 2 + 1}",
+        ])
+    return rows
+
+
+def write_workbook(path, daily_rows: list[list], header: list[str] = DAILY_HEADER) -> None:
+    """Daily·자금일보·월별_CashFlow 시트가 있는 작은 워크북."""
+    book = openpyxl.Workbook()
+    sheet = book.active
+    sheet.title = "Daily"
+    sheet.append(header)
+    for row in daily_rows:
+        sheet.append(row)
+
+    report = book.create_sheet("자금일보")
+    report.append([])
+    report.append([None, "시작일", datetime.datetime(2024, 1, 1), "종료일", datetime.datetime(2024, 3, 31)])
+    report.append([None, None, "계좌별 통합 현황"])
+    report.append([None, None, "구분", "금융사", "계좌번호", "기초잔액", "입금", "출금", "기말잔액"])
+    for account in ["391-001", "391-002"]:
+        report.append([None, None, "보통예금", "하나은행", account, 0, 1000, -500, 500])
+    report.append([None, None, "합계"])
+
+    cashflow = book.create_sheet("월별_CashFlow")
+    cashflow.append([])
+    cashflow.append([])
+    months = [datetime.datetime(2024, m, 1) for m in (1, 2, 3)]
+    cashflow.append([None, None, "수식", "Level", "현금 흐름 구분", "유입/유출", "구분1", "구분2", "CODE", *months])
+    cashflow.append([None, None, None, 1, "기초현금", None, None, None, None, 0, 0, 0])
+    cashflow.append([None, None, None, 4, "급여", "유출", None, None, 120204, -1000, -2000, 0])
+    cashflow.append([None, None, None, 1, "기말현금", None, None, None, None, 0, 0, 0])
+    book.save(path)
+
+
+@pytest.fixture
+def daily() -> pd.DataFrame:
+    return make_daily(yearly_rows(2024, 1_000_000))
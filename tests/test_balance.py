@@ -0,0 +1,16 @@
+import numpy as np
+import pandas as pd
+
+from cash_report import BalanceIndex
+
+
+def test_opening_balances_match_ledger_sums(daily):
+    balances = BalanceIndex.build(daily)
+    accounts = ["391-001", "391-002", "없는 계좌"]
+
+    for when in ["2023-12-31", "2024-01-01", "2024-05-20", "2025-12-31"]:
+        before = daily[daily["지출일"] < pd.Timestamp(when)]
+        expected = [before.loc[before["계좌번호"] == a, "집행 금액"].sum() for a in accounts]
+
+        np.testing.assert_array_equal(balances.opening_balances(when, accounts), expected)
+        assert [balances.balance_before(when, a) for a in accounts] == expected
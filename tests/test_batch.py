@@ -0,0 +1,20 @@
+import pandas as pd
+
+from cash_report import DailyCube, make_periods
+from cash_report.batch import _period_flows
+
+
+def test_window_cube_gives_the_same_period_flows(daily):
+    cube = DailyCube.build(daily)
+    periods = make_periods("2024-03-01", "2024-06-30", "M")
+    next_starts = [p.start for p in periods[1:]] + [periods[-1].end + pd.Timedelta(seconds=1)]
+
+    window = cube.window(periods[0].start, next_starts[-1])
+
+    assert len(window.cells) < len(cube.cells)
+    for full, part in zip(_period_flows(cube, periods, next_starts), _period_flows(window, periods, next_starts)):
+        by_account, net, inflow, outflow = part
+        pd.testing.assert_frame_equal(full[0], by_account)
+        pd.testing.assert_series_equal(full[1], net)
+        pd.testing.assert_series_equal(full[2], inflow)
+        pd.testing.assert_series_equal(full[3], outflow)
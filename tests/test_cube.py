@@ -0,0 +1,20 @@
+import pandas as pd
+
+from cash_report import DailyCube, concat_rows
+
+from conftest import make_daily, yearly_rows
+
+
+def test_extend_keeps_categorical_dimensions(daily):
+    cube = DailyCube.build(daily)
+    # 새 계좌 (기존 큐브에 없는 범주)
+    added = make_daily(yearly_rows(2025, 0, accounts=("391-009",), days=8))
+
+    extended = cube.extend(added)
+
+    for grain, cells in [("D", extended.cells), *extended.rollups.items()]:
+        before = cube.cells if grain == "D" else cube.rollups[grain]
+        assert list(cells.dtypes.astype(str)) == list(before.dtypes.astype(str)), grain
+        assert "391-009" in cells["계좌번호"].cat.categories
+    full = DailyCube.build(concat_rows([daily, added]))
+    pd.testing.assert_frame_equal(extended.cells, full.cells)
@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+
+from cash_report import DetailPages
+from cash_report.detail import SEARCH_COLUMNS
+
+
+@pytest.fixture
+def rows(daily):
+    rows = daily.copy()
+    rows.loc[[3, 10], "적요"] = None
+    return rows
+
+
+def frame_search(frame, text):
+    """표 전체를 문자열로 바꿔 찾는 방식."""
+    hits = pd.Series(False, index=frame.index)
+    for name in SEARCH_COLUMNS:
+        hits |= frame[name].astype(str).str.contains(text, case=False, regex=False) & frame[name].notna()
+    return frame[hits]
+
+
+@pytest.mark.parametrize("text", ["급여", "391-002", "  하나  ", "없는 말", ""])
+@pytest.mark.parametrize("column, descending", [(None, False), ("집행 금액", True), ("적요", False), ("지출일", True)])
+def test_pages_match_filtered_frame(rows, text, column, descending):
+    details = DetailPages.build(rows).search(text).sort(column, descending)
+
+    expected = frame_search(details.frame, text.strip()) if text.strip() else details.frame
+    if column is not None:
+        expected = expected.sort_values(column, ascending=not descending, kind="stable", na_position="last")
+    paged = [details.page(number, size=7) for number in range(1, details.pages(size=7) + 1)]
+    pd.testing.assert_frame_equal(pd.concat(paged), expected)
+    assert details.count == len(expected)
+    assert details.total() == expected["집행 금액"].sum()
+
+
+def test_page_number_is_clamped(rows):
+    details = DetailPages.build(rows)
+
+    pd.testing.assert_frame_equal(details.page(0, size=10), details.page(1, size=10))
+    pd.testing.assert_frame_equal(details.page(99, size=10), details.frame.iloc[40:])
+    assert details.search("없는 말").pages() == 1
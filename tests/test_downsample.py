@@ -0,0 +1,54 @@
+import math
+
+import numpy as np
+import pytest
+
+from cash_report import extreme_indices, lttb
+
+
+def reference_lttb(x, y, threshold):
+    """Largest-Triangle-Three-Buckets 원래 알고리즘 (점마다 반복)."""
+    size = len(y)
+    every = (size - 2) / (threshold - 2)
+    keep, anchor = [0], 0
+    for i in range(threshold - 2):
+        lo, hi = math.floor(i * every) + 1, math.floor((i + 1) * every) + 1
+        after_hi = min(math.floor((i + 2) * every) + 1, size)
+        mean_x = sum(x[hi:after_hi]) / (after_hi - hi)
+        mean_y = sum(y[hi:after_hi]) / (after_hi - hi)
+        best, best_area = lo, -1.0
+        for j in range(lo, hi):
+            area = abs((x[anchor] - mean_x) * (y[j] - y[anchor]) - (x[anchor] - x[j]) * (mean_y - y[anchor]))
+            if area > best_area:
+                best, best_area = j, area
+        keep.append(best)
+        anchor = best
+    return keep + [size - 1]
+
+
+@pytest.mark.parametrize("size, threshold", [(10, 3), (100, 10), (1000, 37), (731, 200)])
+def test_lttb_matches_reference(size, threshold):
+    rng = np.random.default_rng(size)
+    y = rng.normal(size=size).cumsum()
+    x = np.sort(rng.choice(size * 3, size=size, replace=False)).astype(float)
+
+    assert list(lttb(y, threshold)) == reference_lttb(list(range(size)), list(y), threshold)
+    assert list(lttb(y, threshold, x)) == reference_lttb(list(x), list(y), threshold)
+
+
+def test_short_series_is_kept_whole():
+    assert list(lttb([1.0, 2.0, 3.0], 5)) == [0, 1, 2]
+    assert list(extreme_indices(np.arange(6.0), 3)) == list(range(6))
+
+
+def test_extreme_indices_keep_bucket_min_and_max():
+    rng = np.random.default_rng(1)
+    y = rng.normal(size=500)
+    buckets = 20
+
+    kept = extreme_indices(y, buckets)
+
+    expected = {0, len(y) - 1}
+    for bucket in np.array_split(np.arange(len(y)), buckets):
+        expected |= {bucket[y[bucket].argmin()], bucket[y[bucket].argmax()]}
+    assert list(kept) == sorted(expected)
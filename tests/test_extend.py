@@ -0,0 +1,69 @@
+"""행 추가 반영(extend) 결과가 전체 원장으로 새로 만든(build) 결과와 같은지."""
+
+from dataclasses import fields
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cash_report import BalanceIndex, DailyCube, LedgerTimeline, MonthlyLedger, PredicateIndex, concat_rows
+
+from conftest import make_daily, yearly_rows
+
+# 뒤 날짜 행 (새 계좌 포함) / 기존 원장보다 앞 날짜 행
+LATER = yearly_rows(2025, 0, accounts=("391-002", "391-009"), days=12)
+EARLIER = yearly_rows(2023, 0, accounts=("391-001",), days=6)
+
+
+@pytest.fixture(params=[LATER, EARLIER], ids=["later", "earlier"])
+def added(request) -> pd.DataFrame:
+    return make_daily(request.param)
+
+
+def both(cls, daily, added):
+    return cls.build(daily).extend(added), cls.build(concat_rows([daily, added]))
+
+
+def test_balance_index(daily, added):
+    extended, full = both(BalanceIndex, daily, added)
+    for field in fields(BalanceIndex):
+        np.testing.assert_equal(getattr(extended, field.name), getattr(full, field.name), err_msg=field.name)
+
+
+def test_daily_cube(daily, added):
+    extended, full = both(DailyCube, daily, added)
+    assert extended.keys == full.keys
+    pd.testing.assert_frame_equal(extended.cells, full.cells)
+    assert extended.rollups.keys() == full.rollups.keys()
+    for grain, cells in full.rollups.items():
+        pd.testing.assert_frame_equal(extended.rollups[grain], cells)
+
+
+def test_ledger_timeline(daily, added):
+    extended, full = both(LedgerTimeline, daily, added)
+    pd.testing.assert_frame_equal(extended.frame, full.frame)
+    np.testing.assert_array_equal(extended.dates, full.dates)
+    assert extended.predicates.size == full.predicates.size
+    np.testing.assert_equal(extended.predicates.bitmaps, full.predicates.bitmaps)
+
+
+def test_predicate_index(daily, added):
+    extended, full = both(PredicateIndex, daily, added)
+    assert extended.size == full.size
+    np.testing.assert_equal(extended.bitmaps, full.bitmaps)
+
+
+def test_monthly_ledger(daily, added):
+    extended, full = both(MonthlyLedger, daily, added)
+    pd.testing.assert_frame_equal(extended.flows, full.flows)
+    pd.testing.assert_series_equal(extended.movement, full.movement)
+    pd.testing.assert_series_equal(extended.carried, full.carried)
+
+
+@pytest.mark.parametrize("split", [0, 7, 8, 9, 16])
+def test_predicate_index_across_byte_boundaries(daily, split):
+    # 기존 행 수가 8의 배수가 아니면 마지막 바이트만 다시 압축한다
+    extended = PredicateIndex.build(daily.iloc[:split]).extend(daily.iloc[split:])
+    full = PredicateIndex.build(daily)
+    assert extended.size == full.size
+    np.testing.assert_equal(extended.bitmaps, full.bitmaps)
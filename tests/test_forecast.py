@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cash_report import average_fixed_cost, depletion_month, monte_carlo_bands, runway_forecast
+
+
+def loop_forecast(initial_cash, avg_fixed_cost, end_year, end_month_num):
+    """예전 페이지의 while 루프 (잔액이 0 이하가 되는 달까지)."""
+    future_cash, dates = [], []
+    current_cash = initial_cash
+    month_count = 0
+    while current_cash > 0:
+        future_cash.append(current_cash)
+        new_month = end_month_num + month_count
+        dates.append(f"{end_year + (new_month - 1) // 12}-{(new_month - 1) % 12 + 1:02d}")
+        current_cash -= avg_fixed_cost
+        month_count += 1
+    future_cash.append(current_cash)
+    new_month = end_month_num + month_count
+    dates.append(f"{end_year + (new_month - 1) // 12}-{(new_month - 1) % 12 + 1:02d}")
+    return dates, future_cash
+
+
+@pytest.mark.parametrize("initial_cash, burn", [(1_000_000, 300_000), (900_000, 300_000), (50_000, 70_000), (0, 10)])
+def test_runway_forecast_matches_loop(initial_cash, burn):
+    months, values = runway_forecast(initial_cash, burn, pd.Period("2024-11", "M"))
+    dates, future_cash = loop_forecast(initial_cash, burn, 2024, 11)
+
+    assert [str(month) for month in months] == dates
+    np.testing.assert_allclose(values, future_cash)
+    assert depletion_month(months, values) == months[-1]
+
+
+def test_runway_forecast_stops_at_horizon():
+    months, values = runway_forecast(1_000, 0.0, pd.Period("2024-01", "M"), horizon=12)
+
+    assert len(months) == 13
+    assert (values == 1_000).all()
+    assert depletion_month(months, values) is None
+
+
+def test_average_fixed_cost_uses_latest_months():
+    fixed = pd.Series([5.0, 1.0, 2.0, 3.0], index=pd.PeriodIndex(["2024-04", "2024-01", "2024-02", "2024-03"], freq="M"))
+
+    assert average_fixed_cost(fixed) == pytest.approx((2.0 + 3.0 + 5.0) / 3)
+    assert average_fixed_cost(fixed, window=10) == pytest.approx(11.0 / 4)
+
+
+def test_empty_history_means_no_fixed_cost():
+    assert average_fixed_cost(pd.Series([], dtype=float)) == 0.0
+
+    bands = monte_carlo_bands(1_000.0, np.array([]), draws=10, horizon=6)
+    assert bands.shape == (3, 7)
+    assert (bands == 1_000.0).all()
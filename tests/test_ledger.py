@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+from cash_report import BalanceIndex, DailyCube, account_summary
+
+ACCOUNTS = pd.DataFrame({
+    "구분": ["보통예금", "보통예금", "정기예금"],
+    "금융사": ["하나은행", "하나은행", "하나은행"],
+    "계좌번호": ["391-001", "391-002", "391-003"],
+})
+
+
+def loop_summary(daily, accounts, start, end):
+    """예전 페이지의 계좌별 반복 계산."""
+    results = []
+    for _, row in accounts.iterrows():
+        account = daily["계좌번호"] == row["계좌번호"]
+        in_period = (daily["지출일"] >= start) & (daily["지출일"] <= end) & (daily["현금흐름 대분류"] != "계좌 대체")
+        initial = float(daily[(daily["지출일"] < start) & account]["집행 금액"].sum())
+        deposits = daily[in_period & account & daily["입금"].notna()]["입금"].sum()
+        withdrawals = daily[in_period & account & daily["출금"].notna()]["출금"].sum()
+        results.append({
+            "구분": row["구분"], "금융사": row["금융사"], "계좌번호": row["계좌번호"],
+            "기초잔액": initial, "입금": float(deposits), "출금": float(-withdrawals),
+            "기말잔액": float(initial + deposits - withdrawals),
+        })
+    return pd.DataFrame(results)
+
+
+@pytest.mark.parametrize("start, end", [
+    ("2024-01-01", "2024-12-31 23:59:59"),
+    ("2024-03-05", "2024-06-30 23:59:59"),
+    ("2023-01-01", "2023-12-31 23:59:59"),
+])
+@pytest.mark.parametrize("indexed", [False, True])
+def test_account_summary_matches_loop(daily, start, end, indexed):
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    extra = (BalanceIndex.build(daily), DailyCube.build(daily)) if indexed else ()
+
+    summary = account_summary(daily, ACCOUNTS, start, end, *extra)
+
+    expected = loop_summary(daily, ACCOUNTS, start, end)
+    pd.testing.assert_frame_equal(summary, expected, check_dtype=False)
@@ -0,0 +1,115 @@
+import openpyxl
+import pandas as pd
+
+from cash_report import coerce_daily, load_workbook_frames, scan_daily, workbook_key
+
+from conftest import DAILY_HEADER, daily_sheet_rows, write_workbook
+
+
+def load(path, previous=None):
+    return load_workbook_frames(workbook_key(str(path)), previous=previous)
+
+
+def test_appended_rows_are_parsed_alone(tmp_path):
+    path = tmp_path / "ACOT_2024.xlsx"
+    write_workbook(path, daily_sheet_rows(30))
+    before = load(path)
+    # 새 행: 이전 행에 없던 계좌·적요, 비어 있는 적요
+    added = daily_sheet_rows(5, start=30)
+    added[0][13], added[1][11] = "391-009", None
+    write_workbook(path, daily_sheet_rows(30) + added)
+
+    after = load(path, previous=before)
+
+    assert after.tail_start == 30 and after.parent_sha256 == before.key.sha256
+    # 바뀌지 않은 시트는 다시 읽지 않는다
+    assert after.cashflow is before.cashflow and after.accounts is before.accounts
+    full = load(path)
+    pd.testing.assert_frame_equal(after.daily, full.daily)
+    assert after.daily_prefix == full.daily_prefix
+
+
+def test_free_column_type_follows_the_whole_sheet(tmp_path):
+    # 숫자만 있던 컬럼에 추가 행이 문자열을 넣으면 전체를 읽은 것과 같게 문자열 컬럼
+    header = ["메모" if name == "작성일자" else name for name in DAILY_HEADER]
+    rows = daily_sheet_rows(10)
+    for i, row in enumerate(rows):
+        row[0] = 100 + i
+    path = tmp_path / "ACOT_2024.xlsx"
+    write_workbook(path, rows, header)
+    before = load(path)
+    added = daily_sheet_rows(2, start=10)
+    added[0][0] = "확인 필요"
+    write_workbook(path, rows + added, header)
+
+    after = load(path, previous=before)
+
+    assert after.tail_start == 10
+    pd.testing.assert_frame_equal(after.daily, load(path).daily)
+    assert after.daily["메모"].iloc[0] == "100"
+
+
+def test_edited_rows_reload_the_whole_sheet(tmp_path):
+    path = tmp_path / "ACOT_2024.xlsx"
+    rows = daily_sheet_rows(30)
+    write_workbook(path, rows)
+    before = load(path)
+    rows[3][9] = 123_456
+    write_workbook(path, rows + daily_sheet_rows(2, start=30))
+
+    after = load(path, previous=before)
+
+    assert after.tail_start is None
+    pd.testing.assert_frame_equal(after.daily, load(path).daily)
+    assert after.daily["집행 금액"].iloc[3] == 123_456
+
+
+def test_unchanged_daily_sheet_adds_nothing(tmp_path):
+    path = tmp_path / "ACOT_2024.xlsx"
+    write_workbook(path, daily_sheet_rows(12))
+    before = load(path)
+    write_workbook(path, daily_sheet_rows(12))
+
+    after = load(path, previous=before)
+
+    assert after.tail_start == 12
+    pd.testing.assert_frame_equal(after.daily, before.daily)
+
+
+def test_streamed_daily_matches_read_excel(tmp_path):
+    # 예전 페이지: pd.read_excel 로 Daily 시트 전체를 읽고 타입 변환 (빈 행은 건너뜀)
+    path = tmp_path / "ACOT_2024.xlsx"
+    rows = daily_sheet_rows(25)
+    rows[4] = [None] * len(DAILY_HEADER)
+    rows[6][11] = 123
+    write_workbook(path, rows)
+    expected = coerce_daily(pd.read_excel(path, sheet_name="Daily")).dropna(how="all").reset_index(drop=True)
+
+    calls = []
+    book = openpyxl.load_workbook(path, read_only=True)
+    scan = scan_daily(book["Daily"], chunk_rows=4, progress=lambda *args: calls.append(args))
+    book.close()
+
+    pd.testing.assert_frame_equal(scan.frame, expected)
+    assert scan.rows == 24
+    assert [done for done, _, _ in calls] == [4, 8, 12, 16, 20, 24, 24]
+
+
+def test_one_pass_load_matches_per_sheet_reads(tmp_path):
+    path = tmp_path / "ACOT_2024.xlsx"
+    write_workbook(path, daily_sheet_rows(10))
+
+    frames = load(path)
+
+    # 예전 페이지: 자금일보 시트의 "계좌별 통합 현황" 아래 표, 월별_CashFlow 시트의 D~I열
+    accounts = pd.read_excel(path, sheet_name="자금일보", header=3, nrows=2)
+    assert frames.accounts["계좌번호"].tolist() == accounts["계좌번호"].tolist()
+    assert frames.accounts["기말잔액"].tolist() == accounts["기말잔액"].tolist()
+    assert (frames.accounts["시작일"] == pd.Timestamp("2024-01-01")).all()
+
+    full = pd.read_excel(path, sheet_name="월별_CashFlow", skiprows=2)
+    assert frames.cashflow["현금 흐름 구분"].tolist() == full.iloc[:, 4].tolist()
+    assert frames.cashflow["Level"].tolist() == full["Level"].tolist()
+    months = full.columns[9:]
+    assert [pd.Timestamp(m) for m in months] == list(frames.cashflow.columns[6:])
+    assert frames.cashflow.iloc[:, 6:].to_numpy().tolist() == full[months].to_numpy().tolist()
@@ -0,0 +1,67 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from cash_report import BudgetCache
+
+
+def test_hits_do_not_rebuild():
+    cache = BudgetCache(len, max_bytes=100)
+    calls = []
+
+    def build():
+        calls.append(1)
+        return "x" * 10
+
+    assert cache.get("a", build) == cache.get("a", build)
+    assert len(calls) == 1 and cache.nbytes == 10
+
+
+def test_least_recently_used_is_evicted_first():
+    cache = BudgetCache(len, max_bytes=30)
+    for key in "abc":
+        cache.get(key, lambda: "x" * 10)
+    cache.get("a", lambda: "rebuilt")  # a 를 최근으로
+
+    cache.get("d", lambda: "y" * 10)
+
+    assert cache.get("a", lambda: "rebuilt") == "x" * 10
+    assert cache.get("b", lambda: "rebuilt") == "rebuilt"
+    assert cache.nbytes <= 30
+
+
+def test_oversized_result_is_returned_but_not_kept():
+    cache = BudgetCache(len, max_bytes=30)
+    cache.get("a", lambda: "x" * 10)
+
+    assert cache.get("big", lambda: "z" * 31) == "z" * 31
+    assert len(cache) == 1 and cache.nbytes == 10
+
+
+def test_random_access_matches_lru_model():
+    rng = np.random.default_rng(3)
+    budget = 200
+    cache = BudgetCache(len, max_bytes=budget)
+    model: OrderedDict[int, int] = OrderedDict()
+    builds = 0
+
+    for key in rng.integers(0, 12, size=500).tolist():
+        size = 10 + key * 7
+
+        def build():
+            nonlocal builds
+            builds += 1
+            return "x" * size
+
+        hit = key in model
+        before = builds
+        cache.get(key, build)
+        assert (builds == before) == hit
+        if hit:
+            model.move_to_end(key)
+        else:
+            model[key] = size
+            while sum(model.values()) > budget:
+                model.popitem(last=False)
+        assert cache.nbytes == sum(model.values())
+        assert len(cache) == len(model)
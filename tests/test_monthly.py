@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cash_report import MonthlyLedger, StatementMatrix, discover_workbooks, load_workbook_frames, workbook_key
+
+DATA_FOLDER = Path(__file__).resolve().parents[1] / "data"
+
+# 월별_CashFlow 시트 행 구성 (Level, 현금 흐름 구분, CODE). 보조금(310101)은 시트에 없음
+LAYOUT = [
+    (1, "기초현금", None),
+    (1, "영업", None),
+    (2, "유입", None),
+    (4, "이자 수입", "410101"),
+    (2, "유출", None),
+    (3, "고정비", None),
+    (4, "급여", "120204"),
+    (4, "급여(중복)", "120204"),
+    (1, "현금의증감", None),
+    (1, "기말현금", None),
+]
+
+
+def layout_matrix(months: pd.PeriodIndex) -> StatementMatrix:
+    rows = pd.DataFrame(LAYOUT, columns=["Level", "현금 흐름 구분", "CODE"])
+    cashflow = pd.DataFrame({
+        "Level": rows["Level"].astype(float),
+        "현금 흐름 구분": rows["현금 흐름 구분"],
+        "유입/유출": None,
+        "구분1": None,
+        "구분2": None,
+        "CODE": rows["CODE"],
+    })
+    for month in months:
+        cashflow[month.to_timestamp()] = 0.0
+    return StatementMatrix.build(cashflow)
+
+
+def sheet_formulas(daily: pd.DataFrame, months: pd.PeriodIndex) -> dict[str, list[float]]:
+    """시트 수식처럼 월마다 원장을 다시 훑어 계산한 행 값."""
+    month_of = daily["지출일"].dt.to_period("M")
+    # 이월잔액 행: 입금·출금이 모두 비어 있음
+    carried = daily["입금"].fillna(0).eq(0) & daily["출금"].fillna(0).eq(0)
+    amounts = daily["집행 금액"].astype(float)
+    codes = daily["CODE"].astype(float)
+    values = {name: [] for name in ["기초현금", "이자 수입", "급여", "현금의증감", "기말현금"]}
+    for month in months:
+        in_month = month_of == month
+        values["기초현금"].append(amounts[(month_of < month) | (in_month & carried)].sum())
+        values["이자 수입"].append(amounts[in_month & ~carried & (codes == 410101)].sum())
+        values["급여"].append(amounts[in_month & ~carried & (codes == 120204)].sum())
+        values["현금의증감"].append(amounts[in_month & ~carried].sum())
+        values["기말현금"].append(amounts[month_of <= month].sum())
+    return values
+
+
+def test_statement_matches_sheet_formulas(daily):
+    ledger = MonthlyLedger.build(daily)
+    months = ledger.months
+
+    statement = ledger.statement(layout_matrix(months))
+
+    expected = sheet_formulas(daily, months)
+    assert statement.months.equals(pd.period_range("2024-01", "2024-10", freq="M"))
+    for label in ["기초현금", "이자 수입", "급여", "현금의증감", "기말현금"]:
+        np.testing.assert_allclose(statement.row(label), expected[label], err_msg=label)
+    # 같은 CODE 의 두 번째 말단 행은 비우고, 상위 행은 하위 트리 합계
+    np.testing.assert_array_equal(statement.row("급여(중복)"), 0.0)
+    np.testing.assert_allclose(statement.row("유입"), expected["이자 수입"])
+    np.testing.assert_allclose(statement.row("영업"), np.add(expected["이자 수입"], expected["급여"]))
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_statement_matches_bundled_cashflow_sheet():
+    paths = discover_workbooks(str(DATA_FOLDER)) if DATA_FOLDER.is_dir() else []
+    if not paths:
+        pytest.skip("data 폴더에 워크북이 없음")
+    frames = load_workbook_frames(workbook_key(paths[0]))
+    sheet = StatementMatrix.build(frames.cashflow)
+
+    statement = MonthlyLedger.build(frames.daily).statement(sheet)
+
+    months = statement.months.intersection(sheet.months)
+    assert len(months) > 0
+    np.testing.assert_allclose(statement.values[months], sheet.values[months].fillna(0.0))
@@ -0,0 +1,41 @@
+from dataclasses import replace
+
+from cash_report import consolidate, reconcile, reconcile_dates
+
+from conftest import make_workbook, yearly_rows
+
+
+def two_years():
+    first = make_workbook("/data/ACOT_2024.xlsm", yearly_rows(2024, 1_000_000))
+    closing = float(first.daily["집행 금액"].sum())
+    second = make_workbook("/data/ACOT_2025.xlsm", yearly_rows(2025, closing))
+    return first, second
+
+
+def test_yearly_workbooks_reconcile_without_false_mismatches():
+    workbooks = two_years()
+    consolidated = consolidate(list(workbooks))
+
+    result = reconcile(consolidated.daily, None, list(workbooks))
+
+    assert result.dates.empty
+    assert result.matched
+
+
+def test_consolidated_ledger_drops_later_carry_forward():
+    # 통합 원장만으로 누적합을 구하면 뒤 연도 파일이 모두 어긋난다 (워크북별 대사가 필요한 이유)
+    consolidated = consolidate(list(two_years()))
+    assert not reconcile_dates(consolidated.daily).empty
+
+
+def test_edited_balance_is_reported_once():
+    first, second = two_years()
+    daily = second.daily.copy()
+    daily.loc[10, "잔액"] += 500
+    second = replace(second, daily=daily)
+
+    result = reconcile(consolidate([first, second]).daily, None, [first, second])
+
+    assert list(result.dates["원본파일"]) == ["ACOT_2025.xlsm"]
+    assert result.dates["지출일"].iloc[0] == daily.loc[10, "지출일"].normalize()
+    assert result.dates["차이"].iloc[0] == 500
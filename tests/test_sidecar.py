@@ -0,0 +1,72 @@
+from dataclasses import replace
+
+import pandas as pd
+
+from cash_report import DailyPrefix, WorkbookKey, is_fresh, read_sidecar, sidecar
+from cash_report.loader import CASHFLOW_BASE_COLUMNS
+
+from conftest import make_workbook, yearly_rows
+
+PREFIX = DailyPrefix(extent=100, digest="d1", strings=3, styles=5, shared_digest="s1")
+
+
+def cached_workbook(tmp_path):
+    path = str(tmp_path / "ACOT_2024.xlsm")
+    frames = make_workbook(path, yearly_rows(2024, 1_000_000))
+    cashflow = pd.DataFrame({name: ["기초현금"] for name in CASHFLOW_BASE_COLUMNS})
+    cashflow[pd.Timestamp("2024-01-01")] = [1_000_000.0]
+    frames = replace(frames, key=WorkbookKey(path, 1, "a" * 64), cashflow=cashflow, daily_prefix=PREFIX)
+    sidecar.write_sidecar(frames)
+    return frames
+
+
+def loader_calls(monkeypatch, frames):
+    # 워크북을 다시 읽는 경우 받은 previous 를 기록
+    calls = []
+
+    def load(key, progress=None, previous=None):
+        calls.append(previous)
+        return replace(frames, key=key)
+
+    monkeypatch.setattr(sidecar, "load_workbook_frames", load)
+    return calls
+
+
+def test_cache_is_used_while_workbook_is_unchanged(tmp_path, monkeypatch):
+    frames = cached_workbook(tmp_path)
+    calls = loader_calls(monkeypatch, frames)
+
+    assert is_fresh(frames.key)
+    cached = sidecar.load_cached_workbook(frames.key)
+
+    assert calls == []
+    pd.testing.assert_frame_equal(cached.daily, frames.daily)
+    assert cached.daily_prefix == PREFIX
+
+
+def test_changed_source_digest_rereads_workbook(tmp_path, monkeypatch):
+    frames = cached_workbook(tmp_path)
+    calls = loader_calls(monkeypatch, frames)
+    changed = WorkbookKey(frames.key.path, 2, "b" * 64)
+
+    assert not is_fresh(changed)
+    assert read_sidecar(changed) is None
+    sidecar.load_cached_workbook(changed)
+
+    # 이전 버전 캐시를 넘겨 추가분만 읽게 하고, 새 버전으로 캐시를 갱신한다
+    assert len(calls) == 1 and calls[0].key.sha256 == frames.key.sha256
+    assert is_fresh(changed) and not is_fresh(frames.key)
+
+
+def test_schema_version_change_invalidates_cache(tmp_path, monkeypatch):
+    frames = cached_workbook(tmp_path)
+    calls = loader_calls(monkeypatch, frames)
+    monkeypatch.setattr(sidecar, "SCHEMA_VERSION", sidecar.SCHEMA_VERSION + 1)
+
+    assert not is_fresh(frames.key)
+    assert read_sidecar(frames.key, allow_stale=True) is None
+    sidecar.load_cached_workbook(frames.key)
+
+    # 형식이 다른 캐시는 이전 버전으로도 쓰지 않는다
+    assert calls == [None]
+    assert is_fresh(frames.key)
@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cash_report import StatementMatrix, StatementTree, cost_breakdown, month_range
+
+# (Level, 현금 흐름 구분, 유입/유출, 구분1, 구분2)
+SHEET_ROWS = [
+    (1, "기초현금", None, None, None),
+    (1, "영업", None, None, None),
+    (2, "유입", "유입", None, None),
+    (4, "매출", "유입", None, "매출"),
+    (2, "유출", "유출", None, None),
+    (3, "변동비", "유출", "변동비", None),
+    (4, "외주비", "유출", None, "외주비"),
+    (4, "재료비", "유출", None, "재료비"),
+    (3, "고정비", "유출", "고정비", None),
+    (4, "급여", "유출", None, "급여"),
+    (5, "상여", "유출", None, "상여"),
+    (4, "임차료", "유출", None, "임차료"),
+    (4, "보험료", "유출", None, "보험료"),
+    (1, "투자", None, None, None),
+    (1, "기말현금", None, None, None),
+]
+MONTHS = pd.date_range("2024-01-01", periods=6, freq="MS")
+
+
+@pytest.fixture
+def cashflow():
+    rng = np.random.default_rng(7)
+    rows = pd.DataFrame(SHEET_ROWS, columns=["Level", "현금 흐름 구분", "유입/유출", "구분1", "구분2"])
+    rows["Level"] = rows["Level"].astype(float)
+    rows["CODE"] = [f"{i:06d}" for i in range(len(rows))]
+    amounts = rng.integers(-50, 50, size=(len(rows), len(MONTHS))) * 1000.0
+    amounts[7] = 0.0  # 재료비: 전 기간 0
+    amounts[12, 2:] = 0.0  # 보험료: 1~2월만
+    return pd.concat([rows, pd.DataFrame(amounts, columns=MONTHS)], axis=1)
+
+
+def labels(months):
+    return [f"{m.year}년 {m.month:02d}월" for m in months]
+
+
+def sheet_statement(cashflow, months, hide_zero):
+    """예전 페이지의 현금흐름표 (합계는 숫자로 둠)."""
+    selected = labels(months)
+    df = cashflow.iloc[:, :6].copy()
+    columns = dict(zip(labels(MONTHS), MONTHS))
+    for label in selected:
+        df[label] = cashflow[columns[label]] if label in columns else np.nan
+    text = ["현금 흐름 구분", "유입/유출", "구분1", "구분2"]
+    df[text] = df[text].fillna("")
+    if hide_zero:
+        df = df[df["Level"].isin([1, 2]) | (df[selected].astype(float).sum(axis=1) != 0)]
+    df["합계"] = df[selected].astype(float).sum(axis=1)
+    df.loc[df["현금 흐름 구분"].isin(["기초현금", "기말현금"]), "합계"] = np.nan
+    return df
+
+
+def sheet_costs(df, selected):
+    """예전 페이지의 변동비·고정비 하위 항목."""
+    variable_idx = df[df["구분1"] == "변동비"].index[0]
+    fixed_idx = df[df["구분1"] == "고정비"].index[0]
+    variable = df[(df.index > variable_idx) & (df.index < fixed_idx) & df["구분2"].notna()]
+    variable = variable[variable[selected].astype(float).abs().sum(axis=1) > 0]
+    fixed = df[(df.index > fixed_idx) & (df["Level"] == 4)]
+    if not fixed.empty:
+        end_idx = fixed.index[-1]
+        for idx in fixed.index:
+            if df.loc[idx:, "Level"].isin([1, 3]).any():
+                end_idx = df.loc[idx:, "Level"].isin([1, 3]).idxmax()
+                break
+        fixed = fixed.loc[:end_idx - 1]
+    fixed = fixed[fixed[selected].astype(float).abs().sum(axis=1) > 0]
+    return variable, fixed
+
+
+@pytest.mark.parametrize("start, end", [((2024, 1), (2024, 6)), ((2024, 3), (2024, 4)), ((2024, 5), (2024, 8))])
+@pytest.mark.parametrize("hide_zero", [False, True])
+def test_select_matches_sheet_statement(cashflow, start, end, hide_zero):
+    months = month_range(*start, *end)
+
+    frame = StatementMatrix.build(cashflow).select(months, hide_zero).to_frame()
+
+    # 시트에 없는 월(2024년 07·08월)은 빈 열
+    expected = sheet_statement(cashflow, months, hide_zero)
+    pd.testing.assert_frame_equal(frame, expected, check_dtype=False, check_column_type=False)
+
+
+@pytest.mark.parametrize("start, end", [((2024, 1), (2024, 6)), ((2024, 3), (2024, 6))])
+def test_cost_breakdown_matches_sheet_rows(cashflow, start, end):
+    months = month_range(*start, *end)
+    statement = StatementMatrix.build(cashflow).select(months)
+
+    costs = cost_breakdown(statement)
+
+    df = sheet_statement(cashflow, months, hide_zero=False)
+    variable, fixed = sheet_costs(df, labels(months))
+    assert list(costs.variable.rows.index) == list(variable.index)
+    assert list(costs.fixed.rows.index) == list(fixed.index)
+    np.testing.assert_array_equal(costs.variable_total, variable[labels(months)].abs().sum())
+    np.testing.assert_array_equal(costs.fixed_total, fixed[labels(months)].abs().sum())
+
+
+def test_cost_breakdown_needs_both_groups(cashflow):
+    statement = StatementMatrix.build(cashflow[cashflow["구분1"] != "고정비"])
+
+    assert cost_breakdown(statement) is None
+
+
+def test_tree_matches_level_scan(cashflow):
+    levels = cashflow["Level"]
+    tree = StatementTree.build(levels)
+
+    for position, level in enumerate(levels):
+        # 다음에 같거나 높은(숫자가 작거나 같은) Level 이 나오기 전까지가 하위 트리
+        end = next((i for i in range(position + 1, len(levels)) if levels[i] <= level), len(levels))
+        assert list(tree.descendants(position)) == list(range(position + 1, end))
+        # 부모는 바로 앞의 더 높은 Level 행
+        parent = next((i for i in range(position - 1, -1, -1) if levels[i] < level), -1)
+        assert tree.parents[position] == parent
+        children = [i for i in range(position + 1, end) if levels[i] == min(levels[position + 1:end])]
+        assert list(tree.children(position)) == children
+
+    values = cashflow[MONTHS].to_numpy()
+    rolled = tree.rollup(values)
+    for position in range(len(levels)):
+        below = tree.descendants(position)
+        leaves = [i for i in below if tree.leaves[i]] or [position]
+        np.testing.assert_allclose(rolled[position], values[leaves].sum(axis=0))